@@ -0,0 +1,52 @@
+"""
+Performance benchmarks for the ASA tooling
+
+The micro-benchmarks share their plumbing here: each module builds a
+workload, times it in run() with best_of() and describes its command line
+and printed report to bench_main().
+"""
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# (flag, type, default) or (flag, type, default, help) of a command-line
+# option; run() receives the options positionally, in this order
+Option = Tuple[Any, ...]
+
+
+def best_of(func: Callable[[], T], repeat: int = 1) -> Tuple[T, float]:
+    """Call func() repeat times; return its last result and the fastest wall time in seconds."""
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def speedup(baseline_s: float, optimized_s: float) -> float:
+    return baseline_s / optimized_s if optimized_s else float("inf")
+
+
+def bench_main(
+    doc: Optional[str],
+    run: Callable[..., Dict[str, Any]],
+    options: Sequence[Option],
+    report: Callable[[Dict[str, Any]], List[str]],
+) -> Callable[..., None]:
+    """
+    A main(argv) for a micro-benchmark module: parses options (the first
+    line of doc is the description), calls run() with them and prints the
+    lines of report(result).
+    """
+    def main(argv: Optional[List[str]] = None) -> None:
+        parser = argparse.ArgumentParser(description=(doc or "").strip().splitlines()[0])
+        for flag, kind, default, *help_text in options:
+            parser.add_argument(flag, type=kind, default=default, help=help_text[0] if help_text else None)
+        result = run(*vars(parser.parse_args(argv)).values())
+        for line in report(result):
+            print(line)
+
+    return main
@@ -0,0 +1,94 @@
+"""
+Micro-benchmark: batch validation of slice contracts with the compiled schema.
+
+Generates N contracts (a share of them with errors at various depths) and
+validates them in one batch, as lint-all does across a monorepo.
+
+Usage:
+    python -m benchmarks.bench_contract_schema
+    python -m benchmarks.bench_contract_schema --contracts 10000 --invalid 0.2
+"""
+import copy
+import random
+from typing import Dict, List
+
+from orchestrator.asa_lints.contract_schema import CONTRACT_SCHEMA, compile_schema
+
+from . import bench_main, best_of
+
+# Mistakes injected into invalid contracts
+MUTATIONS = [
+    lambda c: c.pop("domain"),
+    lambda c: c.update(version=1),
+    lambda c: c["allowed_imports"].append(42),
+    lambda c: c["public_api"]["exports"].append(None),
+    lambda c: c.update(dependencies=[]),
+    lambda c: c.update(loc_limits={"per_file": 0}),
+]
+
+
+def make_contract(domain: str, slice_name: str, rng: random.Random) -> Dict:
+    """A valid contract shaped like the generator's output."""
+    return {
+        "slice_name": f"{domain}/{slice_name}",
+        "version": "1.0.0",
+        "domain": domain,
+        "allowed_imports": [f"domains.{domain}.slices.{slice_name}.*", "shared.*"] + [
+            f"shared.m{rng.randrange(100)}.*" for _ in range(rng.randrange(4))
+        ],
+        "public_api": {
+            "endpoint": f"POST /api/v1/{domain}/{slice_name}",
+            "handler": "Handler",
+            "schemas": ["Request", "Response"],
+            "exports": [f"domains.{domain}.slices.{slice_name}.handler.router"],
+        },
+        "dependencies": {"shared": ["utils.jwt_service"], "external": ["fastapi", "pydantic"]},
+    }
+
+
+def make_workload(n_contracts: int, invalid: float, seed: int = 0) -> List[Dict]:
+    rng = random.Random(seed)
+    contracts = []
+    for index in range(n_contracts):
+        contract = make_contract(f"d{index % 50}", f"s{index}", rng)
+        if rng.random() < invalid:
+            contract = copy.deepcopy(contract)
+            rng.choice(MUTATIONS)(contract)
+        contracts.append(contract)
+    return contracts
+
+
+def run(n_contracts: int = 10000, invalid: float = 0.1, seed: int = 0) -> Dict[str, float]:
+    """Time schema compilation and one batch validation of all contracts."""
+    contracts = make_workload(n_contracts, invalid, seed)
+
+    validator, compile_s = best_of(lambda: compile_schema(CONTRACT_SCHEMA))
+    results, validate_s = best_of(lambda: validator.validate_many(contracts))
+
+    return {
+        "contracts": n_contracts,
+        "invalid": sum(1 for errors in results if errors),
+        "compile_s": compile_s,
+        "validate_s": validate_s,
+        "per_contract_us": validate_s / n_contracts * 1e6 if n_contracts else 0.0,
+    }
+
+
+def report(result: Dict) -> List[str]:
+    return [
+        f"{result['contracts']} contracts ({result['invalid']} invalid)",
+        f"  compile schema: {result['compile_s'] * 1000:8.2f} ms",
+        f"  validate batch: {result['validate_s'] * 1000:8.1f} ms",
+        f"  per contract:   {result['per_contract_us']:8.1f} us",
+    ]
+
+
+main = bench_main(
+    __doc__, run,
+    [("--contracts", int, 10000), ("--invalid", float, 0.1, "share of invalid contracts")],
+    report,
+)
+
+
+if __name__ == "__main__":
+    main()
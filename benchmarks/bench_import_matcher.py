@@ -0,0 +1,95 @@
+"""
+Micro-benchmark: compiled allowed_imports matcher vs per-pattern fnmatch loop.
+
+Usage:
+    python -m benchmarks.bench_import_matcher
+    python -m benchmarks.bench_import_matcher --imports 10000 --patterns 200
+"""
+import fnmatch
+import random
+from typing import Dict, List, Tuple
+
+from orchestrator.asa_lints.lint_contract_imports import ImportMatcher
+
+from . import bench_main, best_of, speedup
+
+
+def naive_is_allowed(import_name: str, allowed_patterns: List[str]) -> bool:
+    """The original O(imports x patterns) implementation, kept as reference."""
+    for pattern in allowed_patterns:
+        if fnmatch.fnmatch(import_name, pattern):
+            return True
+        if import_name.startswith(pattern.replace(".*", "")):
+            return True
+    return False
+
+
+def make_workload(n_imports: int, n_patterns: int, seed: int = 0) -> Tuple[List[str], List[str]]:
+    """Realistic-looking allowed_imports patterns and internal import names."""
+    rng = random.Random(seed)
+    domains = [f"d{i}" for i in range(max(1, n_patterns // 10))]
+
+    patterns = []
+    while len(patterns) < n_patterns:
+        kind = rng.random()
+        domain = rng.choice(domains)
+        if kind < 0.6:
+            patterns.append(f"domains.{domain}.slices.s{rng.randrange(50)}.*")
+        elif kind < 0.8:
+            patterns.append(f"shared.m{rng.randrange(100)}.*")
+        elif kind < 0.95:
+            patterns.append(f"domains.*.slices.s{rng.randrange(50)}.schemas")
+        else:
+            patterns.append(f"shared.util?{rng.randrange(10)}")
+
+    imports = []
+    for _ in range(n_imports):
+        domain = rng.choice(domains)
+        if rng.random() < 0.7:
+            imports.append(
+                f"domains.{domain}.slices.s{rng.randrange(60)}."
+                f"{rng.choice(['handler', 'service', 'schemas', 'repository'])}"
+            )
+        else:
+            imports.append(f"shared.m{rng.randrange(120)}.f{rng.randrange(1000)}")
+    return imports, patterns
+
+
+def run(n_imports: int = 10000, n_patterns: int = 200, seed: int = 0) -> Dict[str, float]:
+    """Time both matchers on the same workload and check they agree."""
+    imports, patterns = make_workload(n_imports, n_patterns, seed)
+
+    def compiled() -> List[bool]:
+        matcher = ImportMatcher(patterns)
+        return [matcher(name) for name in imports]
+
+    expected, naive_s = best_of(lambda: [naive_is_allowed(name, patterns) for name in imports])
+    actual, compiled_s = best_of(compiled)
+
+    if actual != expected:
+        raise AssertionError("compiled matcher disagrees with the reference loop")
+
+    return {
+        "imports": n_imports,
+        "patterns": n_patterns,
+        "allowed": sum(expected),
+        "naive_s": naive_s,
+        "compiled_s": compiled_s,
+        "speedup": speedup(naive_s, compiled_s),
+    }
+
+
+def report(result: Dict) -> List[str]:
+    return [
+        f"{result['imports']} imports x {result['patterns']} patterns ({result['allowed']} allowed)",
+        f"  per-pattern loop: {result['naive_s'] * 1000:8.1f} ms",
+        f"  compiled matcher: {result['compiled_s'] * 1000:8.1f} ms",
+        f"  speedup:          {result['speedup']:8.1f}x",
+    ]
+
+
+main = bench_main(__doc__, run, [("--imports", int, 10000), ("--patterns", int, 200)], report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Micro-benchmark: per-request template rendering of the MCP generators.
+
+Compares the shared pre-compiled Jinja environment with the previous
+strategy, which re-read every template file and compiled it in a fresh
+Environment on each call. One request renders all generator templates
+(spec, contract and skeleton files), without writing files.
+
+Usage:
+    python -m benchmarks.bench_mcp_templates
+    python -m benchmarks.bench_mcp_templates --requests 500
+"""
+from typing import Callable, Dict, List
+
+from jinja2 import Environment
+
+from mcp_server import jinja_env
+from mcp_server.handlers.generate_skeleton import FILES_TO_GENERATE
+
+from . import bench_main, best_of, speedup
+
+TEMPLATES = ["slice.spec.md.j2", "slice.contract.json.j2"] + [name for name, _ in FILES_TO_GENERATE]
+
+
+def _context(index: int) -> Dict[str, str]:
+    return {
+        "domain": "bench",
+        "slice_name": f"slice_{index}",
+        "full_slice_name": f"bench/slice_{index}",
+        "goal": "Benchmark feature",
+        "func_spec": "Benchmark feature",
+    }
+
+
+def render_per_call(name: str, **context) -> str:
+    """The previous strategy: read the file and compile it on every call."""
+    with open(jinja_env.TEMPLATES_DIR / name, "r") as f:
+        template_str = f.read()
+    env = Environment()
+    env.filters['to_camel_case'] = jinja_env.to_camel_case
+    return env.from_string(template_str).render(**context)
+
+
+def _serve(render: Callable[..., str], requests: int) -> None:
+    for index in range(requests):
+        context = _context(index)
+        for name in TEMPLATES:
+            render(name, **context)
+
+
+def run(requests: int = 200) -> Dict[str, float]:
+    """Mean per-request latency of both strategies (shared env precompiled first)."""
+    _, precompile_s = best_of(jinja_env.precompile)
+
+    if [render_per_call(name, **_context(0)) for name in TEMPLATES] != [
+        jinja_env.render(name, **_context(0)) for name in TEMPLATES
+    ]:
+        raise AssertionError("shared environment renders differently")
+
+    _, per_call_s = best_of(lambda: _serve(render_per_call, requests))
+    _, shared_s = best_of(lambda: _serve(jinja_env.render, requests))
+    return {
+        "requests": requests,
+        "templates": len(TEMPLATES),
+        "precompile_s": precompile_s,
+        "per_call_ms": per_call_s / requests * 1000,
+        "shared_ms": shared_s / requests * 1000,
+        "speedup": speedup(per_call_s, shared_s),
+    }
+
+
+def report(result: Dict) -> List[str]:
+    return [
+        f"{result['requests']} requests x {result['templates']} templates",
+        f"  precompile at startup:     {result['precompile_s'] * 1000:8.2f} ms",
+        f"  compile per call:          {result['per_call_ms']:8.3f} ms/request",
+        f"  shared environment:        {result['shared_ms']:8.3f} ms/request",
+        f"  speedup:                   {result['speedup']:8.1f}x",
+    ]
+
+
+main = bench_main(__doc__, run, [("--requests", int, 200)], report)
+
+
+if __name__ == "__main__":
+    main()
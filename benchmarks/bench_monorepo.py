@@ -0,0 +1,260 @@
+"""
+Benchmark: orchestrator linters on a synthetic monorepo.
+
+Generates a project of N domains x M slices with the MCP server's slice
+generator, adds shared modules and import fan-out, then times the asa CLI
+(each command in a fresh process, as in CI) and records its peak memory.
+Results can be saved as a JSON baseline and later compared against it.
+
+Usage:
+    python -m benchmarks.bench_monorepo --domains 10 --slices 20
+    python -m benchmarks.bench_monorepo --save-baseline benchmarks/baseline.json
+    python -m benchmarks.bench_monorepo --baseline benchmarks/baseline.json --threshold 0.25
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from mcp_server.handlers import generate_skeleton
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Metrics compared against a baseline (lower is better)
+COMPARED_METRICS = ("wall_s", "peak_rss_kb")
+
+
+def _shared_module(index: int, fanout: int, rng: random.Random) -> str:
+    """A shared helper module importing a few lower-numbered shared modules."""
+    lines = [f'"""Synthetic shared module {index}"""']
+    for dependency in sorted(rng.sample(range(index), min(index, fanout // 2))):
+        lines.append(f"from shared.bench.m{dependency} import helper_{dependency}")
+    lines.append("")
+    lines.append("")
+    lines.append(f"def helper_{index}(value):")
+    lines.append(f'    """Helper {index}."""')
+    lines.append(f"    return value + {index}")
+    return "\n".join(lines) + "\n"
+
+
+def _service_padding(slice_name: str, shared_imports: List[int], functions: int) -> str:
+    """Extra imports and functions appended to a generated service.py."""
+    lines = [""]
+    lines.extend(f"from shared.bench.m{index} import helper_{index}" for index in shared_imports)
+    for number in range(functions):
+        lines.extend([
+            "",
+            "",
+            f"def _{slice_name}_step_{number}(data: dict) -> dict:",
+            f'    """Processing step {number}."""',
+            "    result = dict(data)",
+            f'    result["step"] = {number}',
+            "    return result",
+        ])
+    return "\n".join(lines) + "\n"
+
+
+def generate_project(
+    root: Path,
+    domains: int,
+    slices: int,
+    shared_modules: int = 50,
+    fanout: int = 4,
+    functions: int = 10,
+    seed: int = 0
+) -> int:
+    """
+    Generate a synthetic project under root; returns the number of slices.
+
+    Every slice service imports `fanout` shared modules, and shared modules
+    import each other, so the transitive import checks have real work.
+    """
+    rng = random.Random(seed)
+
+    bench_dir = root / "shared" / "bench"
+    bench_dir.mkdir(parents=True)
+    (root / "shared" / "__init__.py").write_text('"""Shared"""\n')
+    (bench_dir / "__init__.py").write_text('"""Synthetic shared modules"""\n')
+    for index in range(shared_modules):
+        (bench_dir / f"m{index}.py").write_text(_shared_module(index, fanout, rng))
+
+    for domain_index in range(domains):
+        domain = f"domain_{domain_index}"
+        for slice_index in range(slices):
+            slice_name = f"slice_{slice_index}"
+            slice_path = root / "domains" / domain / "slices" / slice_name
+            generate_skeleton.generate(
+                f"Synthetic slice {slice_index} of {domain}", domain, slice_name, slice_path
+            )
+            imports = sorted(rng.sample(range(shared_modules), min(fanout, shared_modules)))
+            with open(slice_path / "service.py", "a") as f:
+                f.write(_service_padding(slice_name, imports, functions))
+
+    return domains * slices
+
+
+def run_command(args: List[str], cwd: Path) -> Tuple[float, int, int]:
+    """
+    Run `asa <args>` in a fresh interpreter.
+
+    Returns (wall seconds, peak RSS in KiB, exit code) of that process
+    alone, measured with wait4 rather than the cumulative child rusage.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "orchestrator.cli", *args],
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    _, status, usage = os.wait4(process.pid, 0)
+    wall_s = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return wall_s, usage.ru_maxrss, process.returncode
+
+
+def scenarios(sample_slice: str) -> Dict[str, List[str]]:
+    """CLI invocations measured by the benchmark."""
+    return {
+        "list_slices": ["list-slices"],
+        "lint_one": ["lint", sample_slice, "--no-cache"],
+        "lint_all_cold": ["lint-all", "--no-cache"],
+        "lint_all_warm": ["lint-all"],
+        "lint_all_parallel": ["lint-all", "--no-cache", "--jobs", "0"],
+    }
+
+
+def run(
+    domains: int = 5,
+    slices: int = 10,
+    shared_modules: int = 50,
+    fanout: int = 4,
+    repeat: int = 3,
+    seed: int = 0,
+    workdir: Optional[Path] = None
+) -> Dict:
+    """Generate a project and measure every scenario `repeat` times (best run kept)."""
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        root = Path(tmp)
+        start = time.perf_counter()
+        slice_count = generate_project(root, domains, slices, shared_modules, fanout, seed=seed)
+        generate_s = time.perf_counter() - start
+
+        results = {}
+        for name, args in scenarios("domains/domain_0/slices/slice_0").items():
+            if name == "lint_all_warm":
+                # Prime the lint cache so every slice is a hit
+                run_command(["lint-all"], root)
+            runs = [run_command(args, root) for _ in range(repeat)]
+            walls = [wall for wall, _, _ in runs]
+            results[name] = {
+                "wall_s": round(min(walls), 4),
+                "wall_median_s": round(statistics.median(walls), 4),
+                "peak_rss_kb": max(rss for _, rss, _ in runs),
+                "exit_code": runs[-1][2],
+                "slices_per_s": round(slice_count / min(walls), 1) if name != "lint_one" else None,
+            }
+
+    return {
+        "config": {
+            "domains": domains,
+            "slices_per_domain": slices,
+            "shared_modules": shared_modules,
+            "fanout": fanout,
+            "seed": seed,
+        },
+        "slices": slice_count,
+        "generate_s": round(generate_s, 3),
+        "python": f"{sys.version_info[0]}.{sys.version_info[1]}",
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float = 0.2) -> List[str]:
+    """
+    Regressions of current against baseline: any compared metric more than
+    `threshold` (a fraction) above its baseline value.
+    """
+    regressions = []
+    if current["config"] != baseline.get("config"):
+        regressions.append(
+            f"config differs from baseline ({baseline.get('config')}); "
+            f"re-run with the same sizes or save a new baseline"
+        )
+        return regressions
+
+    for scenario, metrics in baseline["results"].items():
+        measured = current["results"].get(scenario)
+        if measured is None:
+            continue
+        for metric in COMPARED_METRICS:
+            before, after = metrics.get(metric), measured.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            if change > threshold:
+                regressions.append(
+                    f"{scenario}.{metric}: {before} -> {after} (+{change:.0%}, limit +{threshold:.0%})"
+                )
+    return regressions
+
+
+def format_report(result: Dict) -> str:
+    lines = [
+        f"{result['slices']} slices ({result['config']['domains']} domains), "
+        f"generated in {result['generate_s']:.2f} s",
+        f"  {'scenario':<20}{'wall ms':>10}{'median ms':>12}{'peak RSS MiB':>14}{'slices/s':>10}",
+    ]
+    for name, metrics in result["results"].items():
+        throughput = metrics["slices_per_s"]
+        lines.append(
+            f"  {name:<20}{metrics['wall_s'] * 1000:>10.1f}{metrics['wall_median_s'] * 1000:>12.1f}"
+            f"{metrics['peak_rss_kb'] / 1024:>14.1f}"
+            f"{throughput if throughput is not None else '-':>10}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--domains", type=int, default=5)
+    parser.add_argument("--slices", type=int, default=10, help="slices per domain")
+    parser.add_argument("--shared-modules", type=int, default=50)
+    parser.add_argument("--fanout", type=int, default=4, help="shared imports per slice")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", type=Path, help="compare against this baseline JSON")
+    parser.add_argument("--save-baseline", type=Path, help="write the results as a baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed slowdown as a fraction (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    result = run(args.domains, args.slices, args.shared_modules, args.fanout, args.repeat)
+    print(format_report(result))
+
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(result, indent=2) + "\n")
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        regressions = compare(result, json.loads(args.baseline.read_text()), args.threshold)
+        if regressions:
+            print("Regressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Micro-benchmark: single-traversal rule engine vs one traversal per rule.
+
+Generates a large module (classes with sync and async methods, a few rule
+violations), parses it once and runs every built-in AST rule both ways.
+
+Usage:
+    python -m benchmarks.bench_rule_engine
+    python -m benchmarks.bench_rule_engine --functions 5000 --repeat 5
+"""
+import ast
+from typing import Dict, List
+
+from orchestrator.asa_lints.rule_engine import (
+    FunctionLocRule, NamingRule, Rule, RuleEngine, default_rules
+)
+
+from . import bench_main, best_of, speedup
+
+
+def make_module(functions: int) -> str:
+    """Source of a module with `functions` methods spread over classes."""
+    lines = ['"""Synthetic service module"""', "import time", "from .schemas import Item", ""]
+    per_class = 20
+    for index in range(functions):
+        if index % per_class == 0:
+            name = f"Service{index // per_class}" if index % 200 else f"service_{index // per_class}"
+            lines += ["", f"class {name}:", f'    """Service {index // per_class}."""', ""]
+        keyword = "async def" if index % 2 else "def"
+        method = f"handle_{index}" if index % 150 else f"handleItem{index}"
+        lines += [
+            f"    {keyword} {method}(self, item: Item) -> dict:",
+            f'        """Step {index}."""',
+            "        result = {'id': item.id, 'step': %d}" % index,
+            "        for key, value in item.data.items():",
+            "            if value is not None and key.startswith('x'):",
+            "                result[key] = [value * 2 for _ in range(3)]",
+        ]
+        if index % 97 == 1:
+            lines.append("        time.sleep(0.1)")
+        lines += ["        return result", ""]
+    return "\n".join(lines) + "\n"
+
+
+def builtin_rules() -> List[Rule]:
+    """The default rules plus the style rules no built-in check runs."""
+    return [*default_rules(), FunctionLocRule(), NamingRule()]
+
+
+def _run(tree: ast.AST, source: str, engines: List[RuleEngine]) -> List[str]:
+    findings = []
+    for engine in engines:
+        findings.extend(str(f) for f in engine.run(tree, "service.py", "pkg", source).findings)
+    return sorted(findings)
+
+
+def run(functions: int = 2000, repeat: int = 3) -> Dict[str, float]:
+    """Best-of-repeat time of both strategies on the same parsed module."""
+    source = make_module(functions)
+    tree = ast.parse(source)
+
+    single = [RuleEngine(builtin_rules())]
+    per_rule = [RuleEngine([rule]) for rule in builtin_rules()]
+
+    expected = _run(tree, source, per_rule)
+    if _run(tree, source, single) != expected:
+        raise AssertionError("single traversal disagrees with per-rule traversals")
+
+    _, per_rule_s = best_of(lambda: _run(tree, source, per_rule), repeat)
+    _, single_s = best_of(lambda: _run(tree, source, single), repeat)
+
+    return {
+        "functions": functions,
+        "lines": source.count("\n"),
+        "rules": len(per_rule),
+        "findings": len(expected),
+        "per_rule_s": per_rule_s,
+        "single_s": single_s,
+        "speedup": speedup(per_rule_s, single_s),
+    }
+
+
+def report(result: Dict) -> List[str]:
+    return [
+        f"{result['lines']} lines, {result['functions']} functions, "
+        f"{result['rules']} rules ({result['findings']} findings)",
+        f"  one traversal per rule: {result['per_rule_s'] * 1000:8.1f} ms",
+        f"  single traversal:       {result['single_s'] * 1000:8.1f} ms",
+        f"  speedup:                {result['speedup']:8.1f}x",
+    ]
+
+
+main = bench_main(__doc__, run, [("--functions", int, 2000), ("--repeat", int, 3)], report)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,9 @@ It includes the demo slice and provides health check endpoints.
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+import os
 import sys
+import threading
 from pathlib import Path
 
 # Add project root to path
@@ -16,6 +18,17 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 # Import slice routers
 from domains.auth.slices.login_demo import router as login_demo_router
+from orchestrator.discovery import SliceIndex
+
+# Set to 0 to keep the slice index in memory only (read-only filesystems)
+PERSIST_SLICE_INDEX_ENV = "ASA_PERSIST_SLICE_INDEX"
+
+# Slice discovery index (revalidated with directory mtimes on each request)
+slice_index = SliceIndex(
+    Path(__file__).parent,
+    persist=os.environ.get(PERSIST_SLICE_INDEX_ENV, "1") != "0",
+)
+slice_index_lock = threading.Lock()
 
 app = FastAPI(
     title="ASA Starter Kit",
@@ -55,16 +68,20 @@ async def root():
 
 
 @app.get("/health")
-async def health():
+def health():
     """
     Detailed health check endpoint
 
     Returns information about loaded slices and system status.
+    Slice discovery touches the filesystem, so this is a plain def that
+    FastAPI runs in its threadpool instead of on the event loop.
     """
+    with slice_index_lock:
+        slices = slice_index.slices()
     return {
         "status": "healthy",
         "version": "0.9.0",
-        "slices": ["auth/login_demo"],
+        "slices": [f"{info['domain']}/{info['name']}" for info in slices],
         "environment": "development"
     }
 
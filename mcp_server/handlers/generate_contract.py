@@ -1,14 +1,8 @@
 """Generate slice.contract.json"""
 import json
-from jinja2 import Template
-from pathlib import Path
+from ..jinja_env import get_template
 
-TEMPLATE_PATH = Path(__file__).parent.parent / "templates" / "slice.contract.json.j2"
-
-def to_camel_case(snake_str: str) -> str:
-    """Convert snake_case to CamelCase"""
-    components = snake_str.split('_')
-    return ''.join(x.title() for x in components)
+TEMPLATE_NAME = "slice.contract.json.j2"
 
 def generate(spec_md: str, domain: str, slice_name: str) -> str:
     """
@@ -22,15 +16,8 @@ def generate(spec_md: str, domain: str, slice_name: str) -> str:
     Returns:
         Generated contract.json content (JSON string)
     """
-    # Load template
-    with open(TEMPLATE_PATH, "r") as f:
-        template_str = f.read()
-    
-    # Create template with custom filter
-    from jinja2 import Environment
-    env = Environment()
-    env.filters['to_camel_case'] = to_camel_case
-    template = env.from_string(template_str)
+    # Compiled once by the shared environment
+    template = get_template(TEMPLATE_NAME)
 
     # Extract info from spec (simple parsing)
 
@@ -1,17 +1,143 @@
 """Generate complete slice skeleton"""
+import hashlib
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from jinja2 import Template
+from typing import Dict, List, Optional, Tuple
+from jinja2 import TemplateNotFound
+from ..jinja_env import get_template, template_version
+from ..slice_io import PACKAGE_INIT_FILES, preview_slice, write_slice
 from . import generate_spec, generate_contract
 
-def to_camel_case(snake_str: str) -> str:
-    """Convert snake_case to CamelCase"""
-    components = snake_str.split('_')
-    return ''.join(x.title() for x in components)
+FILES_TO_GENERATE = [
+    ("handler.py.j2", "handler.py"),
+    ("service.py.j2", "service.py"),
+    ("repository.py.j2", "repository.py"),
+    ("schemas.py.j2", "schemas.py"),
+    ("test_slice.py.j2", "tests/test_slice.py"),
+]
+
+INIT_FILES = PACKAGE_INIT_FILES
+INIT_CONTENT = '"""Generated slice"""'
+
+
+# Every template a rendered slice depends on
+TEMPLATE_NAMES = [
+    generate_spec.TEMPLATE_NAME,
+    generate_contract.TEMPLATE_NAME,
+    *(template_name for template_name, _ in FILES_TO_GENERATE),
+]
+
+RENDER_CACHE_SIZE = 256
+
+
+class RenderCache:
+    """
+    Bounded LRU of rendered slices keyed by render_key (thread-safe, as
+    batch generation renders in worker threads).
+    """
+
+    def __init__(self, maxsize: int = RENDER_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        with self._lock:
+            files = self._entries.get(key)
+            if files is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return files
+
+    def put(self, key: str, files: Dict[str, str]) -> None:
+        with self._lock:
+            self._entries[key] = files
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+render_cache = RenderCache()
+
+
+def render_key(func_spec: str, domain: str, slice_name: str) -> str:
+    """Content hash of the render inputs and the versions of every template."""
+    h = hashlib.sha256()
+    for part in (func_spec, domain, slice_name):
+        h.update(part.encode())
+        h.update(b"\0")
+    for template_name in TEMPLATE_NAMES:
+        h.update(f"{template_name}@{template_version(template_name)}".encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def render(func_spec: str, domain: str, slice_name: str) -> Dict[str, str]:
+    """
+    Render every file of a slice skeleton in memory.
+
+    Results are memoized in render_cache, so regenerating an unchanged
+    slice (same inputs, same templates) renders nothing.
+
+    Returns:
+        Mapping of slice-relative file path to content (package __init__
+        files included)
+    """
+    key = render_key(func_spec, domain, slice_name)
+    files = render_cache.get(key)
+    if files is None:
+        files = _render(func_spec, domain, slice_name)
+        render_cache.put(key, files)
+    return dict(files)
+
+
+def _render(func_spec: str, domain: str, slice_name: str) -> Dict[str, str]:
+    files = {}
+
+    # Generate spec.md and contract.json
+    spec_md = generate_spec.generate(func_spec, domain, slice_name)
+    files["slice.spec.md"] = spec_md
+    files["slice.contract.json"] = generate_contract.generate(spec_md, domain, slice_name)
+
+    # Generate skeleton files (templates are compiled once by the shared environment)
+    for template_name, output_name in FILES_TO_GENERATE:
+        try:
+            template = get_template(template_name)
+        except TemplateNotFound:
+            continue
+
+        files[output_name] = template.render(
+            domain=domain,
+            slice_name=slice_name,
+            func_spec=func_spec
+        )
+
+    for init_name in INIT_FILES:
+        files[init_name] = INIT_CONTENT
+
+    return files
+
 
 def generate(func_spec: str, domain: str, slice_name: str, output_path: Path) -> list[str]:
     """
     Generate complete slice skeleton.
 
+    Blocking (rendering and disk I/O); async callers run it in a worker
+    thread.
+
     Args:
         func_spec: Functional specification
         domain: Domain name
@@ -21,68 +147,45 @@ def generate(func_spec: str, domain: str, slice_name: str, output_path: Path) ->
     Returns:
         List of created file paths
     """
-    created_files = []
+    # Existing package __init__ files are kept
+    return write_slice(output_path, render(func_spec, domain, slice_name), keep_existing=INIT_FILES)
 
-    # Create output directory
-    output_path.mkdir(parents=True, exist_ok=True)
 
-    # Generate spec.md
-    spec_md = generate_spec.generate(func_spec, domain, slice_name)
-    spec_path = output_path / "slice.spec.md"
-    spec_path.write_text(spec_md)
-    created_files.append(str(spec_path))
-
-    # Generate contract.json
-    contract_json = generate_contract.generate(spec_md, domain, slice_name)
-    contract_path = output_path / "slice.contract.json"
-    contract_path.write_text(contract_json)
-    created_files.append(str(contract_path))
-
-    # Generate skeleton files
-    templates_dir = Path(__file__).parent.parent / "templates"
-
-    files_to_generate = [
-        ("handler.py.j2", "handler.py"),
-        ("service.py.j2", "service.py"),
-        ("repository.py.j2", "repository.py"),
-        ("schemas.py.j2", "schemas.py"),
-        ("test_slice.py.j2", "tests/test_slice.py"),
-    ]
-
-    for template_name, output_name in files_to_generate:
-        template_path = templates_dir / template_name
-
-        if template_path.exists():
-            with open(template_path, "r") as f:
-                template_str = f.read()
-
-            # Create template with custom filter
-            from jinja2 import Environment
-            env = Environment()
-            env.filters['to_camel_case'] = to_camel_case
-            template = env.from_string(template_str)
-
-            content = template.render(
-                domain=domain,
-                slice_name=slice_name,
-                func_spec=func_spec
-            )
-
-            file_path = output_path / output_name
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(content)
-            created_files.append(str(file_path))
-
-    # Create __init__.py files
-    init_files = [
-        output_path / "__init__.py",
-        output_path / "tests" / "__init__.py"
-    ]
-
-    for init_file in init_files:
-        init_file.parent.mkdir(parents=True, exist_ok=True)
-        if not init_file.exists():
-            init_file.write_text('"""Generated slice"""')
-            created_files.append(str(init_file))
-
-    return created_files
+def lint_rendered(slices: Dict[Path, Dict[str, str]]) -> List[Dict]:
+    """
+    Run the ASA linters on rendered slices as they would be once written
+    (existing files included), without writing anything. All slices share
+    one import graph of the project overlaid with them.
+
+    Returns:
+        Lint results per slice, in the order of slices
+    """
+    # The linters ship with the CLI; imported on first use only
+    from orchestrator.asa_lints import run_asa_checks_in_memory
+
+    return run_asa_checks_in_memory({
+        output_path: preview_slice(output_path, files, keep_existing=INIT_FILES)
+        for output_path, files in slices.items()
+    })
+
+
+def generate_checked(
+    func_spec: str,
+    domain: str,
+    slice_name: str,
+    output_path: Path
+) -> Tuple[List[str], Dict]:
+    """
+    Generate a slice skeleton only if it passes the ASA linters.
+
+    The slice is rendered and linted in memory first; if any check fails,
+    nothing is written (an existing slice is left as it was).
+
+    Returns:
+        (list of created file paths, lint results)
+    """
+    files = render(func_spec, domain, slice_name)
+    results = lint_rendered({output_path: files})[0]
+    if results["overall_status"] == "FAILED":
+        return [], results
+    return write_slice(output_path, files, keep_existing=INIT_FILES), results
@@ -1,13 +1,7 @@
 """Generate slice.spec.md"""
-from jinja2 import Template
-from pathlib import Path
+from ..jinja_env import get_template
 
-TEMPLATE_PATH = Path(__file__).parent.parent / "templates" / "slice.spec.md.j2"
-
-def to_camel_case(snake_str: str) -> str:
-    """Convert snake_case to CamelCase"""
-    components = snake_str.split('_')
-    return ''.join(x.title() for x in components)
+TEMPLATE_NAME = "slice.spec.md.j2"
 
 def generate(func_spec: str, domain: str, slice_name: str) -> str:
     """
@@ -21,15 +15,8 @@ def generate(func_spec: str, domain: str, slice_name: str) -> str:
     Returns:
         Generated spec.md content
     """
-    # Load template
-    with open(TEMPLATE_PATH, "r") as f:
-        template_str = f.read()
-    
-    # Create template with custom filter
-    from jinja2 import Environment
-    env = Environment()
-    env.filters['to_camel_case'] = to_camel_case
-    template = env.from_string(template_str)
+    # Compiled once by the shared environment
+    template = get_template(TEMPLATE_NAME)
 
     # Parse func_spec (simple extraction)
     goal = func_spec[:200] if len(func_spec) > 200 else func_spec
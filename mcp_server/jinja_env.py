@@ -0,0 +1,80 @@
+"""
+Shared Jinja environment for the MCP generators
+
+One environment serves every generator: templates are loaded through a
+FileSystemLoader, compiled once and kept in the environment's template
+cache. auto_reload re-checks a template's mtime on lookup, so edited
+templates are picked up without a restart, and the on-disk bytecode cache
+lets a fresh server process skip compiling templates it has seen before.
+"""
+import os
+from pathlib import Path
+from typing import Any, List, Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# Compiled template bytecode; defaults to a per-user directory under the
+# system temp dir (FileSystemBytecodeCache's own default)
+BYTECODE_CACHE_ENV = "ASA_JINJA_CACHE_DIR"
+
+
+def to_camel_case(snake_str: str) -> str:
+    """Convert snake_case to CamelCase"""
+    components = snake_str.split('_')
+    return ''.join(x.title() for x in components)
+
+
+def _bytecode_cache(directory: Optional[str]) -> FileSystemBytecodeCache:
+    if directory:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        return FileSystemBytecodeCache(directory)
+    return FileSystemBytecodeCache()
+
+
+def create_environment(
+    templates_dir: Path = TEMPLATES_DIR,
+    bytecode_cache_dir: Optional[str] = None
+) -> Environment:
+    """An environment for the generator templates (with the to_camel_case filter)."""
+    env = Environment(
+        loader=FileSystemLoader(str(templates_dir)),
+        bytecode_cache=_bytecode_cache(bytecode_cache_dir),
+        auto_reload=True,
+    )
+    env.filters['to_camel_case'] = to_camel_case
+    return env
+
+
+env = create_environment(bytecode_cache_dir=os.environ.get(BYTECODE_CACHE_ENV))
+
+
+def get_template(name: str) -> Template:
+    """A compiled template (compiled on first use, recompiled when the file changes)."""
+    return env.get_template(name)
+
+
+def render(name: str, **context: Any) -> str:
+    """Render a template by file name, e.g. render("handler.py.j2", domain=...)."""
+    return env.get_template(name).render(**context)
+
+
+def template_version(name: str) -> str:
+    """
+    Version of a template file (mtime and size, "-" if missing); it changes
+    whenever auto_reload would recompile the template.
+    """
+    try:
+        st = os.stat(TEMPLATES_DIR / name)
+    except OSError:
+        return "-"
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def precompile() -> List[str]:
+    """Compile every template now (at server startup) and return their names."""
+    names = env.list_templates(extensions=["j2"])
+    for name in names:
+        env.get_template(name)
+    return names
@@ -3,15 +3,29 @@ MCP Server - Main Application
 
 FastAPI server for slice generation.
 """
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from pathlib import Path
+from . import jinja_env, slice_io
 from .handlers import generate_spec, generate_contract, generate_skeleton
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Compile all generator templates before the first request."""
+    jinja_env.precompile()
+    yield
+
+
 app = FastAPI(
     title="ASA MCP Server",
     description="Model Context Protocol server for ASA slice generation",
-    version="0.9.0"
+    version="0.9.0",
+    lifespan=lifespan
 )
 
 
@@ -32,10 +46,31 @@ class GenerateSkeletonRequest(BaseModel):
     domain: str
     slice_name: str
     output_path: str
+    # Lint the rendered slice in memory and write it only if the checks pass
+    check: bool = False
+
+
+class GenerateBatchRequest(BaseModel):
+    slices: List[GenerateSkeletonRequest] = Field(..., min_length=1)
+    # Check every slice of the batch (as if each had check set)
+    check: bool = False
+
+
+class ArchiveSliceRequest(BaseModel):
+    func_spec: str
+    domain: str
+    slice_name: str
+    # Path of the slice inside the archive (default: domains/<domain>/slices/<slice_name>)
+    path: Optional[str] = None
+
+
+class GenerateArchiveRequest(BaseModel):
+    slices: List[ArchiveSliceRequest] = Field(..., min_length=1)
+    format: Literal["ndjson", "tar", "zip"] = "ndjson"
 
 
 @app.get("/")
-async def root():
+async def root() -> Dict[str, Any]:
     """Health check"""
     return {
         "status": "ok",
@@ -45,7 +80,7 @@ async def root():
 
 
 @app.post("/mcp/generate-spec")
-async def generate_spec_endpoint(request: GenerateSpecRequest):
+async def generate_spec_endpoint(request: GenerateSpecRequest) -> Dict[str, Any]:
     """
     Generate slice.spec.md from functional specification.
 
@@ -67,7 +102,7 @@ async def generate_spec_endpoint(request: GenerateSpecRequest):
 
 
 @app.post("/mcp/generate-contract")
-async def generate_contract_endpoint(request: GenerateContractRequest):
+async def generate_contract_endpoint(request: GenerateContractRequest) -> Dict[str, Any]:
     """
     Generate slice.contract.json from spec.md.
 
@@ -88,28 +123,176 @@ async def generate_contract_endpoint(request: GenerateContractRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+LINT_FAILED = "Generated slice failed the ASA checks; nothing was written"
+
+
 @app.post("/mcp/generate-skeleton")
-async def generate_skeleton_endpoint(request: GenerateSkeletonRequest):
+async def generate_skeleton_endpoint(request: GenerateSkeletonRequest) -> Dict[str, Any]:
     """
     Generate complete slice skeleton (all files).
 
+    With check, the slice is linted in memory before anything is written,
+    and a slice that fails the checks is not written at all.
+
     Returns:
-        created_files: List of created file paths
+        created_files: List of written file paths (files whose content is
+                       unchanged on disk are not rewritten)
+        lint_results: ASA lint results (with check only)
     """
     try:
-        created_files = generate_skeleton.generate(
+        # Rendering, linting and disk I/O run in a worker thread, off the event loop
+        if not request.check:
+            created_files = await asyncio.to_thread(
+                generate_skeleton.generate,
+                func_spec=request.func_spec,
+                domain=request.domain,
+                slice_name=request.slice_name,
+                output_path=Path(request.output_path)
+            )
+            return {
+                "created_files": created_files,
+                "success": True
+            }
+        created_files, lint_results = await asyncio.to_thread(
+            generate_skeleton.generate_checked,
             func_spec=request.func_spec,
             domain=request.domain,
             slice_name=request.slice_name,
             output_path=Path(request.output_path)
         )
-        return {
-            "created_files": created_files,
-            "success": True
-        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    result = {
+        "created_files": created_files,
+        "lint_results": lint_results,
+        "success": lint_results["overall_status"] != "FAILED"
+    }
+    if not result["success"]:
+        result["error"] = LINT_FAILED
+    return result
+
+
+def _generate_one(request: GenerateSkeletonRequest, lint_results: Optional[dict] = None) -> dict:
+    """
+    Generate one slice of a batch; errors are reported per slice. With
+    lint_results (of the slice linted in memory), a failed slice is not
+    written.
+    """
+    result: Dict[str, Any] = {
+        "domain": request.domain,
+        "slice_name": request.slice_name,
+        "output_path": request.output_path,
+    }
+    if lint_results is not None:
+        result["lint_results"] = lint_results
+        if lint_results["overall_status"] == "FAILED":
+            result["created_files"] = []
+            result["error"] = LINT_FAILED
+            result["success"] = False
+            return result
+    try:
+        # Checked slices were rendered for linting: served from the render cache
+        result["created_files"] = generate_skeleton.generate(
+            func_spec=request.func_spec,
+            domain=request.domain,
+            slice_name=request.slice_name,
+            output_path=Path(request.output_path)
+        )
+        result["success"] = True
+    except Exception as e:
+        result["error"] = str(e)
+        result["success"] = False
+    return result
+
+
+def _lint_batch(items: List[GenerateSkeletonRequest]) -> List[dict]:
+    """Render and lint the checked slices of a batch in one in-memory pass."""
+    return generate_skeleton.lint_rendered({
+        Path(item.output_path): generate_skeleton.render(item.func_spec, item.domain, item.slice_name)
+        for item in items
+    })
+
+
+@app.post("/mcp/generate-batch")
+async def generate_batch_endpoint(request: GenerateBatchRequest) -> Dict[str, Any]:
+    """
+    Generate many slice skeletons in one request.
+
+    Slices are generated concurrently in worker threads; a failing slice
+    does not stop the others. Checked slices (see GenerateSkeletonRequest)
+    are first linted together in memory, sharing one import graph, and
+    only the ones that pass are written.
+
+    Returns:
+        results: One entry per requested slice (in request order) with
+                 created_files (and lint_results if checked), or error if
+                 it failed
+    """
+    output_paths = [Path(item.output_path).resolve() for item in request.slices]
+    if len(set(output_paths)) != len(output_paths):
+        raise HTTPException(status_code=400, detail="Duplicate output_path in batch")
+
+    checked = [item for item in request.slices if request.check or item.check]
+    lint_results = {}
+    if checked:
+        try:
+            linted = await asyncio.to_thread(_lint_batch, checked)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        lint_results = {id(item): results for item, results in zip(checked, linted)}
+
+    results = await asyncio.gather(
+        *(
+            asyncio.to_thread(_generate_one, item, lint_results.get(id(item)))
+            for item in request.slices
+        )
+    )
+    return {
+        "results": results,
+        "success": all(result["success"] for result in results)
+    }
+
+
+@app.post("/mcp/generate-archive")
+async def generate_archive_endpoint(request: GenerateArchiveRequest) -> StreamingResponse:
+    """
+    Render slices in memory and stream them back as an archive.
+
+    Nothing is written on the server: the response is an NDJSON stream of
+    file records and progress events, or a tar/zip archive (see
+    mcp_server.slice_io), sent slice by slice as each one is rendered.
+
+    Returns:
+        Streamed archive in the requested format
+    """
+    try:
+        paths = [
+            slice_io.safe_path(item.path or f"domains/{item.domain}/slices/{item.slice_name}")
+            for item in request.slices
+        ]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if len(set(paths)) != len(paths):
+        raise HTTPException(status_code=400, detail="Duplicate slice path in archive")
+
+    writer = slice_io.ArchiveWriter(request.format)
+
+    async def body() -> AsyncIterator[bytes]:
+        yield writer.start(len(paths))
+        for index, (item, path) in enumerate(zip(request.slices, paths)):
+            try:
+                files = await asyncio.to_thread(
+                    generate_skeleton.render, item.func_spec, item.domain, item.slice_name
+                )
+            except Exception as e:
+                yield writer.add_error(index, path, str(e))
+                continue
+            yield writer.add_slice(index, path, files)
+        yield writer.close()
+
+    return StreamingResponse(body(), media_type=writer.media_type)
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,429 @@
+"""
+Slice I/O
+
+Writing rendered slices to disk atomically (or previewing the result in
+memory, for linting before anything is written), and the archive formats used
+to stream rendered slices from the MCP server to 'asa generate-slice'
+(encoders for the server, matching decoders for the CLI), so the server
+and the CLI need not share a filesystem.
+
+Formats:
+    ndjson  One JSON record per line: {"type": "start", "total": N}, then per
+            slice its {"type": "file", "slice", "name", "content"} records and
+            a {"type": "slice", "index", "path", "files"} progress event (or
+            {"type": "error", "index", "path", "error"}), then {"type": "end"}.
+    tar     Uncompressed tar stream of <slice path>/<file> members.
+    zip     Zip stream of the same members (data descriptors, no seeking).
+tar and zip end with a MANIFEST_NAME member listing the slices and errors.
+
+Standard library only: the CLI imports it without the server's dependencies.
+"""
+import ctypes
+import errno
+import io
+import json
+import os
+import posixpath
+import shutil
+import sys
+import tarfile
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, cast
+
+FORMATS = ["ndjson", "tar", "zip"]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "tar": "application/x-tar",
+    "zip": "application/zip",
+}
+
+# Last member of tar/zip archives:
+# {"slices": [{"index", "path", "files"}, ...], "errors": [{"index", "path", "error"}, ...]}
+MANIFEST_NAME = ".asa-generate.json"
+
+# Rendered slice: slice-relative file name -> content
+SliceFiles = Dict[str, str]
+
+# Package markers of a generated slice; existing ones are kept on regeneration
+PACKAGE_INIT_FILES = ["__init__.py", "tests/__init__.py"]
+
+
+def _read_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import: os.umask() is process-wide, so calling it while
+# batch generation runs in worker threads would race with their writes
+_UMASK = _read_umask()
+
+
+# renameat2() flag swapping two paths atomically (Linux >= 3.15)
+_RENAME_EXCHANGE = 2
+_AT_FDCWD = -100
+
+
+def _load_renameat2() -> Optional[Callable[..., int]]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        renameat2 = libc.renameat2
+    except (OSError, AttributeError):
+        # e.g. glibc < 2.28 or a libc without the wrapper
+        return None
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    renameat2.restype = ctypes.c_int
+    return renameat2
+
+
+_renameat2 = _load_renameat2()
+
+
+def exchange_paths(first: Path, second: Path) -> bool:
+    """
+    Atomically swap two existing paths with renameat2(RENAME_EXCHANGE).
+    Returns False if the platform or filesystem does not support it (the
+    paths are then untouched); other failures raise OSError.
+    """
+    if _renameat2 is None:
+        return False
+    result = _renameat2(_AT_FDCWD, os.fsencode(first), _AT_FDCWD, os.fsencode(second), _RENAME_EXCHANGE)
+    if result == 0:
+        return True
+    err = ctypes.get_errno()
+    if err in (errno.ENOSYS, errno.EINVAL, errno.ENOTSUP):
+        return False
+    raise OSError(err, os.strerror(err), str(first), None, str(second))
+
+
+def _unchanged(file_path: Path, data: bytes) -> bool:
+    """Whether file_path already holds exactly data (sizes are compared first)."""
+    try:
+        return file_path.stat().st_size == len(data) and file_path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def write_slice(
+    output_path: Path,
+    files: SliceFiles,
+    keep_existing: Iterable[str] = ()
+) -> List[str]:
+    """
+    Write rendered files to output_path atomically.
+
+    Files whose bytes are already on disk are not rewritten, and if nothing
+    changed the slice is left untouched (no mtime changes to trigger
+    uvicorn --reload or invalidate lint caches). Otherwise the slice is
+    assembled in a temporary sibling directory (starting from a copy of the
+    existing slice, with mtimes preserved) and renamed into place, so
+    readers such as the linter never see a half-written slice. A new slice
+    appears with one rename; an existing one is swapped with the new one
+    in a single atomic exchange (exchange_paths) where the platform allows
+    it. Elsewhere the old slice is moved aside first, so the path is
+    briefly missing, but never partially written.
+    Files named in keep_existing are not overwritten if they exist. The
+    temporary directory names start with "." so slice discovery never picks
+    them up.
+
+    Returns:
+        List of written file paths (unchanged files are left out)
+    """
+    output_path = Path(output_path)
+    keep_existing = set(keep_existing)
+    exists = output_path.is_dir()
+
+    changed = {}
+    for name, content in files.items():
+        file_path = output_path / name
+        if exists and (
+            (name in keep_existing and file_path.exists())
+            or _unchanged(file_path, content.encode())
+        ):
+            continue
+        changed[name] = content
+    if not changed:
+        return []
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(tempfile.mkdtemp(prefix=f".{output_path.name}.", dir=output_path.parent))
+
+    try:
+        if exists:
+            shutil.copytree(output_path, tmp_path, symlinks=True, dirs_exist_ok=True)
+        else:
+            # mkdtemp creates the directory private (0700)
+            os.chmod(tmp_path, 0o777 & ~_UMASK)
+
+        written_files = []
+        for name, content in changed.items():
+            file_path = tmp_path / name
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(content)
+            written_files.append(str(output_path / name))
+
+        if exists and exchange_paths(tmp_path, output_path):
+            # tmp_path now holds the previous slice
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        elif exists:
+            old_path = Path(tempfile.mkdtemp(prefix=f".{output_path.name}.old.", dir=output_path.parent))
+            os.replace(output_path, old_path / output_path.name)
+            os.replace(tmp_path, output_path)
+            shutil.rmtree(old_path, ignore_errors=True)
+        else:
+            os.replace(tmp_path, output_path)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    return written_files
+
+
+def preview_slice(
+    output_path: Path,
+    files: SliceFiles,
+    keep_existing: Iterable[str] = ()
+) -> Dict[str, bytes]:
+    """
+    Contents output_path would have after write_slice(output_path, files,
+    keep_existing), without writing anything: the existing slice files
+    (caches and hidden directories left out) overlaid with the rendered ones.
+
+    Returns:
+        Mapping of slice-relative POSIX path to bytes
+    """
+    output_path = Path(output_path)
+    keep_existing = set(keep_existing)
+    contents: Dict[str, bytes] = {}
+    if output_path.is_dir():
+        for directory, subdirs, filenames in os.walk(output_path):
+            subdirs[:] = [d for d in subdirs if d != "__pycache__" and not d.startswith(".")]
+            relative = Path(directory).relative_to(output_path)
+            for filename in filenames:
+                name = (relative / filename).as_posix()
+                try:
+                    contents[name] = (Path(directory) / filename).read_bytes()
+                except OSError:
+                    continue
+    for name, content in files.items():
+        if name in keep_existing and name in contents:
+            continue
+        contents[name] = content.encode()
+    return contents
+
+
+def safe_path(path: str) -> str:
+    """
+    Normalized relative POSIX path, or ValueError if it is absolute or
+    escapes its root (archive members are written below the client's cwd).
+    """
+    normalized = posixpath.normpath(path.replace("\\", "/"))
+    if (
+        not path
+        or posixpath.isabs(normalized)
+        or normalized == "."
+        or normalized == ".."
+        or normalized.startswith("../")
+    ):
+        raise ValueError(f"Unsafe path: {path!r}")
+    return normalized
+
+
+class _Chunks:
+    """Write-only, non-seekable buffer that archive writers stream into."""
+
+    def __init__(self) -> None:
+        self._parts: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+class ArchiveWriter:
+    """
+    Incremental archive encoder: each method returns the bytes to send
+    next, so a response can be streamed slice by slice.
+    """
+
+    def __init__(self, fmt: str):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown archive format: {fmt}")
+        self.format = fmt
+        self.media_type = MEDIA_TYPES[fmt]
+        self._slices: List[Dict] = []
+        self._errors: List[Dict] = []
+        self._buffer = _Chunks()
+        self._tar: Optional[tarfile.TarFile] = None
+        self._zip: Optional[zipfile.ZipFile] = None
+        if fmt == "tar":
+            # Small stream buffer, so each slice's members are sent right away
+            # (_Chunks is a write-only stream, which is all stream mode needs)
+            self._tar = tarfile.open(
+                fileobj=cast(IO[bytes], self._buffer), mode="w|", bufsize=tarfile.BLOCKSIZE
+            )
+        elif fmt == "zip":
+            self._zip = zipfile.ZipFile(
+                cast(IO[bytes], self._buffer), mode="w", compression=zipfile.ZIP_DEFLATED
+            )
+
+    @staticmethod
+    def _record(record: Dict) -> bytes:
+        return json.dumps(record, ensure_ascii=False).encode() + b"\n"
+
+    def _add_member(self, name: str, data: bytes) -> None:
+        if self._tar is not None:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o644
+            info.mtime = int(time.time())
+            self._tar.addfile(info, io.BytesIO(data))
+        elif self._zip is not None:
+            self._zip.writestr(name, data)
+
+    def start(self, total: int) -> bytes:
+        if self.format == "ndjson":
+            return self._record({"type": "start", "total": total})
+        return b""
+
+    def add_slice(self, index: int, slice_path: str, files: SliceFiles) -> bytes:
+        done = {"index": index, "path": slice_path, "files": len(files)}
+        self._slices.append(done)
+        if self.format == "ndjson":
+            return b"".join(
+                self._record({"type": "file", "slice": slice_path, "name": name, "content": content})
+                for name, content in files.items()
+            ) + self._record({"type": "slice", **done})
+        for name, content in files.items():
+            self._add_member(f"{slice_path}/{name}", content.encode())
+        return self._buffer.take()
+
+    def add_error(self, index: int, slice_path: str, message: str) -> bytes:
+        error = {"index": index, "path": slice_path, "error": message}
+        self._errors.append(error)
+        if self.format == "ndjson":
+            return self._record({"type": "error", **error})
+        return b""
+
+    def close(self) -> bytes:
+        summary = {"slices": self._slices, "errors": self._errors}
+        if self.format == "ndjson":
+            return self._record({"type": "end", **summary})
+        self._add_member(MANIFEST_NAME, json.dumps(summary).encode())
+        if self._tar is not None:
+            self._tar.close()
+        elif self._zip is not None:
+            self._zip.close()
+        return self._buffer.take()
+
+
+class _ChunkReader(io.RawIOBase):
+    """File-like view of an iterator of byte chunks (for tarfile stream mode)."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        yield from lines
+    if pending:
+        yield pending
+
+
+# Progress callback: (event type, record), e.g. ("slice", {"index": 0, "path": ...})
+ProgressCallback = Callable[[str, Dict], None]
+
+
+def read_archive(
+    fmt: str,
+    chunks: Iterable[bytes],
+    on_event: Optional[ProgressCallback] = None
+) -> Tuple[Dict[str, SliceFiles], List[Dict]]:
+    """
+    Decode an archive stream into ({slice path: files}, errors).
+
+    Slice paths are checked with safe_path. NDJSON streams report progress
+    to on_event as records arrive; tar and zip streams report each slice
+    once the archive is complete.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown archive format: {fmt}")
+    on_event = on_event or (lambda event, record: None)
+
+    if fmt == "ndjson":
+        slices: Dict[str, SliceFiles] = {}
+        errors: List[Dict] = []
+        for line in _iter_lines(chunks):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            kind = record.get("type")
+            if kind == "file":
+                files = slices.setdefault(safe_path(record["slice"]), {})
+                files[safe_path(record["name"])] = record["content"]
+            elif kind == "error":
+                errors.append({key: record[key] for key in ("index", "path", "error")})
+            if kind != "file":
+                on_event(kind, record)
+        return slices, errors
+
+    members: Dict[str, str] = {}
+    if fmt == "tar":
+        with tarfile.open(fileobj=_ChunkReader(chunks), mode="r|") as tar:
+            for member in tar:
+                extracted = tar.extractfile(member) if member.isfile() else None
+                if extracted is not None:
+                    members[safe_path(member.name)] = extracted.read().decode()
+    else:
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+            for name in archive.namelist():
+                if not name.endswith("/"):
+                    members[safe_path(name)] = archive.read(name).decode()
+
+    if MANIFEST_NAME not in members:
+        raise ValueError(f"Incomplete archive (no {MANIFEST_NAME})")
+    manifest = json.loads(members.pop(MANIFEST_NAME))
+    slices = {}
+    for done in manifest["slices"]:
+        slice_path = safe_path(done["path"])
+        prefix = slice_path + "/"
+        slices[slice_path] = {
+            name[len(prefix):]: content for name, content in members.items() if name.startswith(prefix)
+        }
+        on_event("slice", done)
+    for error in manifest["errors"]:
+        on_event("error", error)
+    return slices, manifest["errors"]
@@ -1,4 +1,24 @@
 """ASA Linters"""
-from .run_asa_checks import run_asa_checks, format_results
+from .run_asa_checks import (
+    run_asa_checks,
+    run_asa_checks_cached,
+    run_asa_checks_many,
+    run_asa_checks_in_memory,
+    format_results,
+)
+from .slice_context import SliceContext
+from .lint_cache import LintCache
+from .import_graph import ImportGraph
+from .registry import register_check
 
-__all__ = ["run_asa_checks", "format_results"]
+__all__ = [
+    "run_asa_checks",
+    "run_asa_checks_cached",
+    "run_asa_checks_many",
+    "run_asa_checks_in_memory",
+    "format_results",
+    "SliceContext",
+    "LintCache",
+    "ImportGraph",
+    "register_check",
+]
@@ -0,0 +1,373 @@
+"""ASA Linter: Contract JSON Schema
+
+A JSON Schema for slice.contract.json and a small compiler that turns a
+schema into a tree of validator closures once, so validating a contract
+is a handful of function calls with no schema interpretation left.
+
+Only the keywords the contract schema uses are supported: type, enum,
+properties, required, additionalProperties, items, minItems, uniqueItems,
+minLength, pattern and minimum.
+"""
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+IDENTIFIER = r"[A-Za-z_][A-Za-z0-9_]*"
+
+STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+# Budgets of one endpoint in the performance block, checked by 'asa bench-slice'
+ENDPOINT_BUDGET = {
+    "type": "object",
+    "properties": {
+        "p99_ms": {"type": "number", "minimum": 0},
+        "min_rps": {"type": "number", "minimum": 0},
+        "max_memory_growth_kb": {"type": "number", "minimum": 0},
+        "expect_status": {"type": "integer", "minimum": 100},
+        "request": {
+            "type": "object",
+            "properties": {
+                "json": {},
+                "headers": {"type": "object", "additionalProperties": {"type": "string"}},
+                "params": {"type": "object"},
+            },
+            "additionalProperties": False,
+        },
+    },
+    "additionalProperties": False,
+}
+
+CONTRACT_SCHEMA: Dict[str, Any] = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "title": "ASA slice contract",
+    "type": "object",
+    "required": ["slice_name", "version", "domain", "allowed_imports", "public_api", "dependencies"],
+    # Fields the contract linter checked before the schema keep their
+    # semantics (types only, no value patterns); only nested types are new
+    "properties": {
+        "slice_name": {"type": "string"},
+        "version": {"type": "string"},
+        "domain": {"type": "string"},
+        "allowed_imports": STRING_LIST,
+        "public_api": {
+            "type": "object",
+            "properties": {
+                "endpoint": {"type": "string"},
+                "handler": {"type": "string"},
+                "schemas": STRING_LIST,
+                "exports": STRING_LIST,
+            },
+        },
+        "dependencies": {
+            "type": "object",
+            "properties": {
+                "shared": STRING_LIST,
+                "external": STRING_LIST,
+            },
+        },
+        "loc_limits": {
+            "type": "object",
+            "properties": {
+                "per_file": {"type": "integer", "minimum": 1},
+                "total": {"type": "integer", "minimum": 1},
+                "justification": {"type": "string"},
+            },
+        },
+        "performance_overrides": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["rule", "function", "justification"],
+                "properties": {
+                    "rule": {"type": "string", "enum": ["async_blocking", "linear_scan"]},
+                    "function": {"type": "string", "pattern": rf"^{IDENTIFIER}(\.{IDENTIFIER})*$"},
+                    "justification": {"type": "string", "minLength": 1},
+                },
+                "additionalProperties": False,
+            },
+        },
+        # "METHOD /path" of a public_api endpoint -> budgets
+        "performance": {
+            "type": "object",
+            "additionalProperties": ENDPOINT_BUDGET,
+        },
+    },
+}
+
+# JSON type name -> predicate (bool is not a number in JSON)
+_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+}
+
+_ARTICLES = {"object": "an", "array": "an", "integer": "an"}
+
+
+class SchemaError(Exception):
+    """The schema itself uses an unsupported keyword or is malformed."""
+
+
+class ValidationError:
+    """One schema violation at a JSON pointer (RFC 6901) into the document."""
+
+    __slots__ = ("pointer", "message")
+
+    def __init__(self, pointer: str, message: str):
+        self.pointer = pointer
+        self.message = message
+
+    def __str__(self) -> str:
+        # URI fragment form, so the document root is "#" rather than ""
+        return f"#{self.pointer}: {self.message}"
+
+    def __repr__(self) -> str:
+        return f"ValidationError({self.pointer!r}, {self.message!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, ValidationError)
+            and (self.pointer, self.message) == (other.pointer, other.message)
+        )
+
+
+# A compiled node: (value, pointer, errors) -> None, appending to errors
+Validator = Callable[[Any, str, List[ValidationError]], None]
+
+_SUPPORTED = {
+    "$schema", "title", "description",
+    "type", "enum", "properties", "required", "additionalProperties",
+    "items", "minItems", "uniqueItems", "minLength", "pattern", "minimum",
+}
+
+
+def _escape(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def _type_name(value: Any) -> str:
+    for name in ("boolean", "integer", "number", "string", "array", "object", "null"):
+        if _TYPES[name](value):
+            return name
+    return type(value).__name__
+
+
+# Keywords of leaf schemas, which also get a fast predicate (see _accepts)
+_LEAF_KEYWORDS = {"$schema", "title", "description", "type", "enum", "minLength", "pattern", "minimum"}
+
+
+def _accepts(schema: Dict[str, Any]) -> Optional[Callable[[Any], bool]]:
+    """
+    A predicate telling whether a value is valid against a leaf schema
+    (None for schemas with nested keywords). Containers test their items
+    with it and only walk a failing item again to report its errors.
+    """
+    if set(schema) - _LEAF_KEYWORDS or schema.get("type") not in _TYPES:
+        return None
+    expected = schema["type"]
+
+    if expected == "string" and "enum" not in schema:
+        search = re.compile(schema.get("pattern", "")).search
+        min_length = schema.get("minLength", 0)
+        return lambda value: (
+            value.__class__ is str and len(value) >= min_length and search(value) is not None
+        )
+
+    is_type = _TYPES[expected]
+    allowed = schema.get("enum")
+    pattern = re.compile(schema["pattern"]) if "pattern" in schema else None
+    min_length = schema.get("minLength", 0)
+    minimum = schema.get("minimum")
+
+    def accepts(value: Any) -> bool:
+        if not is_type(value) or (allowed is not None and value not in allowed):
+            return False
+        if isinstance(value, str):
+            return len(value) >= min_length and (pattern is None or pattern.search(value) is not None)
+        return minimum is None or not _TYPES["number"](value) or value >= minimum
+    return accepts
+
+
+def _compile(schema: Dict[str, Any]) -> Validator:
+    """Compile one schema node into a validator closure."""
+    unsupported = set(schema) - _SUPPORTED
+    if unsupported:
+        raise SchemaError(f"Unsupported schema keywords: {', '.join(sorted(unsupported))}")
+
+    # Checks that only apply once the value has the declared type
+    checks: List[Validator] = []
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+
+        def check_enum(value: Any, pointer: str, errors: List[ValidationError]) -> None:
+            if value not in allowed:
+                errors.append(ValidationError(pointer, f"must be one of {allowed}"))
+        checks.append(check_enum)
+
+    if "minLength" in schema:
+        min_length = schema["minLength"]
+
+        def check_min_length(value: Any, pointer: str, errors: List[ValidationError]) -> None:
+            if isinstance(value, str) and len(value) < min_length:
+                message = "must not be empty" if min_length == 1 else f"must be at least {min_length} characters"
+                errors.append(ValidationError(pointer, message))
+        checks.append(check_min_length)
+
+    if "pattern" in schema:
+        source = schema["pattern"]
+        search = re.compile(source).search
+
+        def check_pattern(value: Any, pointer: str, errors: List[ValidationError]) -> None:
+            if isinstance(value, str) and search(value) is None:
+                errors.append(ValidationError(pointer, f"{value!r} does not match {source}"))
+        checks.append(check_pattern)
+
+    if "minimum" in schema:
+        minimum = schema["minimum"]
+
+        def check_minimum(value: Any, pointer: str, errors: List[ValidationError]) -> None:
+            if _TYPES["number"](value) and value < minimum:
+                errors.append(ValidationError(pointer, f"must be >= {minimum}"))
+        checks.append(check_minimum)
+
+    if "required" in schema:
+        required = tuple(schema["required"])
+
+        def check_required(value: Any, pointer: str, errors: List[ValidationError]) -> None:
+            if isinstance(value, dict):
+                for name in required:
+                    if name not in value:
+                        errors.append(ValidationError(pointer, f"missing required field: {name}"))
+        checks.append(check_required)
+
+    if "properties" in schema or "additionalProperties" in schema:
+        # (key, child pointer suffix, validator), compiled once
+        properties = [
+            (name, "/" + _escape(name), _compile(subschema), _accepts(subschema))
+            for name, subschema in schema.get("properties", {}).items()
+        ]
+        known = {name for name, _, _, _ in properties}
+        additional = schema.get("additionalProperties", True)
+        if isinstance(additional, dict):
+            additional = _compile(additional)
+
+        def check_properties(value: Any, pointer: str, errors: List[ValidationError]) -> None:
+            if not isinstance(value, dict):
+                return
+            for name, suffix, validate, accepts in properties:
+                if name in value:
+                    child = value[name]
+                    if accepts is None or not accepts(child):
+                        validate(child, pointer + suffix, errors)
+            if additional is True:
+                return
+            for name in value:
+                if name in known:
+                    continue
+                if additional is False:
+                    errors.append(ValidationError(pointer, f"unexpected field: {name}"))
+                else:
+                    additional(value[name], f"{pointer}/{_escape(name)}", errors)
+        checks.append(check_properties)
+
+    if "minItems" in schema:
+        min_items = schema["minItems"]
+
+        def check_min_items(value: Any, pointer: str, errors: List[ValidationError]) -> None:
+            if isinstance(value, list) and len(value) < min_items:
+                errors.append(ValidationError(pointer, f"must have at least {min_items} items"))
+        checks.append(check_min_items)
+
+    if schema.get("uniqueItems"):
+        def check_unique(value: Any, pointer: str, errors: List[ValidationError]) -> None:
+            if not isinstance(value, list):
+                return
+            try:
+                if len(set(value)) == len(value):
+                    return
+            except TypeError:
+                pass  # unhashable items: compare pairwise below
+            seen = []
+            for index, item in enumerate(value):
+                if item in seen:
+                    errors.append(ValidationError(f"{pointer}/{index}", f"duplicate item: {item!r}"))
+                else:
+                    seen.append(item)
+        checks.append(check_unique)
+
+    if "items" in schema:
+        validate_item = _compile(schema["items"])
+        accepts_item = _accepts(schema["items"])
+
+        def check_items(value: Any, pointer: str, errors: List[ValidationError]) -> None:
+            if not isinstance(value, list):
+                return
+            if accepts_item is not None and all(map(accepts_item, value)):
+                return
+            for index, item in enumerate(value):
+                validate_item(item, f"{pointer}/{index}", errors)
+        checks.append(check_items)
+
+    expected = schema.get("type")
+    if expected is not None:
+        if expected not in _TYPES:
+            raise SchemaError(f"Unsupported type: {expected}")
+        is_type = _TYPES[expected]
+        type_message = f"must be {_ARTICLES.get(expected, 'a')} {expected}"
+    else:
+        is_type = None
+
+    node_checks = tuple(checks)
+
+    def validate(value: Any, pointer: str, errors: List[ValidationError]) -> None:
+        if is_type is not None and not is_type(value):
+            errors.append(ValidationError(pointer, f"{type_message}, not {_type_name(value)}"))
+            return
+        for check in node_checks:
+            check(value, pointer, errors)
+
+    return validate
+
+
+class CompiledSchema:
+    """A JSON Schema compiled into validator closures (see compile_schema)."""
+
+    def __init__(self, schema: Dict[str, Any]):
+        self.schema = schema
+        self._validate = _compile(schema)
+
+    def validate(self, document: Any) -> List[ValidationError]:
+        """Violations in document, in schema order (empty if it is valid)."""
+        errors: List[ValidationError] = []
+        self._validate(document, "", errors)
+        return errors
+
+    def validate_many(self, documents: Iterable[Any]) -> List[List[ValidationError]]:
+        """validate() for a batch of documents, one error list per document."""
+        validate = self._validate
+        results = []
+        for document in documents:
+            errors: List[ValidationError] = []
+            validate(document, "", errors)
+            results.append(errors)
+        return results
+
+
+def compile_schema(schema: Dict[str, Any]) -> CompiledSchema:
+    """Compile a schema (SchemaError if it uses unsupported keywords)."""
+    return CompiledSchema(schema)
+
+
+_contract_validator: Optional[CompiledSchema] = None
+
+
+def contract_validator() -> CompiledSchema:
+    """The compiled contract schema (compiled once per process)."""
+    global _contract_validator
+    if _contract_validator is None:
+        _contract_validator = compile_schema(CONTRACT_SCHEMA)
+    return _contract_validator
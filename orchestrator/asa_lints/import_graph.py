@@ -0,0 +1,806 @@
+"""ASA Linter: Project-wide Import Graph and Symbol Index"""
+import ast
+import hashlib
+import json
+import os
+import tempfile
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .lint_cache import linter_version
+from .slice_context import CONTRACT_FILE, Signature
+
+# Top-level packages whose modules are part of the graph
+INTERNAL_PACKAGES = ("domains", "shared")
+
+SKIPPED_DIRS = {"__pycache__"}
+
+# Per-file parse results kept between runs (inside the lint cache directory)
+PARSE_CACHE_FILE = "symbols.json"
+
+# Symbol table entry of a module with 'from x import *' (any name may exist)
+STAR = "*"
+
+# (base module, imported names, bare) as returned by import_targets
+ImportTarget = Tuple[str, Tuple[str, ...], bool]
+
+
+def is_internal(module: str) -> bool:
+    """Whether a module name belongs to the project (domains.*, shared.*)."""
+    return module.split(".", 1)[0] in INTERNAL_PACKAGES
+
+
+def slice_of(module: str) -> Optional[str]:
+    """Slice package a module belongs to (domains.<d>.slices.<s>), if any."""
+    parts = module.split(".")
+    if len(parts) >= 4 and parts[0] == "domains" and parts[2] == "slices":
+        return ".".join(parts[:4])
+    return None
+
+
+def slice_display_name(slice_module: str) -> str:
+    """'domains.auth.slices.login_demo' -> 'auth/login_demo'."""
+    parts = slice_module.split(".")
+    return f"{parts[1]}/{parts[3]}"
+
+
+def slice_module_name(slice_path: Path) -> Optional[str]:
+    """Package name of a slice directory, based on its domains/ ancestor."""
+    parts = Path(slice_path).absolute().parts
+    if "domains" not in parts:
+        return None
+    index = len(parts) - 1 - parts[::-1].index("domains")
+    return ".".join(parts[index:]) or None
+
+
+def module_for_file(package: str, relative_file: str) -> Tuple[str, str]:
+    """
+    Module name and containing package of a file inside package.
+
+    module_for_file("a.b", "tests/test_x.py") -> ("a.b.tests.test_x", "a.b.tests")
+    module_for_file("a.b", "__init__.py") -> ("a.b", "a.b")
+    """
+    parts = relative_file[:-3].split("/")
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+        module = ".".join([package, *parts]) if parts else package
+        return module, module
+    module = ".".join([package, *parts])
+    return module, module.rsplit(".", 1)[0]
+
+
+def resolve_relative(package: str, level: int, module: Optional[str]) -> Optional[str]:
+    """Absolute name of 'from <level dots><module> import ...' inside package."""
+    parts = package.split(".") if package else []
+    if level - 1 > len(parts):
+        return None
+    base = parts[:len(parts) - (level - 1)]
+    if module:
+        base.append(module)
+    return ".".join(base) or None
+
+
+# Statement fields that hold nested statement blocks
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def iter_statements(tree: ast.AST) -> Iterator[ast.stmt]:
+    """
+    Yield every statement of a module, including nested blocks.
+
+    Imports are always statements, so this visits far fewer nodes than
+    ast.walk, which also descends into every expression.
+    """
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.stmt):
+            yield node
+        for field in _BLOCK_FIELDS:
+            block = getattr(node, field, None)
+            if block:
+                stack.extend(reversed(block))
+
+
+def import_targets(tree: ast.AST, package: Optional[str]) -> Set[ImportTarget]:
+    """
+    Raw import statements of a module as (base module, imported names, bare).
+
+    'import a.b' gives ('a.b', (), False); 'from a import b, c' gives
+    ('a', ('b', 'c'), False); 'from . import b' gives ('<package>', ('b',), True).
+    Relative imports are resolved against package; without a package they
+    are kept as written (e.g. 'schemas'), as the original linter did.
+    """
+    targets: Set[ImportTarget] = set()
+    for node in iter_statements(tree):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            targets.update(node_import_targets(node, package))
+    return targets
+
+
+def node_import_targets(node: ast.stmt, package: Optional[str]) -> List[ImportTarget]:
+    """import_targets of a single Import or ImportFrom statement."""
+    if isinstance(node, ast.Import):
+        return [(alias.name, (), False) for alias in node.names]
+    if not isinstance(node, ast.ImportFrom):
+        return []
+
+    names = tuple(alias.name for alias in node.names if alias.name != "*")
+    if node.level:
+        if package is None:
+            return [(node.module, names, False)] if node.module else []
+        base = resolve_relative(package, node.level, node.module)
+        return [(base, names, node.module is None)] if base else []
+    return [(node.module, names, False)] if node.module else []
+
+
+def module_symbols(tree: ast.Module) -> Set[str]:
+    """
+    Names bound at module level: functions, classes, assignments and
+    imports, including those inside top-level if/try/with blocks.
+    STAR stands for the unknown names of a star import.
+    """
+    symbols: Set[str] = set()
+    stack = list(tree.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            symbols.add(node.name)
+            continue
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, (ast.AnnAssign, ast.AugAssign)):
+            targets = [node.target]
+        elif isinstance(node, ast.Import):
+            symbols.update((alias.asname or alias.name).split(".")[0] for alias in node.names)
+            continue
+        elif isinstance(node, ast.ImportFrom):
+            symbols.update(alias.asname or alias.name for alias in node.names)
+            continue
+        else:
+            # Nested blocks of if/try/with/for still bind module-level names
+            for field in _BLOCK_FIELDS:
+                block = getattr(node, field, None)
+                if block:
+                    stack.extend(block)
+            continue
+        for target in targets:
+            for name_node in ast.walk(target):
+                if isinstance(name_node, ast.Name):
+                    symbols.add(name_node.id)
+    return symbols
+
+
+def imported_symbols(targets: Iterable[ImportTarget]) -> Set[str]:
+    """
+    Qualified internal names a module imports, without resolving whether
+    they are modules: 'from a.b import C' gives 'a.b.C', 'import a.b' gives 'a.b'.
+    """
+    names: Set[str] = set()
+    for base, imported, _ in targets:
+        if not is_internal(base):
+            continue
+        if imported:
+            names.update(f"{base}.{name}" for name in imported)
+        else:
+            names.add(base)
+    return names
+
+
+def contract_exports(data: bytes) -> Optional[FrozenSet[str]]:
+    """public_api.exports of a contract (None if it has no valid list)."""
+    try:
+        contract = json.loads(data)
+    except ValueError:
+        return None
+    public_api = contract.get("public_api") if isinstance(contract, dict) else None
+    exports = public_api.get("exports") if isinstance(public_api, dict) else None
+    if not isinstance(exports, list) or not all(isinstance(name, str) for name in exports):
+        return None
+    return frozenset(exports)
+
+
+def import_names(targets: Iterable[Tuple[str, Tuple[str, ...], bool]]) -> Set[str]:
+    """Imported module names as written (plus submodules of bare 'from . import x')."""
+    names: Set[str] = set()
+    for base, imported, bare in targets:
+        if bare:
+            names.update(f"{base}.{name}" for name in imported)
+        else:
+            names.add(base)
+    return names
+
+
+def _strongly_connected(nodes: Iterable[str], edges: Dict[str, Set[str]]) -> List[List[str]]:
+    """
+    Tarjan's algorithm (iterative). Components are returned in reverse
+    topological order: every component comes after those it can reach.
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+    counter = 0
+
+    for root in nodes:
+        if root in index:
+            continue
+        work = [(root, iter(sorted(edges.get(root, ()))))]
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node, children = work[-1]
+            advanced = False
+            for child in children:
+                if child not in edges and child not in index:
+                    # Not a node of this graph
+                    continue
+                if child not in index:
+                    index[child] = lowlink[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(sorted(edges.get(child, ())))))
+                    advanced = True
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
+
+
+class ParseCache:
+    """
+    Parse results per file (imports, symbols, contract exports) persisted
+    in .asa_cache/symbols.json and reused while a file's (mtime_ns, size)
+    signature is unchanged, so a warm build neither reads nor parses it.
+
+    Entries are tied to the linter version; files not seen by the last
+    build are dropped when it is saved.
+    """
+
+    def __init__(self, cache_dir: Path, root: Path):
+        self.path = Path(cache_dir) / PARSE_CACHE_FILE
+        self._version = linter_version()
+        self._root = str(Path(root).resolve())
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._seen: Set[str] = set()
+        self._dirty = False
+        self.hits = 0
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(data, dict)
+            and data.get("version") == self._version
+            and data.get("root") == self._root
+        ):
+            self._entries = data.get("files", {})
+
+    def get(self, relative: str, signature: Signature) -> Optional[Dict[str, Any]]:
+        """The cached entry of a file if its signature is unchanged."""
+        self._seen.add(relative)
+        entry = self._entries.get(relative)
+        if entry is not None and entry["signature"] == list(signature):
+            self.hits += 1
+            return entry
+        return None
+
+    def put(self, relative: str, signature: Signature, entry: Dict[str, Any]) -> None:
+        entry["signature"] = list(signature)
+        self._entries[relative] = entry
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if it changed; write failures are never fatal."""
+        stale = self._entries.keys() - self._seen
+        if not self._dirty and not stale:
+            return
+        for relative in stale:
+            del self._entries[relative]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"version": self._version, "root": self._root, "files": self._entries}, f)
+                os.replace(tmp_path, self.path)
+            finally:
+                # Only left behind if the write failed
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+        except OSError:
+            return
+        self._dirty = False
+
+
+class ImportGraph:
+    """
+    Module import graph of the whole project, built once per run.
+
+    Every Python file under domains/ and shared/ (including slice tests) is
+    parsed once. Edges point from a module to the internal modules it
+    imports; relative imports are resolved, and 'from pkg import name'
+    points at pkg.name when that is a module. Module resolution is cached.
+
+    Transitive closures follow shared (non-slice) modules but stop at the
+    boundary of other slices, whose own contracts govern what they import.
+
+    The same pass fills a symbol index: the names each module binds at
+    top level, the qualified names it imports, and every slice contract's
+    public_api.exports, so symbol queries are dictionary lookups. With a
+    cache_dir, parse results of unchanged files are reused between runs.
+    """
+
+    def __init__(self, root: Path = Path(".")):
+        self.root = Path(root)
+        self.modules: Dict[str, Path] = {}
+        self.hashes: Dict[str, str] = {}
+        self.imports: Dict[str, Set[str]] = {}
+        self.direct_imports: Dict[str, Set[str]] = {}
+        self.symbols: Dict[str, FrozenSet[str]] = {}
+        self.imported: Dict[str, FrozenSet[str]] = {}
+        self.exports: Dict[str, FrozenSet[str]] = {}
+        self.contract_hashes: Dict[str, str] = {}
+        self._raw: Dict[str, Set[ImportTarget]] = {}
+        self._resolved: Dict[Tuple[str, str], str] = {}
+        self._importers: Optional[Dict[str, Set[str]]] = None
+        self._reach: Optional[Dict[str, Set[str]]] = None
+        self._slice_cycles: Optional[Dict[str, List[str]]] = None
+        self._by_slice: Optional[Dict[str, List[str]]] = None
+        self._exposed: Optional[Dict[str, Set[str]]] = None
+        self.parse_cache: Optional[ParseCache] = None
+
+    @classmethod
+    def build(
+        cls,
+        root: Path = Path("."),
+        cache_dir: Optional[Path] = None,
+        overlay: Optional[Dict[str, bytes]] = None
+    ) -> "ImportGraph":
+        """
+        Parse every module under root's internal packages and link them.
+
+        With cache_dir, unchanged files are served from the parse cache.
+        overlay maps root-relative POSIX paths to contents that take the
+        place of the working tree's files (e.g. a rendered slice that is not
+        written yet); overlaid files never enter the parse cache.
+        """
+        graph = cls(root)
+        if cache_dir is not None:
+            graph.parse_cache = ParseCache(cache_dir, graph.root)
+        for package in INTERNAL_PACKAGES:
+            graph._scan_package(package)
+        if overlay:
+            graph._add_sources(overlay)
+        graph._link()
+        if graph.parse_cache is not None:
+            graph.parse_cache.save()
+        return graph
+
+    @classmethod
+    def from_sources(cls, sources: Dict[str, bytes], root: Path = Path(".")) -> "ImportGraph":
+        """
+        Build the graph from in-memory files instead of the working tree
+        (e.g. blobs staged in the git index).
+
+        sources maps POSIX paths relative to root (e.g. 'shared/utils/x.py')
+        to file contents; paths outside the internal packages are ignored.
+        """
+        graph = cls(root)
+        graph._add_sources(sources)
+        graph._link()
+        return graph
+
+    def _add_sources(self, sources: Dict[str, bytes]) -> None:
+        """Parse in-memory files (root-relative POSIX path -> bytes), replacing scanned ones."""
+        for relative in sorted(sources):
+            directory, _, filename = relative.rpartition("/")
+            if directory.split("/")[0] not in INTERNAL_PACKAGES:
+                continue
+            dir_package = directory.replace("/", ".")
+            if filename == CONTRACT_FILE:
+                self._add_contract(dir_package, sources[relative])
+            elif filename.endswith(".py"):
+                self._add_module(dir_package, filename, self.root / relative, sources[relative])
+
+    def _link(self) -> None:
+        """Resolve the parsed import targets into edges between modules."""
+        for module, raw in self._raw.items():
+            self.imports[module] = self._edges(raw)
+        self._raw.clear()
+
+    def _edges(self, raw: Set[ImportTarget]) -> Set[str]:
+        return {
+            self._resolve(base, name)
+            for base, names, _ in raw
+            for name in (names or ("",))
+            if is_internal(base)
+        }
+
+    def update_module(self, module: str, data: bytes) -> bool:
+        """
+        Re-parse one known module whose source changed, in place.
+
+        Returns False when the graph cannot be patched (unknown module or a
+        syntax error) and should be rebuilt instead.
+        """
+        file_path = self.modules.get(module)
+        if file_path is None:
+            return False
+        digest = hashlib.sha256(data).hexdigest()
+        if self.hashes[module] == digest:
+            return True
+
+        try:
+            tree = ast.parse(data, filename=str(file_path))
+        except (SyntaxError, ValueError):
+            return False
+        containing = module if file_path.name == "__init__.py" else module.rpartition(".")[0]
+        raw = import_targets(tree, containing)
+
+        self.hashes[module] = digest
+        self.direct_imports[module] = import_names(raw)
+        self.imports[module] = self._edges(raw)
+        self.symbols[module] = frozenset(module_symbols(tree))
+        self.imported[module] = frozenset(imported_symbols(raw))
+        # Derived views are recomputed on the next query
+        self._importers = None
+        self._reach = None
+        self._slice_cycles = None
+        return True
+
+    def direct_imports_if_current(self, module: str, data: bytes) -> Optional[Set[str]]:
+        """Import names of module as parsed by the graph, if data is unchanged."""
+        digest = self.hashes.get(module)
+        if digest is None or digest != hashlib.sha256(data).hexdigest():
+            return None
+        return self.direct_imports[module]
+
+    def symbols_if_current(self, module: str, data: bytes) -> Optional[Tuple[FrozenSet[str], FrozenSet[str]]]:
+        """(top-level symbols, imported names) of module as parsed by the graph, if data is unchanged."""
+        digest = self.hashes.get(module)
+        if digest is None or digest != hashlib.sha256(data).hexdigest():
+            return None
+        return self.symbols[module], self.imported[module]
+
+    def _scan_package(self, package: str) -> None:
+        package_dir = self.root / package
+        for directory, subdirs, files in os.walk(package_dir):
+            subdirs[:] = [
+                d for d in subdirs
+                if d not in SKIPPED_DIRS and not d.startswith(".")
+            ]
+            relative = Path(directory).relative_to(self.root).as_posix()
+            dir_package = relative.replace("/", ".")
+            for filename in files:
+                if filename.endswith(".py"):
+                    self._scan_file(dir_package, filename, Path(directory) / filename, f"{relative}/{filename}")
+                elif filename == CONTRACT_FILE and slice_of(dir_package) == dir_package:
+                    self._scan_contract(dir_package, Path(directory) / filename, f"{relative}/{filename}")
+
+    def _read(self, file_path: Path, relative: str) -> Tuple[Optional[Dict[str, Any]], Optional[Signature], Optional[bytes]]:
+        """(cached entry, signature, None) for an unchanged file, else (None, signature, bytes)."""
+        signature = None
+        if self.parse_cache is not None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return None, None, None
+            signature = (st.st_mtime_ns, st.st_size)
+            entry = self.parse_cache.get(relative, signature)
+            if entry is not None:
+                return entry, signature, None
+        try:
+            return None, signature, file_path.read_bytes()
+        except OSError:
+            return None, signature, None
+
+    def _scan_file(self, dir_package: str, filename: str, file_path: Path, relative: str) -> None:
+        entry, signature, data = self._read(file_path, relative)
+        if entry is not None:
+            cached_module, _ = module_for_file(dir_package, filename)
+            if entry["hash"] is not None:
+                raw = {(base, tuple(names), bare) for base, names, bare in entry["imports"]}
+                self._record(cached_module, file_path, entry["hash"], raw, set(entry["symbols"]))
+            return
+        if data is None:
+            return
+        module = self._add_module(dir_package, filename, file_path, data)
+        if self.parse_cache is not None and signature is not None:
+            if module is None:
+                # Syntax error: remembered so it is not re-parsed until it changes
+                self.parse_cache.put(relative, signature, {"hash": None})
+            else:
+                self.parse_cache.put(relative, signature, {
+                    "hash": self.hashes[module],
+                    "imports": sorted([base, list(names), bare] for base, names, bare in self._raw[module]),
+                    "symbols": sorted(self.symbols[module]),
+                })
+
+    def _scan_contract(self, slice_module: str, file_path: Path, relative: str) -> None:
+        entry, signature, data = self._read(file_path, relative)
+        if entry is not None:
+            self.contract_hashes[slice_module] = entry["hash"]
+            if entry["exports"] is not None:
+                self.exports[slice_module] = frozenset(entry["exports"])
+            return
+        if data is None:
+            return
+        self._add_contract(slice_module, data)
+        if self.parse_cache is not None and signature is not None:
+            exports = self.exports.get(slice_module)
+            self.parse_cache.put(relative, signature, {
+                "hash": self.contract_hashes[slice_module],
+                "exports": None if exports is None else sorted(exports),
+            })
+
+    def _add_module(self, dir_package: str, filename: str, file_path: Path, data: bytes) -> Optional[str]:
+        """Parse one module and record its (unresolved) imports; returns its name."""
+        module, containing = module_for_file(dir_package, filename)
+        try:
+            tree = ast.parse(data, filename=str(file_path))
+        except (SyntaxError, ValueError):
+            return None
+        self._record(
+            module,
+            file_path,
+            hashlib.sha256(data).hexdigest(),
+            import_targets(tree, containing),
+            module_symbols(tree)
+        )
+        return module
+
+    def _record(self, module: str, file_path: Path, digest: str, raw: Set[ImportTarget], symbols: Set[str]) -> None:
+        self.modules[module] = file_path
+        self.hashes[module] = digest
+        self._raw[module] = raw
+        self.direct_imports[module] = import_names(raw)
+        self.symbols[module] = frozenset(symbols)
+        self.imported[module] = frozenset(imported_symbols(raw))
+
+    def _add_contract(self, slice_module: str, data: bytes) -> None:
+        """Record a slice contract's exports (and hash, for fingerprints)."""
+        self.contract_hashes[slice_module] = hashlib.sha256(data).hexdigest()
+        exports = contract_exports(data)
+        if exports is not None:
+            self.exports[slice_module] = exports
+        else:
+            # An overlaid contract replaces the scanned one entirely
+            self.exports.pop(slice_module, None)
+
+    def _resolve(self, base: str, name: str) -> str:
+        """'from base import name' -> base.name if that is a module, else base."""
+        key = (base, name)
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            candidate = f"{base}.{name}" if name else base
+            resolved = candidate if candidate in self.modules else base
+            self._resolved[key] = resolved
+        return resolved
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def has_symbol(self, name: str) -> bool:
+        """Whether name is a module, or a name bound at the top level of one."""
+        if name in self.modules:
+            return True
+        module, _, symbol = name.rpartition(".")
+        symbols = self.symbols.get(module)
+        return symbols is not None and (symbol in symbols or STAR in symbols)
+
+    def is_exported(self, name: str) -> Optional[bool]:
+        """
+        Whether other slices may import name: it is listed in its slice's
+        public_api.exports, is a package/module containing an export, or
+        re-exports one (e.g. 'from .handler import router' in the slice's
+        __init__.py exposes <slice>.router). None if name is not in a slice
+        whose contract lists exports.
+        """
+        owner = slice_of(name)
+        if owner is None or owner not in self.exports:
+            return None
+        if self._exposed is None:
+            exposed: Dict[str, Set[str]] = {}
+            for slice_module, exports in self.exports.items():
+                names = exposed.setdefault(slice_module, set())
+                for export in exports:
+                    parts = export.split(".")
+                    names.update(".".join(parts[:end]) for end in range(4, len(parts) + 1))
+            self._exposed = exposed
+        exposed_names = self._exposed[owner]
+        return name in exposed_names or self._reexported(name, owner, exposed_names, set())
+
+    def _reexported(self, name: str, owner: str, exposed_names: Set[str], seen: Set[str]) -> bool:
+        """
+        Whether name is module.symbol where module binds symbol by importing
+        an exported name of the same slice (aliases are not followed).
+        """
+        module, _, symbol = name.rpartition(".")
+        for source in sorted(self.imported.get(module, ())):
+            if source in seen or source.rpartition(".")[2] != symbol or slice_of(source) != owner:
+                continue
+            seen.add(source)
+            if source in exposed_names or self._reexported(source, owner, exposed_names, seen):
+                return True
+        return False
+
+    def slice_modules(self, slice_module: str) -> List[str]:
+        """All modules of a slice (including its tests)."""
+        if self._by_slice is None:
+            self._by_slice = {}
+            for module in sorted(self.modules):
+                owner = slice_of(module)
+                if owner is not None:
+                    self._by_slice.setdefault(owner, []).append(module)
+        return self._by_slice.get(slice_module, [])
+
+    def importers(self, module: str, transitive: bool = False) -> Set[str]:
+        """Modules importing module (directly, or through any chain)."""
+        if self._importers is None:
+            self._importers = {}
+            for source, targets in self.imports.items():
+                for target in targets:
+                    self._importers.setdefault(target, set()).add(source)
+
+        found: Set[str] = set()
+        queue = deque([module])
+        while queue:
+            for importer in self._importers.get(queue.popleft(), ()):
+                if importer not in found:
+                    found.add(importer)
+                    if transitive:
+                        queue.append(importer)
+        found.discard(module)
+        return found
+
+    def _shared_reach(self) -> Dict[str, Set[str]]:
+        """Everything reachable from each non-slice module (memoized per SCC)."""
+        if self._reach is None:
+            edges = {
+                module: targets for module, targets in self.imports.items()
+                if slice_of(module) is None
+            }
+            reach: Dict[str, Set[str]] = {}
+            for component in _strongly_connected(sorted(edges), edges):
+                members = set(component)
+                combined: Set[str] = set()
+                for member in component:
+                    for target in edges[member]:
+                        combined.add(target)
+                        if target in reach and target not in members:
+                            combined |= reach[target]
+                for member in component:
+                    reach[member] = combined
+            self._reach = reach
+        return self._reach
+
+    def closure(self, slice_module: str) -> Set[str]:
+        """Internal modules a slice depends on, directly or transitively."""
+        reach = self._shared_reach()
+        own = set(self.slice_modules(slice_module))
+        found: Set[str] = set()
+        queue = deque(own)
+        visited = set(own)
+        while queue:
+            for target in self.imports.get(queue.popleft(), ()):
+                found.add(target)
+                if target in reach:
+                    found |= reach[target]
+                if target in own and target not in visited:
+                    visited.add(target)
+                    queue.append(target)
+        return found
+
+    def import_chain(self, slice_module: str, target: str) -> List[str]:
+        """Shortest import chain from a slice's modules to target."""
+        own = set(self.slice_modules(slice_module))
+        parents: Dict[str, Optional[str]] = {module: None for module in own}
+        queue = deque(sorted(own))
+        while queue:
+            module = queue.popleft()
+            for child in sorted(self.imports.get(module, ())):
+                if child in parents:
+                    continue
+                parents[child] = module
+                if child == target:
+                    chain = [child]
+                    parent = parents[child]
+                    while parent is not None:
+                        chain.append(parent)
+                        parent = parents[parent]
+                    return chain[::-1]
+                other_slice = slice_of(child)
+                if other_slice is None or other_slice == slice_module:
+                    queue.append(child)
+        return []
+
+    def slice_cycles(self) -> Dict[str, List[str]]:
+        """
+        Import cycles between slices: slice -> cycle path through it
+        (e.g. [a, b, a]) for every slice in a cycle.
+        """
+        if self._slice_cycles is None:
+            edges: Dict[str, Set[str]] = {}
+            for module, targets in self.imports.items():
+                source = slice_of(module)
+                if source is None:
+                    continue
+                edges.setdefault(source, set())
+                for target in targets:
+                    target_slice = slice_of(target)
+                    if target_slice and target_slice != source:
+                        edges[source].add(target_slice)
+
+            cycles: Dict[str, List[str]] = {}
+            for component in _strongly_connected(sorted(edges), edges):
+                if len(component) < 2:
+                    continue
+                members = set(component)
+                for start in sorted(members):
+                    cycles[start] = self._cycle_through(start, members, edges)
+            self._slice_cycles = cycles
+        return self._slice_cycles
+
+    @staticmethod
+    def _cycle_through(start: str, members: Set[str], edges: Dict[str, Set[str]]) -> List[str]:
+        """Shortest cycle start -> ... -> start within one component."""
+        parents: Dict[str, str] = {}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for child in sorted(edges.get(node, set()) & members):
+                if child == start:
+                    path = [start, node]
+                    while path[-1] != start:
+                        path.append(parents[path[-1]])
+                    return path[::-1]
+                if child not in parents:
+                    parents[child] = node
+                    queue.append(child)
+        return [start]
+
+    def slice_fingerprint(self, slice_module: str) -> str:
+        """Hash of every module a slice's import check depends on."""
+        h = hashlib.sha256()
+        for module in sorted(set(self.slice_modules(slice_module)) | self.closure(slice_module)):
+            h.update(module.encode())
+            h.update(self.hashes.get(module, "-").encode())
+        for member in self.slice_cycles().get(slice_module, ()):
+            h.update(b"cycle:" + member.encode())
+        # Contracts of other slices it imports from decide what it may import
+        imported_slices = {
+            other
+            for module in self.slice_modules(slice_module)
+            for other in map(slice_of, self.imported.get(module, ()))
+            if other is not None
+        }
+        for other in sorted(imported_slices - {slice_module}):
+            h.update(b"contract:" + other.encode())
+            h.update(self.contract_hashes.get(other, "-").encode())
+        return h.hexdigest()
@@ -0,0 +1,102 @@
+"""ASA Linter: Incremental Lint Cache"""
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+from ..paths import CACHE_DIR
+from .slice_context import SliceContext
+
+CACHE_SUBDIR = "lint"
+
+
+@lru_cache(maxsize=1)
+def linter_version() -> str:
+    """
+    Hash of the linter source code.
+
+    Any change to a module in asa_lints (or a Python upgrade) produces a new
+    version, so cached results from older linter code are never replayed.
+    """
+    h = hashlib.sha256()
+    h.update(f"{sys.version_info[0]}.{sys.version_info[1]}".encode())
+    package_dir = Path(__file__).parent
+    for source in sorted(package_dir.glob("*.py")):
+        h.update(source.name.encode())
+        h.update(source.read_bytes())
+    return h.hexdigest()
+
+
+def slice_cache_key(ctx: SliceContext, extra: str = "") -> str:
+    """
+    Cache key for a slice: linter version, slice path and the content
+    hashes of every file in the slice (including its contract).
+
+    extra covers inputs outside the slice (e.g. the fingerprint of the
+    modules it imports transitively).
+    """
+    h = hashlib.sha256()
+    h.update(linter_version().encode())
+    h.update(b"\0")
+    h.update(str(ctx.path).encode())
+    h.update(b"\0")
+    h.update(extra.encode())
+    for name in sorted(ctx.files):
+        data = ctx.read_bytes(name) or b""
+        h.update(b"\0")
+        h.update(name.encode())
+        h.update(hashlib.sha256(data).digest())
+    return h.hexdigest()
+
+
+class LintCache:
+    """
+    On-disk store of run_asa_checks results keyed by slice_cache_key.
+
+    Entries are written atomically (temp file + rename), so concurrent
+    lint-all workers never read a half-written entry.
+    """
+
+    def __init__(self, cache_dir: Path = CACHE_DIR):
+        self.cache_dir = Path(cache_dir) / CACHE_SUBDIR
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return cached results for key (None on miss or unreadable entry)."""
+        try:
+            with open(self._entry_path(key), "r") as f:
+                results: Dict = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return results
+
+    def put(self, key: str, results: Dict) -> None:
+        """Store results for key; cache write failures are never fatal."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(results, f)
+                os.replace(tmp_path, self._entry_path(key))
+            finally:
+                # Only left behind if the write failed
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+        except OSError:
+            pass
+
+    def clear(self) -> int:
+        """Remove all cached entries, returning how many were removed."""
+        removed = 0
+        if self.cache_dir.is_dir():
+            for entry in self.cache_dir.glob("*.json"):
+                entry.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
@@ -1,80 +1,176 @@
 """ASA Linter: Contract Imports Validator"""
 import ast
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Set
+from typing import Dict, Iterable, List, Optional, Tuple, Set, Union
 import fnmatch
+from .slice_context import SliceContext
+from .import_graph import (
+    ImportGraph,
+    import_names,
+    import_targets,
+    is_internal,
+    module_for_file,
+    slice_display_name,
+    slice_module_name,
+)
+from .rule_engine import analyze
+
+# Check inputs of the imports and public_api checks: every Python file of
+# the slice, __init__.py and tests/ included (fnmatch "*" also matches "/")
+IMPORT_CHECKED_FILES = ["*.py"]
 
 def extract_imports(file_path: Path) -> Set[str]:
     """Extract all imports from a Python file using AST."""
     if not file_path.exists():
         return set()
 
-    imports = set()
-
     try:
         with open(file_path, "r") as f:
             tree = ast.parse(f.read())
+    except (SyntaxError, OSError, UnicodeDecodeError):
+        return set()
+
+    return imports_from_tree(tree)
+
+def imports_from_tree(tree: ast.AST, package: Optional[str] = None) -> Set[str]:
+    """
+    Extract all imports from an already parsed AST.
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.add(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.add(node.module)
-    except:
-        pass
+    If package is given, relative imports are resolved against it
+    ('from .schemas import X' -> '<package>.schemas').
+    """
+    return import_names(import_targets(tree, package))
 
-    return imports
+class ImportMatcher:
+    """
+    A contract's allowed_imports patterns compiled into one regex.
+
+    Matches exactly what the per-pattern loop did: an import is allowed if
+    it fnmatch-es a pattern, or starts with the pattern minus its '.*'
+    parts. Results are memoized, since the same imports recur across the
+    files of a slice.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        alternatives = []
+        for pattern in dict.fromkeys(patterns):
+            prefix = pattern.replace(".*", "")
+            alternatives.append(re.escape(prefix))
+            # The prefix test already covers literal patterns and a plain
+            # trailing '.*'; only real globs need the fnmatch translation
+            body = pattern[:-2] if pattern.endswith(".*") else pattern
+            if body != prefix or any(c in body for c in "*?["):
+                alternatives.append(fnmatch.translate(pattern))
+        self._match = re.compile("|".join(alternatives)).match if alternatives else None
+        self._memo: Dict[str, bool] = {}
+
+    def __call__(self, import_name: str) -> bool:
+        allowed = self._memo.get(import_name)
+        if allowed is None:
+            allowed = self._match is not None and self._match(import_name) is not None
+            self._memo[import_name] = allowed
+        return allowed
+
+@lru_cache(maxsize=1024)
+def compile_allowed_imports(patterns: Tuple[str, ...]) -> ImportMatcher:
+    """Compile (and cache) the matcher for a tuple of allowed_imports patterns."""
+    return ImportMatcher(patterns)
 
 def is_allowed_import(import_name: str, allowed_patterns: List[str]) -> bool:
     """Check if import matches any allowed pattern (glob-style)."""
-    for pattern in allowed_patterns:
-        # Convert glob pattern to match
-        if fnmatch.fnmatch(import_name, pattern):
-            return True
-        # Also check if import starts with pattern (for submodules)
-        if import_name.startswith(pattern.replace(".*", "")):
-            return True
-    return False
-
-def lint_contract_imports(slice_path: Path) -> Tuple[bool, List[str]]:
-    """Validate imports against allowed_imports in contract."""
+    return compile_allowed_imports(tuple(allowed_patterns))(import_name)
+
+def lint_contract_imports(
+    slice_path: Union[Path, SliceContext],
+    graph: Optional[ImportGraph] = None
+) -> Tuple[bool, List[str]]:
+    """
+    Validate imports against allowed_imports in contract.
+
+    Every Python file of the slice (including tests/) is checked, with
+    relative imports resolved. With a project ImportGraph, the transitive
+    closure of the slice's imports is checked too, and import cycles
+    between slices are reported.
+    """
     errors = []
+    ctx = SliceContext.of(slice_path)
 
-    # Load contract
-    contract_path = slice_path / "slice.contract.json"
-    if not contract_path.exists():
+    # Load contract (parsed once per slice by the context)
+    if not ctx.has_file("slice.contract.json"):
         return False, ["slice.contract.json not found"]
 
-    try:
-        import json
-        with open(contract_path, "r") as f:
-            contract = json.load(f)
-        allowed_imports = contract.get("allowed_imports", [])
-    except:
+    contract = ctx.contract
+    if not isinstance(contract, dict):
         return False, ["Failed to load contract.json"]
+    allowed_imports = contract.get("allowed_imports", [])
+    if not isinstance(allowed_imports, list) or not all(
+        isinstance(pattern, str) for pattern in allowed_imports
+    ):
+        return False, ["allowed_imports must be a list of strings"]
+    is_allowed = compile_allowed_imports(tuple(allowed_imports))
+
+    # Check direct imports of every Python file
+    slice_module = slice_module_name(ctx.path)
+    direct_imports = set()
+
+    for filename in sorted(name for name in ctx.files if name.endswith(".py")):
+        imports = None
+        module, package = module_for_file(slice_module, filename) if slice_module else (None, None)
+
+        # Reuse what the project graph already parsed when the file is unchanged
+        if graph is not None and module is not None:
+            imports = graph.direct_imports_if_current(module, ctx.read_bytes(filename) or b"")
 
-    # Check Python files
-    python_files = ["handler.py", "service.py", "repository.py", "schemas.py"]
+        if imports is None:
+            # Collected by the rule engine pass shared with the code rules
+            analysis = analyze(ctx, filename)
+            if analysis is None:
+                continue
+            imports = import_names(analysis.results["imports"])
 
-    for filename in python_files:
-        file_path = slice_path / filename
-        if file_path.exists():
-            imports = extract_imports(file_path)
+        # Filter internal imports (domains.*, shared.*)
+        internal_imports = {imp for imp in imports if is_internal(imp) and "." in imp}
+        direct_imports |= internal_imports
 
-            # Filter internal imports (domains.*, shared.*)
-            internal_imports = {
-                imp for imp in imports
-                if imp.startswith("domains.") or imp.startswith("shared.")
-            }
+        # Check each internal import
+        for imp in sorted(internal_imports):
+            if not is_allowed(imp):
+                errors.append(
+                    f"{filename}: Unauthorized import '{imp}' "
+                    f"(not in allowed_imports)"
+                )
 
-            # Check each internal import
-            for imp in internal_imports:
-                if not is_allowed_import(imp, allowed_imports):
-                    errors.append(
-                        f"{filename}: Unauthorized import '{imp}' "
-                        f"(not in allowed_imports)"
-                    )
+    if graph is not None and slice_module:
+        errors.extend(_check_transitive(graph, slice_module, is_allowed, direct_imports))
 
     return len(errors) == 0, errors
+
+def _check_transitive(
+    graph: ImportGraph,
+    slice_module: str,
+    is_allowed: ImportMatcher,
+    direct_imports: Set[str]
+) -> List[str]:
+    """Check the slice's transitive dependencies and cross-slice cycles."""
+    errors = []
+
+    for module in sorted(graph.closure(slice_module)):
+        if module in direct_imports or "." not in module:
+            continue
+        if not is_allowed(module):
+            chain = " -> ".join(graph.import_chain(slice_module, module))
+            errors.append(
+                f"Unauthorized transitive import '{module}' "
+                f"(not in allowed_imports, via {chain})"
+            )
+
+    cycle = graph.slice_cycles().get(slice_module)
+    if cycle:
+        errors.append(
+            "Import cycle across slices: "
+            + " -> ".join(slice_display_name(member) for member in cycle)
+        )
+
+    return errors
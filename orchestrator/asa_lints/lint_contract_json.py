@@ -1,60 +1,23 @@
 """ASA Linter: Contract JSON Validator"""
-import json
 from pathlib import Path
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Union
+from .contract_schema import CONTRACT_SCHEMA, contract_validator
+from .slice_context import SliceContext
 
-REQUIRED_FIELDS = [
-    "slice_name",
-    "version",
-    "domain",
-    "allowed_imports",
-    "public_api",
-    "dependencies",
-]
+REQUIRED_FIELDS = CONTRACT_SCHEMA["required"]
 
-def lint_contract_json(slice_path: Path) -> Tuple[bool, List[str]]:
-    """Validate slice.contract.json structure."""
-    errors = []
-    contract_path = slice_path / "slice.contract.json"
+def lint_contract_json(slice_path: Union[Path, SliceContext]) -> Tuple[bool, List[str]]:
+    """
+    Validate slice.contract.json against CONTRACT_SCHEMA.
 
-    if not contract_path.exists():
-        return False, ["slice.contract.json not found"]
+    Errors are prefixed with the JSON pointer of the offending value,
+    e.g. "#/public_api/exports/1: must be a string, not integer".
+    """
+    ctx = SliceContext.of(slice_path)
 
-    # Load JSON
-    try:
-        with open(contract_path, "r") as f:
-            contract: Dict[str, Any] = json.load(f)
-    except json.JSONDecodeError as e:
-        return False, [f"Invalid JSON: {str(e)}"]
-
-    # Check required fields
-    for field in REQUIRED_FIELDS:
-        if field not in contract:
-            errors.append(f"Missing required field: {field}")
-
-    # Validate field types
-    if "slice_name" in contract and not isinstance(contract["slice_name"], str):
-        errors.append("slice_name must be a string")
-
-    if "version" in contract and not isinstance(contract["version"], str):
-        errors.append("version must be a string")
-
-    if "domain" in contract and not isinstance(contract["domain"], str):
-        errors.append("domain must be a string")
-
-    if "allowed_imports" in contract and not isinstance(contract["allowed_imports"], list):
-        errors.append("allowed_imports must be a list")
-
-    if "public_api" in contract and not isinstance(contract["public_api"], dict):
-        errors.append("public_api must be an object")
-
-    if "dependencies" in contract and not isinstance(contract["dependencies"], dict):
-        errors.append("dependencies must be an object")
-
-    # Validate public_api structure
-    if "public_api" in contract and isinstance(contract["public_api"], dict):
-        public_api = contract["public_api"]
-        if "exports" in public_api and not isinstance(public_api["exports"], list):
-            errors.append("public_api.exports must be a list")
+    # Load JSON (parsed once per slice by the context)
+    if ctx.contract_error:
+        return False, [ctx.contract_error]
 
+    errors = [str(error) for error in contract_validator().validate(ctx.contract)]
     return len(errors) == 0, errors
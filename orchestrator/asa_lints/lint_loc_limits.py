@@ -1,7 +1,7 @@
 """ASA Linter: LOC Limits Checker"""
-import json
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, Union
+from .slice_context import SliceContext
 
 DEFAULT_LOC_PER_FILE = 350
 DEFAULT_LOC_TOTAL = 600
@@ -13,35 +13,34 @@ def count_loc(file_path: Path) -> int:
     if not file_path.exists():
         return 0
 
-    loc = 0
     with open(file_path, "r") as f:
-        for line in f:
-            stripped = line.strip()
-            # Skip empty lines and comments
-            if stripped and not stripped.startswith("#"):
-                loc += 1
+        return count_loc_text(f.read())
+
+def count_loc_text(text: str) -> int:
+    """Count lines of code in source text (excluding empty lines and comments)."""
+    loc = 0
+    for line in text.splitlines():
+        stripped = line.strip()
+        # Skip empty lines and comments
+        if stripped and not stripped.startswith("#"):
+            loc += 1
     return loc
 
-def get_custom_limits(slice_path: Path) -> Optional[Dict]:
+def get_custom_limits(slice_path: Union[Path, SliceContext]) -> Optional[Dict]:
     """Get custom LOC limits from contract.json if specified."""
-    contract_path = slice_path / "slice.contract.json"
-    if not contract_path.exists():
-        return None
-
-    try:
-        with open(contract_path, "r") as f:
-            contract = json.load(f)
-        return contract.get("loc_limits")
-    except:
+    contract = SliceContext.of(slice_path).contract
+    if not isinstance(contract, dict):
         return None
+    return contract.get("loc_limits")
 
-def lint_loc_limits(slice_path: Path) -> Tuple[bool, List[str]]:
-    """Check LOC limits for slice files."""
+def check_loc_limits(slice_path: Union[Path, SliceContext]) -> Tuple[List[str], List[str]]:
+    """Check LOC limits for slice files, returning (errors, warnings)."""
     errors = []
     warnings = []
+    ctx = SliceContext.of(slice_path)
 
     # Get custom limits if any
-    custom_limits = get_custom_limits(slice_path)
+    custom_limits = get_custom_limits(ctx)
 
     if custom_limits:
         max_per_file = custom_limits.get("per_file", DEFAULT_LOC_PER_FILE)
@@ -57,9 +56,9 @@ def lint_loc_limits(slice_path: Path) -> Tuple[bool, List[str]]:
     # Check each file
     total_loc = 0
     for filename in FILES_TO_CHECK:
-        file_path = slice_path / filename
-        if file_path.exists():
-            loc = count_loc(file_path)
+        text = ctx.read_text(filename)
+        if text is not None:
+            loc = count_loc_text(text)
             total_loc += loc
 
             if loc > max_per_file:
@@ -85,6 +84,12 @@ def lint_loc_limits(slice_path: Path) -> Tuple[bool, List[str]]:
                 f"❌ Total: {total_loc} LOC exceeds limit of {max_total}"
             )
 
+    return errors, warnings
+
+def lint_loc_limits(slice_path: Union[Path, SliceContext]) -> Tuple[bool, List[str]]:
+    """Check LOC limits for slice files."""
+    errors, warnings = check_loc_limits(slice_path)
+
     # Print warnings
     for warning in warnings:
         print(warning)
@@ -0,0 +1,164 @@
+"""ASA Linter: Performance Anti-patterns and Budgets"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from .slice_context import SliceContext
+from .lint_cache import CACHE_DIR
+from .lint_loc_limits import FILES_TO_CHECK
+from .import_graph import slice_module_name
+from .rule_engine import analyze_files
+
+# Benchmark results written by 'asa bench-slice', one JSON file per slice
+BENCH_SUBDIR = "bench"
+
+# Budget field -> (measured field, unit, True if the measurement must not exceed it)
+BUDGETS = {
+    "p99_ms": ("p99_ms", "ms", True),
+    "min_rps": ("rps", "req/s", False),
+    "max_memory_growth_kb": ("memory_growth_kb", "KiB", True),
+}
+
+# Performance rules run on each file
+FILE_RULES = {
+    "handler.py": ("async_blocking",),
+    "service.py": ("async_blocking",),
+    "repository.py": ("async_blocking", "linear_scan"),
+}
+
+PERFORMANCE_FILES = sorted(FILE_RULES)
+
+def get_overrides(slice_path: Union[Path, SliceContext]) -> Dict[Tuple[str, str], str]:
+    """
+    Allowed findings from the contract's performance_overrides:
+    (rule, function) -> justification.
+    """
+    contract = SliceContext.of(slice_path).contract
+    if not isinstance(contract, dict) or not isinstance(contract.get("performance_overrides"), list):
+        return {}
+    overrides: Dict[Tuple[str, str], str] = {}
+    for override in contract["performance_overrides"]:
+        if not isinstance(override, dict) or not override.get("justification"):
+            continue
+        rule, function = override.get("rule"), override.get("function")
+        if isinstance(rule, str) and isinstance(function, str):
+            overrides[(rule, function)] = override["justification"]
+    return overrides
+
+def check_performance(slice_path: Union[Path, SliceContext]) -> Tuple[List[str], List[str]]:
+    """
+    Find blocking calls inside async functions and linear scans in
+    repositories, returning (errors, warnings). Findings allow-listed in
+    the contract are warnings that carry the justification.
+    """
+    errors = []
+    warnings = []
+    ctx = SliceContext.of(slice_path)
+    overrides = get_overrides(ctx)
+
+    findings = analyze_files(ctx, FILE_RULES)
+    for finding in sorted(findings, key=lambda f: (f.filename, f.line)):
+        justification = overrides.get((finding.rule, finding.scope))
+        if justification:
+            warnings.append(f"⚠️ {finding} - Override specified: {justification}")
+        else:
+            errors.append(f"❌ {finding}")
+
+    return errors, warnings
+
+def bench_results_path(slice_path: Path, cache_dir: Path = CACHE_DIR) -> Path:
+    """Where 'asa bench-slice' stores the results of a slice."""
+    name = slice_module_name(Path(slice_path)) or hashlib.sha256(
+        str(Path(slice_path).absolute()).encode()
+    ).hexdigest()[:16]
+    return Path(cache_dir) / BENCH_SUBDIR / f"{name}.json"
+
+def source_hash(slice_path: Union[Path, SliceContext]) -> str:
+    """Hash of the slice's source files (benchmark results go stale when it changes)."""
+    ctx = SliceContext.of(slice_path)
+    h = hashlib.sha256()
+    for name in FILES_TO_CHECK:
+        h.update(name.encode())
+        h.update(hashlib.sha256(ctx.read_bytes(name) or b"").digest())
+    return h.hexdigest()
+
+def get_budgets(slice_path: Union[Path, SliceContext]) -> Dict[str, Dict[str, Any]]:
+    """The contract's performance block: endpoint -> budgets (and sample request)."""
+    contract = SliceContext.of(slice_path).contract
+    if not isinstance(contract, dict) or not isinstance(contract.get("performance"), dict):
+        return {}
+    return {
+        endpoint: budget for endpoint, budget in contract["performance"].items()
+        if isinstance(budget, dict)
+    }
+
+def load_bench_results(slice_path: Path, cache_dir: Path = CACHE_DIR) -> Optional[Dict[str, Any]]:
+    try:
+        with open(bench_results_path(slice_path, cache_dir), "r") as f:
+            results = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return results if isinstance(results, dict) else None
+
+def budget_violations(endpoint: str, budget: Dict[str, Any], measured: Dict[str, Any]) -> List[str]:
+    """Budget violations of one endpoint's measurements."""
+    violations = []
+    expected_status = budget.get("expect_status", 200)
+    unexpected = {
+        status: count for status, count in measured.get("status_codes", {}).items()
+        if int(status) != expected_status
+    }
+    if unexpected:
+        violations.append(
+            f"{endpoint}: unexpected responses {unexpected} (expected {expected_status}); "
+            f"check performance.request in the contract"
+        )
+    for field, (measured_field, unit, is_maximum) in BUDGETS.items():
+        if field not in budget or measured.get(measured_field) is None:
+            continue
+        limit, value = budget[field], measured[measured_field]
+        if (value > limit) if is_maximum else (value < limit):
+            relation = "exceeds" if is_maximum else "below"
+            violations.append(
+                f"{endpoint}: {measured_field} {value:.1f} {unit} {relation} budget of {limit} {unit}"
+            )
+    return violations
+
+def check_budgets(
+    slice_path: Union[Path, SliceContext],
+    cache_dir: Path = CACHE_DIR
+) -> Tuple[List[str], List[str]]:
+    """
+    Compare the last 'asa bench-slice' results with the contract's
+    performance budgets, returning (errors, warnings). Stale results
+    (sources changed since the run) are warnings; a slice that was never
+    benchmarked has nothing to compare.
+    """
+    ctx = SliceContext.of(slice_path)
+    budgets = get_budgets(ctx)
+    if not budgets:
+        return [], []
+
+    results = load_bench_results(ctx.path, cache_dir)
+    if results is None:
+        return [], []
+    if results.get("source_hash") != source_hash(ctx):
+        return [], [f"⚠️ Benchmark results are stale (slice changed); run 'asa bench-slice {ctx.path}'"]
+
+    errors: List[str] = []
+    warnings: List[str] = []
+    for endpoint, budget in budgets.items():
+        measured = results.get("endpoints", {}).get(endpoint)
+        if measured is None:
+            warnings.append(f"⚠️ {endpoint}: not benchmarked")
+            continue
+        errors.extend(f"❌ {violation}" for violation in budget_violations(endpoint, budget, measured))
+    return errors, warnings
+
+def results_fingerprint(slice_path: Path, cache_dir: Path = CACHE_DIR) -> str:
+    """Hash of the stored benchmark results (part of the lint cache key)."""
+    try:
+        data = bench_results_path(slice_path, cache_dir).read_bytes()
+    except OSError:
+        return "-"
+    return hashlib.sha256(data).hexdigest()
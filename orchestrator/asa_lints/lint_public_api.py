@@ -0,0 +1,104 @@
+"""ASA Linter: Public API Validator"""
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
+from .slice_context import SliceContext
+from .import_graph import (
+    ImportGraph,
+    STAR,
+    import_targets,
+    imported_symbols,
+    module_for_file,
+    module_symbols,
+    slice_display_name,
+    slice_module_name,
+    slice_of,
+)
+
+def _slice_symbols(
+    ctx: SliceContext,
+    slice_module: str,
+    graph: Optional[ImportGraph]
+) -> Tuple[Dict[str, FrozenSet[str]], Dict[str, Tuple[str, FrozenSet[str]]]]:
+    """
+    Symbol table of the slice's own modules (module -> top-level names) and
+    what each file imports (module -> (filename, imported names)).
+
+    Files the project graph parsed in this state are served from its
+    index; only changed files are parsed (once, via the context).
+    """
+    symbols: Dict[str, FrozenSet[str]] = {}
+    imports: Dict[str, Tuple[str, FrozenSet[str]]] = {}
+    for filename in sorted(name for name in ctx.files if name.endswith(".py")):
+        module, package = module_for_file(slice_module, filename)
+        indexed = None
+        if graph is not None:
+            indexed = graph.symbols_if_current(module, ctx.read_bytes(filename) or b"")
+        if indexed is None:
+            tree = ctx.tree(filename)
+            if tree is None:
+                continue
+            indexed = (
+                frozenset(module_symbols(tree)),
+                frozenset(imported_symbols(import_targets(tree, package)))
+            )
+        symbols[module], imported = indexed
+        imports[module] = (filename, imported)
+    return symbols, imports
+
+def _defined(name: str, symbols: Dict[str, FrozenSet[str]]) -> bool:
+    if name in symbols:
+        return True
+    module, _, symbol = name.rpartition(".")
+    defined = symbols.get(module)
+    return defined is not None and (symbol in defined or STAR in defined)
+
+def lint_public_api(
+    slice_path: Union[Path, SliceContext],
+    graph: Optional[ImportGraph] = None
+) -> Tuple[bool, List[str]]:
+    """
+    Validate public_api.exports against the slice's code.
+
+    Every export must be a module or top-level name of this slice. With a
+    project ImportGraph, imports from other slices must also be names
+    those slices export.
+    """
+    errors = []
+    ctx = SliceContext.of(slice_path)
+
+    contract = ctx.contract
+    if not isinstance(contract, dict):
+        return False, ["Failed to load contract.json"]
+    slice_module = slice_module_name(ctx.path)
+    if slice_module is None:
+        return True, []
+
+    public_api = contract.get("public_api")
+    exports = public_api.get("exports", []) if isinstance(public_api, dict) else []
+    if not isinstance(exports, list):
+        exports = []
+
+    symbols, imports = _slice_symbols(ctx, slice_module, graph)
+
+    for export in exports:
+        if not isinstance(export, str):
+            continue
+        if slice_of(export) != slice_module:
+            errors.append(f"Export '{export}' is outside the slice ({slice_module})")
+        elif not _defined(export, symbols):
+            errors.append(f"Export '{export}' does not exist")
+
+    if graph is not None:
+        for module in sorted(imports):
+            filename, imported = imports[module]
+            for name in sorted(imported):
+                owner = slice_of(name)
+                if owner is None or owner == slice_module:
+                    continue
+                if graph.is_exported(name) is False:
+                    errors.append(
+                        f"{filename}: Imports '{name}', which is not exported by "
+                        f"{slice_display_name(owner)} (public_api.exports)"
+                    )
+
+    return len(errors) == 0, errors
@@ -1,6 +1,7 @@
 """ASA Linter: Slice Structure Checker"""
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Tuple, Union
+from .slice_context import SliceContext
 
 REQUIRED_FILES = [
     "slice.spec.md",
@@ -12,24 +13,24 @@ REQUIRED_FILES = [
     "tests/test_slice.py",
 ]
 
-def lint_slice_structure(slice_path: Path) -> Tuple[bool, List[str]]:
+def lint_slice_structure(slice_path: Union[Path, SliceContext]) -> Tuple[bool, List[str]]:
     """Check if slice has all required files."""
     errors = []
+    ctx = SliceContext.of(slice_path)
 
-    if not slice_path.exists():
-        return False, [f"Slice path does not exist: {slice_path}"]
+    if not ctx.exists:
+        return False, [f"Slice path does not exist: {ctx.path}"]
 
-    if not slice_path.is_dir():
-        return False, [f"Slice path is not a directory: {slice_path}"]
+    if not ctx.is_dir:
+        return False, [f"Slice path is not a directory: {ctx.path}"]
 
-    # Check required files
+    # Check required files (against the single directory listing)
     for required_file in REQUIRED_FILES:
-        file_path = slice_path / required_file
-        if not file_path.exists():
+        if not ctx.has_file(required_file):
             errors.append(f"Missing required file: {required_file}")
 
     # Check slice name (lowercase, no spaces)
-    slice_name = slice_path.name
+    slice_name = ctx.path.name
     if not slice_name.islower():
         errors.append(f"Slice name must be lowercase: {slice_name}")
 
@@ -0,0 +1,128 @@
+"""ASA Linter Profiling"""
+import heapq
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def measure(func: Callable[..., T], *args: Any) -> Tuple[T, Dict[str, float]]:
+    """
+    Call func(*args) and measure it.
+
+    Returns (result, stats) with wall time, CPU time of the calling thread
+    and peak memory allocated during the call (tracemalloc must be tracing,
+    otherwise peak_kb is 0).
+    """
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    result = func(*args)
+    cpu_ms = (time.thread_time() - cpu_start) * 1000
+    wall_ms = (time.perf_counter() - wall_start) * 1000
+
+    peak_kb = 0.0
+    if tracing:
+        peak_kb = max(0, tracemalloc.get_traced_memory()[1] - baseline) / 1024
+
+    return result, {
+        "wall_ms": round(wall_ms, 3),
+        "cpu_ms": round(cpu_ms, 3),
+        "peak_kb": round(peak_kb, 1),
+    }
+
+
+def summarize_profile(check_profiles: Dict[str, Dict[str, float]]) -> Dict:
+    """Per-slice profile: per-check stats plus slice totals (peak = worst check)."""
+    return {
+        "checks": check_profiles,
+        "wall_ms": round(sum(p["wall_ms"] for p in check_profiles.values()), 3),
+        "cpu_ms": round(sum(p["cpu_ms"] for p in check_profiles.values()), 3),
+        "peak_kb": max((p["peak_kb"] for p in check_profiles.values()), default=0.0),
+    }
+
+
+class ProfileReport:
+    """
+    Aggregates slice profiles during lint-all: totals per check and the
+    slowest slices (a bounded heap, so memory does not grow with slices).
+    """
+
+    def __init__(self, top: int = 10):
+        self.top = top
+        self.checks: Dict[str, Dict[str, float]] = {}
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._slowest: List[Tuple[float, int, str, Dict]] = []
+        self._seen = 0
+
+    def add_stage(self, name: str, stats: Dict[str, float]) -> None:
+        """Record a run-wide stage (e.g. building the import graph)."""
+        self.stages[name] = stats
+
+    def add(self, results: Dict) -> None:
+        """Account for one slice's results["profile"] (if any)."""
+        profile = results.get("profile")
+        if not profile:
+            return
+
+        for name, stats in profile["checks"].items():
+            totals = self.checks.setdefault(
+                name, {"wall_ms": 0.0, "cpu_ms": 0.0, "peak_kb": 0.0, "slices": 0}
+            )
+            totals["wall_ms"] += stats["wall_ms"]
+            totals["cpu_ms"] += stats["cpu_ms"]
+            totals["peak_kb"] = max(totals["peak_kb"], stats["peak_kb"])
+            totals["slices"] += 1
+
+        self._seen += 1
+        entry = (profile["wall_ms"], -self._seen, results["slice_path"], profile)
+        if len(self._slowest) < self.top:
+            heapq.heappush(self._slowest, entry)
+        else:
+            heapq.heappushpop(self._slowest, entry)
+
+    def slowest(self) -> List[Tuple[float, str, Dict]]:
+        """Slowest slices as (wall_ms, slice_path, profile), slowest first."""
+        return [
+            (wall_ms, slice_path, profile)
+            for wall_ms, _, slice_path, profile in sorted(self._slowest, reverse=True)
+        ]
+
+
+def format_profile(report: ProfileReport) -> str:
+    """Format a ProfileReport as tables for CLI output."""
+    output = [f"{'='*60}", "Profile:", ""]
+
+    # Wide enough for the longest check or stage name (plus a space)
+    width = max(map(len, ["Check", *report.checks, *report.stages])) + 1
+    output.append(f"  {'Check':<{width}}{'wall ms':>12}{'cpu ms':>12}{'peak KiB':>12}{'avg ms':>10}")
+    ranked = sorted(report.checks.items(), key=lambda item: item[1]["wall_ms"], reverse=True)
+    for name, totals in ranked:
+        average = totals["wall_ms"] / totals["slices"] if totals["slices"] else 0.0
+        output.append(
+            f"  {name:<{width}}{totals['wall_ms']:>12.1f}{totals['cpu_ms']:>12.1f}"
+            f"{totals['peak_kb']:>12.1f}{average:>10.2f}"
+        )
+
+    for name, stats in report.stages.items():
+        output.append(
+            f"  {name:<{width}}{stats['wall_ms']:>12.1f}{stats['cpu_ms']:>12.1f}"
+            f"{stats['peak_kb']:>12.1f}{'(once)':>10}"
+        )
+
+    output.append("")
+    output.append(f"  Slowest slices (top {report.top}):")
+    for wall_ms, slice_path, profile in report.slowest():
+        worst = max(profile["checks"].items(), key=lambda item: item[1]["wall_ms"])[0]
+        output.append(
+            f"  {wall_ms:>10.1f} ms  {profile['peak_kb']:>8.1f} KiB  "
+            f"{slice_path} (slowest check: {worst})"
+        )
+
+    output.append(f"{'='*60}")
+    return "\n".join(output)
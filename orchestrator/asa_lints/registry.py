@@ -0,0 +1,260 @@
+"""ASA Linter: Check Registry and Scheduler"""
+import os
+import warnings
+from fnmatch import fnmatchcase
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .slice_context import SliceContext
+
+# Entry-point group third-party packages use to register checks, e.g.
+#   [project.entry-points."asa.checks"]
+#   naming = "my_package.asa_checks"
+ENTRY_POINT_GROUP = "asa.checks"
+
+# Statuses after which dependent checks still run
+PASSING_STATUSES = {"OK", "WARNING"}
+
+# A check receives the slice context and the project import graph (or None)
+# and returns {"status": "OK" | "WARNING" | "FAILED", "errors": [...], ...}
+CheckFunc = Callable[[SliceContext, Any], Dict]
+
+
+class Check:
+    """A registered check and what it depends on."""
+
+    __slots__ = ("name", "func", "inputs", "requires", "version", "_patterns")
+
+    def __init__(
+        self,
+        name: str,
+        func: CheckFunc,
+        inputs: Optional[FrozenSet[str]],
+        requires: Tuple[str, ...],
+        version: str
+    ):
+        self.name = name
+        self.func = func
+        # Slice files the check reads (names or fnmatch patterns such as
+        # "*.py", where "*" also matches "/"); None means it depends on the
+        # file listing
+        self.inputs = inputs
+        self._patterns = frozenset(
+            pattern for pattern in inputs or () if any(c in pattern for c in "*?[")
+        )
+        # Checks that must pass (OK or WARNING) before this one runs
+        self.requires = requires
+        # Bumped by plugin authors to invalidate cached results
+        self.version = version
+
+    def reads_any(self, names: Set[str]) -> bool:
+        """Whether any of names (slice-relative paths) is one of the check's inputs."""
+        if self.inputs is None:
+            return False
+        if self.inputs & names:
+            return True
+        return any(fnmatchcase(name, pattern) for pattern in self._patterns for name in names)
+
+
+class CheckRegistry(Mapping):
+    """
+    Ordered registry of slice checks (name -> Check).
+
+    Prerequisites must be registered before the checks that require them,
+    so registration order is always a valid execution order and cycles are
+    impossible. Checks from the "asa.checks" entry-point group are loaded
+    the first time the registry is read.
+    """
+
+    def __init__(self, entry_point_group: Optional[str] = ENTRY_POINT_GROUP):
+        self._checks: Dict[str, Check] = {}
+        self._entry_point_group = entry_point_group
+        self._plugins_loaded = entry_point_group is None
+
+    def register(
+        self,
+        name: str,
+        func: CheckFunc,
+        inputs: Optional[Iterable[str]] = None,
+        requires: Iterable[str] = (),
+        version: str = "",
+        replace: bool = False
+    ) -> Check:
+        """Register func as check name (ValueError on duplicates or unknown prerequisites)."""
+        if name in self._checks and not replace:
+            raise ValueError(f"Check already registered: {name}")
+        requires = tuple(requires)
+        for prerequisite in requires:
+            if prerequisite not in self._checks or prerequisite == name:
+                raise ValueError(f"Check {name} requires unknown check: {prerequisite}")
+
+        check = Check(
+            name,
+            func,
+            None if inputs is None else frozenset(inputs),
+            requires,
+            version
+        )
+        self._checks[name] = check
+        return check
+
+    def unregister(self, name: str) -> None:
+        """Remove a check (ValueError if another check requires it)."""
+        dependents = [check.name for check in self._checks.values() if name in check.requires]
+        if dependents:
+            raise ValueError(f"Check {name} is required by: {', '.join(dependents)}")
+        self._checks.pop(name, None)
+
+    def signature(self) -> str:
+        """Registered checks and their versions (part of the lint cache key)."""
+        return ",".join(
+            f"{check.name}@{check.version}" if check.version else check.name
+            for check in self.values()
+        )
+
+    def load_plugins(self) -> None:
+        """Import checks registered through entry points (once)."""
+        if self._plugins_loaded or self._entry_point_group is None:
+            return
+        self._plugins_loaded = True
+
+        for entry_point in entry_points(group=self._entry_point_group):
+            try:
+                loaded = entry_point.load()
+            except Exception as e:
+                warnings.warn(f"Cannot load ASA check {entry_point.name}: {e}")
+                continue
+            # Modules register their checks on import with @register_check;
+            # a bare function is registered under the entry point's name
+            if callable(loaded) and entry_point.name not in self._checks and not isinstance(loaded, type):
+                self.register(entry_point.name, loaded)
+
+    def __getitem__(self, name: str) -> Check:
+        self.load_plugins()
+        return self._checks[name]
+
+    def __iter__(self) -> Iterator[str]:
+        self.load_plugins()
+        return iter(list(self._checks))
+
+    def __len__(self) -> int:
+        self.load_plugins()
+        return len(self._checks)
+
+
+REGISTRY = CheckRegistry()
+
+
+def register_check(
+    name: str,
+    inputs: Optional[Iterable[str]] = None,
+    requires: Iterable[str] = (),
+    version: str = ""
+) -> Callable[[CheckFunc], CheckFunc]:
+    """
+    Decorator registering a slice check with the default registry.
+
+    Example:
+        @register_check("naming", inputs={"handler.py"}, requires=("structure",))
+        def check_naming(ctx, graph):
+            return {"status": "OK", "errors": []}
+    """
+    def decorator(func: CheckFunc) -> CheckFunc:
+        REGISTRY.register(name, func, inputs=inputs, requires=requires, version=version)
+        return func
+    return decorator
+
+
+# Threads shared by every run_checks call in a process
+_executor: Optional[ThreadPoolExecutor] = None
+MAX_CHECK_THREADS = 4
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=MAX_CHECK_THREADS, thread_name_prefix="asa-check")
+    return _executor
+
+
+def _reset_executor() -> None:
+    # A forked lint-all worker does not inherit the parent's threads
+    global _executor
+    _executor = None
+
+
+os.register_at_fork(after_in_child=_reset_executor)
+
+
+def run_check(check: Check, ctx: SliceContext, graph: Any) -> Dict:
+    """Run one check; a crashing check fails instead of aborting the slice."""
+    try:
+        return check.func(ctx, graph)
+    except Exception as e:
+        return {"status": "FAILED", "errors": [f"Check crashed: {type(e).__name__}: {e}"]}
+
+
+def run_checks(
+    ctx: SliceContext,
+    graph: Any = None,
+    registry: CheckRegistry = REGISTRY,
+    selected: Optional[Set[str]] = None,
+    previous: Optional[Dict] = None,
+    run: Optional[Callable[[Check, SliceContext, Any], Dict]] = None,
+    concurrent: bool = True
+) -> Dict[str, Dict]:
+    """
+    Run the registered checks on a slice, in waves.
+
+    A check whose prerequisites did not pass is SKIPPED. Checks not in
+    selected reuse their entry from previous, unless it was SKIPPED or a
+    prerequisite no longer passes. Checks of a wave that are independent of
+    each other run concurrently in a shared thread pool. Results are
+    returned in registration order.
+    """
+    run = run or run_check
+    previous_checks = previous["checks"] if previous is not None else {}
+    check_results: Dict[str, Dict] = {}
+    pending: List[Check] = [registry[name] for name in registry]
+
+    while pending:
+        wave = [
+            check for check in pending
+            if all(prerequisite in check_results for prerequisite in check.requires)
+        ]
+        pending = [check for check in pending if check not in wave]
+
+        to_run = []
+        for check in wave:
+            failed = [
+                prerequisite for prerequisite in check.requires
+                if check_results[prerequisite]["status"] not in PASSING_STATUSES
+            ]
+            reusable = (
+                selected is not None and check.name not in selected
+                and check.name in previous_checks
+                and previous_checks[check.name]["status"] != "SKIPPED"
+            )
+            if failed:
+                check_results[check.name] = {
+                    "status": "SKIPPED",
+                    "errors": [],
+                    "reason": f"requires {', '.join(failed)}",
+                }
+            elif reusable:
+                check_results[check.name] = previous_checks[check.name]
+            else:
+                to_run.append(check)
+
+        if concurrent and len(to_run) > 1:
+            executor = _get_executor()
+            futures = [executor.submit(run, check, ctx, graph) for check in to_run]
+            for check, future in zip(to_run, futures):
+                check_results[check.name] = future.result()
+        else:
+            for check in to_run:
+                check_results[check.name] = run(check, ctx, graph)
+
+    return {name: check_results[name] for name in registry}
@@ -0,0 +1,204 @@
+"""ASA Linter Reporters (text, JSONL, SARIF)"""
+import json
+import re
+from typing import Dict, List, Optional, Union
+
+from .run_asa_checks import CHECKS, format_results
+
+FORMATS = ["text", "jsonl", "sarif"]
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+# "handler.py: ...", "❌ handler.py: 400 LOC ..." -> handler.py
+_FILE_PREFIX = re.compile(r"^(?:\W+\s+)?([\w./-]+\.py):")
+
+
+class LintSummary:
+    """
+    Running lint-all totals, updated as each slice finishes.
+
+    Only counters and the paths of failed/warning slices are kept, never
+    the per-slice results, so memory does not grow with result size.
+    """
+
+    def __init__(self, use_cache: bool = False):
+        self.total = 0
+        self.failed: List[str] = []
+        self.warnings: List[str] = []
+        self.cache_hits = 0
+        self.use_cache = use_cache
+        self.stopped = False
+
+    def add(self, results: Dict) -> None:
+        """Account for one slice's results."""
+        self.total += 1
+        if results.get("cached"):
+            self.cache_hits += 1
+        if results["overall_status"] == "FAILED":
+            self.failed.append(results["slice_path"])
+        elif results["has_warnings"]:
+            self.warnings.append(results["slice_path"])
+
+    @property
+    def passed(self) -> int:
+        return self.total - len(self.failed)
+
+    def to_dict(self) -> Dict:
+        summary = {
+            "total": self.total,
+            "passed": self.passed,
+            "failed": len(self.failed),
+            "warnings": len(self.warnings),
+            "failed_slices": self.failed,
+            "warning_slices": self.warnings,
+            "stopped": self.stopped,
+        }
+        if self.use_cache:
+            summary["cache_hits"] = self.cache_hits
+        return summary
+
+
+class TextReporter:
+    """Human-readable output (the default)."""
+
+    def start(self, total: int) -> Optional[str]:
+        return f"\n{'='*60}\nLinting {total} slice(s)\n{'='*60}\n"
+
+    def slice(self, results: Dict) -> Optional[str]:
+        return format_results(results) + "\n"
+
+    def finish(self, summary: LintSummary) -> Optional[str]:
+        if summary.stopped:
+            return "❌ Stopping due to --fail-fast"
+
+        lines = [
+            f"{'='*60}",
+            "Summary:",
+            f"  Total: {summary.total}",
+            f"  Passed: {summary.passed}",
+            f"  Failed: {len(summary.failed)}",
+            f"  Warnings: {len(summary.warnings)}",
+        ]
+        if summary.use_cache:
+            lines.append(f"  Cache hits: {summary.cache_hits}/{summary.total}")
+        lines.append(f"{'='*60}\n")
+
+        if summary.failed:
+            lines.append("❌ Failed slices:")
+            lines.extend(f"  • {slice_path}" for slice_path in summary.failed)
+            return "\n".join(lines)
+
+        if summary.warnings:
+            lines.append("⚠️ Slices with warnings:")
+            lines.extend(f"  • {slice_path}" for slice_path in summary.warnings)
+
+        lines.append("✅ All slices passed!")
+        return "\n".join(lines)
+
+
+class JsonlReporter:
+    """One JSON object per line: a record per slice, then a summary record."""
+
+    def start(self, total: int) -> Optional[str]:
+        return json.dumps({"type": "start", "total": total})
+
+    def slice(self, results: Dict) -> Optional[str]:
+        return json.dumps({"type": "slice", **results}, ensure_ascii=False)
+
+    def finish(self, summary: LintSummary) -> Optional[str]:
+        return json.dumps({"type": "summary", **summary.to_dict()})
+
+
+class SarifReporter:
+    """
+    SARIF 2.1.0 log, written incrementally.
+
+    The document header is emitted first, then each slice's findings as
+    soon as the slice finishes, then the footer with the summary, so the
+    concatenated output is one valid SARIF document.
+    """
+
+    def __init__(self, tool_version: str = "0.9.0"):
+        self.tool_version = tool_version
+        self._first = True
+
+    def start(self, total: int) -> Optional[str]:
+        header = json.dumps({
+            "version": "2.1.0",
+            "$schema": SARIF_SCHEMA,
+            "runs": [{
+                "tool": {"driver": {
+                    "name": "asa",
+                    "version": self.tool_version,
+                    "rules": [
+                        {"id": f"asa/{name}", "name": name} for name in CHECKS
+                    ],
+                }},
+                "results": [],
+            }],
+        })
+        # Leave the results array open
+        return header[:header.rindex("[]")] + "["
+
+    def slice(self, results: Dict) -> Optional[str]:
+        entries = [
+            json.dumps(entry, ensure_ascii=False)
+            for entry in self._sarif_results(results)
+        ]
+        if not entries:
+            return None
+        prefix = "" if self._first else ","
+        self._first = False
+        return prefix + ",\n".join(entries)
+
+    def finish(self, summary: LintSummary) -> Optional[str]:
+        invocation = json.dumps({
+            "executionSuccessful": not summary.failed,
+            "properties": summary.to_dict(),
+        })
+        return f'],"invocations":[{invocation}]}}]}}'
+
+    @staticmethod
+    def _sarif_results(results: Dict) -> List[Dict]:
+        slice_path = results["slice_path"].rstrip("/")
+        entries = []
+        for check_name, check_data in results["checks"].items():
+            if check_data["status"] == "FAILED":
+                level = "error"
+            elif check_data["status"] == "WARNING":
+                level = "warning"
+            else:
+                level = None
+            # Warnings (allow-listed findings, override notes, ...) are
+            # reported even when the check itself passed
+            findings = [(level, message) for message in check_data["errors"]] if level else []
+            findings += [("warning", message) for message in check_data.get("warnings", [])]
+            for finding_level, message in findings:
+                entries.append({
+                    "ruleId": f"asa/{check_name}",
+                    "level": finding_level,
+                    "message": {"text": message},
+                    "locations": [{"physicalLocation": {"artifactLocation": {
+                        "uri": _location(slice_path, check_name, message)
+                    }}}],
+                })
+        return entries
+
+
+def _location(slice_path: str, check_name: str, message: str) -> str:
+    """Best-effort file a finding refers to."""
+    match = _FILE_PREFIX.match(message)
+    if match:
+        return f"{slice_path}/{match.group(1)}"
+    if check_name == "contract":
+        return f"{slice_path}/slice.contract.json"
+    return slice_path
+
+
+def make_reporter(output_format: str) -> Union[TextReporter, JsonlReporter, SarifReporter]:
+    """Reporter for one of FORMATS."""
+    if output_format == "jsonl":
+        return JsonlReporter()
+    if output_format == "sarif":
+        return SarifReporter()
+    return TextReporter()
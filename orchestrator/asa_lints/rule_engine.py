@@ -0,0 +1,447 @@
+"""ASA Linter: Single-pass AST Rule Engine
+
+Rules declare the node types they care about with visit_<NodeType>
+methods. The engine walks each file's AST once and dispatches every node
+to all rules registered for its type, so adding a rule does not add a
+traversal.
+"""
+import ast
+import re
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Type, Union
+
+from .import_graph import ImportTarget, module_for_file, node_import_targets, slice_module_name
+from .slice_context import SliceContext
+
+# Nodes that open a scope; rules can see the enclosing ones in state.scopes
+SCOPE_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+Scope = Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda]
+FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+_FUNCTION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+_SCOPE_SET = frozenset(SCOPE_TYPES)
+
+# Pushed on the traversal stack to close the scope opened by its node
+_LEAVE = object()
+
+# Fields never holding nodes a rule could care about (Load/Store contexts)
+_SKIPPED_FIELDS = {"ctx"}
+
+_FIELDS_CACHE: Dict[Type[ast.AST], Tuple[str, ...]] = {}
+
+
+def _child_fields(node_type: Type[ast.AST]) -> Tuple[str, ...]:
+    """A node type's child fields, reversed (see RuleEngine.run)."""
+    fields = _FIELDS_CACHE.get(node_type)
+    if fields is None:
+        fields = tuple(
+            field for field in reversed(node_type._fields) if field not in _SKIPPED_FIELDS
+        )
+        _FIELDS_CACHE[node_type] = fields
+    return fields
+
+
+class Finding:
+    """A rule violation at a line of a file, inside scope (e.g. 'Service.run')."""
+
+    __slots__ = ("rule", "filename", "line", "message", "scope")
+
+    def __init__(self, rule: str, filename: str, line: int, message: str, scope: str = ""):
+        self.rule = rule
+        self.filename = filename
+        self.line = line
+        self.message = message
+        self.scope = scope
+
+    def __str__(self) -> str:
+        return f"{self.filename}:{self.line}: {self.message} [{self.rule}]"
+
+    def __repr__(self) -> str:
+        return f"Finding({self.rule!r}, {self.filename!r}, {self.line}, {self.message!r})"
+
+
+class FileState:
+    """What rules know about the file being visited."""
+
+    __slots__ = ("filename", "package", "lines", "scopes", "findings")
+
+    def __init__(self, filename: str, package: Optional[str], lines: Sequence[str]):
+        self.filename = filename
+        # Package relative imports resolve against (None if unknown)
+        self.package = package
+        self.lines = lines
+        # Enclosing function/class/lambda nodes, innermost last
+        self.scopes: List[Scope] = []
+        self.findings: List[Finding] = []
+
+    @property
+    def function(self) -> Optional[ast.AST]:
+        """Innermost enclosing function (None at module or class level)."""
+        for scope in reversed(self.scopes):
+            if isinstance(scope, _FUNCTION_TYPES):
+                return scope
+        return None
+
+    @property
+    def qualname(self) -> str:
+        """Dotted name of the enclosing classes and functions ('' at module level)."""
+        return ".".join(scope.name for scope in self.scopes if not isinstance(scope, ast.Lambda))
+
+    def report(self, rule: str, node: ast.AST, message: str) -> None:
+        self.findings.append(
+            Finding(rule, self.filename, getattr(node, "lineno", 0), message, self.qualname)
+        )
+
+
+class Rule:
+    """
+    Base class of AST rules.
+
+    Subclasses set name and define visit_<NodeType>(node, state) methods
+    (e.g. visit_Call). begin() is called before and finish() after each
+    file; finish() returns the rule's result for the file (if any).
+    """
+
+    name = ""
+
+    def begin(self, state: FileState) -> None:
+        pass
+
+    def finish(self, state: FileState) -> Any:
+        return None
+
+
+class FileAnalysis:
+    """Results of one engine run over a file: per-rule results and findings."""
+
+    __slots__ = ("results", "findings")
+
+    def __init__(self, results: Dict[str, Any], findings: List[Finding]):
+        self.results = results
+        self.findings = findings
+
+
+class RuleEngine:
+    """Runs a set of rules over a module in a single traversal."""
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules = list(rules)
+        # Node class -> bound visit methods of every rule handling it
+        self._dispatch: Dict[type, List[Callable[[ast.AST, FileState], None]]] = {}
+        for rule in self.rules:
+            for attribute in dir(rule):
+                if not attribute.startswith("visit_"):
+                    continue
+                node_type = getattr(ast, attribute[len("visit_"):], None)
+                if not isinstance(node_type, type) or not issubclass(node_type, ast.AST):
+                    raise ValueError(f"Rule {rule.name} handles unknown node type: {attribute}")
+                self._dispatch.setdefault(node_type, []).append(getattr(rule, attribute))
+
+    def run(
+        self,
+        tree: ast.AST,
+        filename: str = "<unknown>",
+        package: Optional[str] = None,
+        source: str = ""
+    ) -> FileAnalysis:
+        state = FileState(filename, package, source.splitlines())
+        for rule in self.rules:
+            rule.begin(state)
+
+        dispatch = self._dispatch
+        scopes = state.scopes
+        ast_base = ast.AST  # local lookup in the hot loop
+        stack: List[Any] = [tree]
+        while stack:
+            node = stack.pop()
+            if node is _LEAVE:
+                scopes.pop()
+                continue
+            node_type = node.__class__
+            handlers = dispatch.get(node_type)
+            if handlers is not None:
+                for handler in handlers:
+                    handler(node, state)
+            if node_type in _SCOPE_SET:
+                scopes.append(node)
+                stack.append(_LEAVE)
+            # Children are pushed in reverse, so they are visited in source order
+            for field in _child_fields(node_type):
+                value = getattr(node, field, None)
+                if value.__class__ is list:
+                    for item in reversed(value):
+                        if isinstance(item, ast_base):
+                            stack.append(item)
+                elif isinstance(value, ast_base):
+                    stack.append(value)
+
+        results = {rule.name: rule.finish(state) for rule in self.rules}
+        return FileAnalysis(results, state.findings)
+
+
+# ----------------------------------------------------------------------
+# Built-in rules
+# ----------------------------------------------------------------------
+
+def dotted_name(node: ast.AST) -> Optional[str]:
+    """'time.sleep' for the expression time.sleep (None if not a plain name chain)."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+def is_code_line(line: str) -> bool:
+    """Whether a line counts as code (not empty, not a comment), as in count_loc_text."""
+    stripped = line.strip()
+    return bool(stripped) and not stripped.startswith("#")
+
+
+class ImportRule(Rule):
+    """Collects the module's import targets (see import_graph.import_targets)."""
+
+    name = "imports"
+
+    def begin(self, state: FileState) -> None:
+        self._targets: Set[ImportTarget] = set()
+
+    def visit_Import(self, node: ast.Import, state: FileState) -> None:
+        self._targets.update(node_import_targets(node, state.package))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom, state: FileState) -> None:
+        self._targets.update(node_import_targets(node, state.package))
+
+    def finish(self, state: FileState) -> Set[ImportTarget]:
+        return self._targets
+
+
+class FunctionLocRule(Rule):
+    """Lines of code per function; reports functions longer than max_loc."""
+
+    name = "function_loc"
+
+    def __init__(self, max_loc: int = 80):
+        self.max_loc = max_loc
+
+    def begin(self, state: FileState) -> None:
+        self._loc: Dict[str, int] = {}
+
+    def _visit_function(self, node: FunctionNode, state: FileState) -> None:
+        lines = state.lines[node.lineno - 1:node.end_lineno]
+        loc = sum(1 for line in lines if is_code_line(line))
+        qualified = f"{state.qualname}.{node.name}" if state.scopes else node.name
+        self._loc[qualified] = loc
+        if loc > self.max_loc:
+            state.report(self.name, node, f"Function '{qualified}' has {loc} LOC (max {self.max_loc})")
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+    def finish(self, state: FileState) -> Dict[str, int]:
+        return self._loc
+
+
+class NamingRule(Rule):
+    """Classes use CapWords, functions and methods use snake_case."""
+
+    name = "naming"
+
+    CLASS_NAME = re.compile(r"_*[A-Z][A-Za-z0-9]*$")
+    FUNCTION_NAME = re.compile(r"_*[a-z][a-z0-9_]*$")
+
+    def visit_ClassDef(self, node: ast.ClassDef, state: FileState) -> None:
+        if not self.CLASS_NAME.match(node.name):
+            state.report(self.name, node, f"Class name '{node.name}' should be CapWords")
+
+    def _visit_function(self, node: FunctionNode, state: FileState) -> None:
+        if not self.FUNCTION_NAME.match(node.name):
+            state.report(self.name, node, f"Function name '{node.name}' should be snake_case")
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+
+# Calls that block the event loop when made directly in an async function,
+# by qualified name (imported aliases are resolved): file and console I/O,
+# sleeps, subprocesses, synchronous HTTP clients and CPU-heavy hashing
+BLOCKING_CALLS = frozenset({
+    "time.sleep",
+    "open",
+    "io.open",
+    "input",
+    "os.system",
+    "shutil.copy",
+    "shutil.copyfile",
+    "shutil.copytree",
+    "shutil.rmtree",
+    "subprocess.run",
+    "subprocess.call",
+    "subprocess.check_call",
+    "subprocess.check_output",
+    "urllib.request.urlopen",
+    *(f"{client}.{method}" for client in ("requests", "httpx")
+      for method in ("get", "post", "put", "patch", "delete", "head", "request")),
+    "hashlib.pbkdf2_hmac",
+    "hashlib.scrypt",
+    "bcrypt.hashpw",
+    "bcrypt.checkpw",
+    *(f"{module}.{function}" for module in ("shared.utils", "shared.utils.password_hasher")
+      for function in ("hash_password", "verify_password")),
+})
+
+# Methods doing synchronous file I/O whatever the object (pathlib.Path)
+BLOCKING_METHODS = frozenset({"read_text", "write_text", "read_bytes", "write_bytes"})
+
+
+class AsyncBlockingRule(Rule):
+    """Reports blocking calls made directly inside an async def (not awaited)."""
+
+    name = "async_blocking"
+
+    def __init__(
+        self,
+        blocking_calls: Iterable[str] = BLOCKING_CALLS,
+        blocking_methods: Iterable[str] = BLOCKING_METHODS
+    ):
+        self.blocking_calls = frozenset(blocking_calls)
+        self.blocking_methods = frozenset(blocking_methods)
+
+    def begin(self, state: FileState) -> None:
+        # Local name -> qualified name, from the imports seen so far
+        self._aliases: Dict[str, str] = {}
+        self._awaited: Set[int] = set()
+
+    def visit_Import(self, node: ast.Import, state: FileState) -> None:
+        for alias in node.names:
+            if alias.asname:
+                self._aliases[alias.asname] = alias.name
+
+    def visit_ImportFrom(self, node: ast.ImportFrom, state: FileState) -> None:
+        for base, names, _ in node_import_targets(node, state.package):
+            for alias in node.names:
+                if alias.name in names:
+                    self._aliases[alias.asname or alias.name] = f"{base}.{alias.name}"
+
+    def visit_Await(self, node: ast.Await, state: FileState) -> None:
+        self._awaited.add(id(node.value))
+
+    def visit_Call(self, node: ast.Call, state: FileState) -> None:
+        function = state.function
+        if not isinstance(function, ast.AsyncFunctionDef) or id(node) in self._awaited:
+            return
+        called = dotted_name(node.func)
+        if called is not None:
+            head, _, rest = called.partition(".")
+            qualified = self._aliases.get(head, head) + (f".{rest}" if rest else "")
+            blocking = qualified in self.blocking_calls
+        else:
+            qualified = None
+            blocking = False
+        if not blocking and isinstance(node.func, ast.Attribute) and node.func.attr in self.blocking_methods:
+            qualified = called or f"<expr>.{node.func.attr}"
+            blocking = True
+        if blocking:
+            state.report(
+                self.name, node,
+                f"Blocking call '{qualified}()' in async function '{function.name}' "
+                f"(await an async API or use asyncio.to_thread)"
+            )
+
+
+class LinearScanRule(Rule):
+    """
+    Reports lookups done by scanning a whole collection attribute, e.g.
+        for user in self._users.values():
+            if user.id == user_id:
+                return user
+    which should be a dict lookup or an indexed query instead.
+    """
+
+    name = "linear_scan"
+
+    SCANNED_METHODS = {"values", "items", "keys"}
+
+    def _scanned_attribute(self, iterable: ast.AST) -> Optional[str]:
+        """'self._users' if iterable is self.<attr> or self.<attr>.values() etc."""
+        if (
+            isinstance(iterable, ast.Call)
+            and isinstance(iterable.func, ast.Attribute)
+            and iterable.func.attr in self.SCANNED_METHODS
+            and not iterable.args
+        ):
+            iterable = iterable.func.value
+        name = dotted_name(iterable)
+        if name is not None and name.startswith(("self.", "cls.")) and name.count(".") == 1:
+            return name
+        return None
+
+    @staticmethod
+    def _is_equality(test: ast.AST) -> bool:
+        return isinstance(test, ast.Compare) and any(isinstance(op, (ast.Eq, ast.Is)) for op in test.ops)
+
+    def _report(self, node: ast.AST, attribute: str, state: FileState) -> None:
+        state.report(
+            self.name, node,
+            f"Linear scan of '{attribute}' to find an item in '{state.qualname}' "
+            f"(index it by the looked-up key)"
+        )
+
+    def _visit_loop(self, node: ast.For, state: FileState) -> None:
+        attribute = self._scanned_attribute(node.iter)
+        if attribute is None or state.function is None:
+            return
+        for statement in node.body:
+            if (
+                isinstance(statement, ast.If)
+                and self._is_equality(statement.test)
+                and any(isinstance(child, (ast.Return, ast.Break)) for child in statement.body)
+            ):
+                self._report(node, attribute, state)
+                return
+
+    visit_For = _visit_loop
+    visit_AsyncFor = _visit_loop
+
+    def visit_comprehension(self, node: ast.comprehension, state: FileState) -> None:
+        attribute = self._scanned_attribute(node.iter)
+        if attribute is not None and state.function is not None and any(map(self._is_equality, node.ifs)):
+            self._report(node.iter, attribute, state)
+
+
+def default_rules() -> List[Rule]:
+    """Rules read by the built-in checks (imports and performance)."""
+    return [ImportRule(), AsyncBlockingRule(), LinearScanRule()]
+
+
+def analyze(ctx: SliceContext, filename: str) -> Optional[FileAnalysis]:
+    """
+    Run the default rules over a Python file of a slice, once per context
+    (None if the file is missing or not valid Python).
+    """
+    analysis: Optional[FileAnalysis] = ctx.memo(("rules", filename), lambda: _analyze(ctx, filename))
+    return analysis
+
+
+def _analyze(ctx: SliceContext, filename: str) -> Optional[FileAnalysis]:
+    tree = ctx.tree(filename)
+    if tree is None:
+        return None
+    slice_module = slice_module_name(ctx.path)
+    package = module_for_file(slice_module, filename)[1] if slice_module else None
+    # Rules keep per-file state, so every run gets its own instances
+    return RuleEngine(default_rules()).run(tree, filename, package, ctx.read_text(filename) or "")
+
+
+def analyze_files(ctx: SliceContext, rules: Mapping[str, Iterable[str]]) -> List[Finding]:
+    """Findings of the rules named per slice file in rules ({filename: rule names})."""
+    findings: List[Finding] = []
+    for filename, names in rules.items():
+        analysis = analyze(ctx, filename)
+        if analysis is not None:
+            selected = set(names)
+            findings.extend(finding for finding in analysis.findings if finding.rule in selected)
+    return findings
@@ -1,58 +1,288 @@
 """ASA Linter Orchestrator"""
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Generator, Iterable, List, Optional, Set, Union
 from .lint_slice_structure import lint_slice_structure
 from .lint_contract_json import lint_contract_json
-from .lint_loc_limits import lint_loc_limits
-from .lint_contract_imports import lint_contract_imports
+from .lint_loc_limits import check_loc_limits, FILES_TO_CHECK
+from .lint_contract_imports import lint_contract_imports, IMPORT_CHECKED_FILES
+from .lint_public_api import lint_public_api
+from .lint_performance import check_performance, check_budgets, results_fingerprint, PERFORMANCE_FILES
+from .slice_context import SliceContext, CONTRACT_FILE
+from .lint_cache import CACHE_DIR, LintCache, slice_cache_key
+from .import_graph import ImportGraph, slice_module_name
+from .profiling import measure, summarize_profile
+from .registry import REGISTRY, Check, register_check, run_check, run_checks
 
-def run_asa_checks(slice_path: Path) -> Dict:
-    """Run all ASA linters on a slice."""
-    results = {
-        "slice_path": str(slice_path),
-        "checks": {},
-        "overall_status": "PASSED",
-        "has_warnings": False
-    }
-
-    # Run structure check
-    success, errors = lint_slice_structure(slice_path)
-    results["checks"]["structure"] = {
+@register_check("structure")
+def _check_structure(ctx: SliceContext, graph: Optional[ImportGraph]) -> Dict:
+    success, errors = lint_slice_structure(ctx)
+    return {
         "status": "OK" if success else "FAILED",
         "errors": errors
     }
-    if not success:
-        results["overall_status"] = "FAILED"
 
-    # Run contract check
-    success, errors = lint_contract_json(slice_path)
-    results["checks"]["contract"] = {
+@register_check("contract", inputs={CONTRACT_FILE}, requires=("structure",))
+def _check_contract(ctx: SliceContext, graph: Optional[ImportGraph]) -> Dict:
+    success, errors = lint_contract_json(ctx)
+    return {
         "status": "OK" if success else "FAILED",
         "errors": errors
     }
-    if not success:
-        results["overall_status"] = "FAILED"
 
-    # Run LOC check
-    success, errors = lint_loc_limits(slice_path)
-    results["checks"]["loc_limits"] = {
-        "status": "OK" if success else "WARNING",
+@register_check("loc_limits", inputs={CONTRACT_FILE, *FILES_TO_CHECK}, requires=("contract",))
+def _check_loc_limits(ctx: SliceContext, graph: Optional[ImportGraph]) -> Dict:
+    # Override warnings are kept in the results so that output stays in
+    # per-slice order when slices are linted in parallel
+    errors, warnings = check_loc_limits(ctx)
+    return {
+        "status": "WARNING" if errors or warnings else "OK",
+        "errors": errors,
+        "warnings": warnings
+    }
+
+@register_check("imports", inputs={CONTRACT_FILE, *IMPORT_CHECKED_FILES}, requires=("contract",))
+def _check_imports(ctx: SliceContext, graph: Optional[ImportGraph]) -> Dict:
+    success, errors = lint_contract_imports(ctx, graph)
+    return {
+        "status": "OK" if success else "FAILED",
         "errors": errors
     }
-    if not success:
-        results["has_warnings"] = True
 
-    # Run imports check
-    success, errors = lint_contract_imports(slice_path)
-    results["checks"]["imports"] = {
+@register_check("public_api", inputs={CONTRACT_FILE, *IMPORT_CHECKED_FILES}, requires=("contract",))
+def _check_public_api(ctx: SliceContext, graph: Optional[ImportGraph]) -> Dict:
+    success, errors = lint_public_api(ctx, graph)
+    return {
         "status": "OK" if success else "FAILED",
         "errors": errors
     }
-    if not success:
+
+@register_check("performance", inputs={CONTRACT_FILE, *PERFORMANCE_FILES}, requires=("contract",))
+def _check_performance(ctx: SliceContext, graph: Optional[ImportGraph]) -> Dict:
+    errors, warnings = check_performance(ctx)
+    return {
+        "status": "WARNING" if errors or warnings else "OK",
+        "errors": errors,
+        "warnings": warnings
+    }
+
+@register_check("performance_budget", inputs={CONTRACT_FILE, *FILES_TO_CHECK}, requires=("contract",))
+def _check_performance_budget(ctx: SliceContext, graph: Optional[ImportGraph]) -> Dict:
+    # Compares the last 'asa bench-slice' run with the contract budgets;
+    # stale results are only warnings
+    errors, warnings = check_budgets(ctx)
+    return {
+        "status": "FAILED" if errors else ("WARNING" if warnings else "OK"),
+        "errors": errors,
+        "warnings": warnings
+    }
+
+# Registered checks (built-in and plugins) in the order they are reported
+CHECKS = REGISTRY
+
+# Checks that read the project import graph (transitive imports, cross-slice
+# cycles, other slices' exports): re-run when a dependency outside the slice changes
+GRAPH_CHECKS = frozenset({"imports", "public_api"})
+
+def affected_checks(changed_files: Iterable[str], listing_changed: bool) -> Set[str]:
+    """
+    Names of the checks whose inputs include one of changed_files.
+
+    listing_changed means files were added or removed (not just edited).
+    """
+    changed = set(changed_files)
+    affected = set()
+    for name, check in CHECKS.items():
+        if check.inputs is None:
+            if listing_changed:
+                affected.add(name)
+        elif check.reads_any(changed):
+            affected.add(name)
+    return affected
+
+def run_asa_checks(
+    slice_path: Union[Path, SliceContext],
+    checks: Optional[Set[str]] = None,
+    previous: Optional[Dict] = None,
+    graph: Optional[ImportGraph] = None,
+    profile: bool = False
+) -> Dict:
+    """
+    Run all registered ASA checks on a slice.
+
+    Checks whose prerequisites fail are SKIPPED; independent checks run
+    concurrently. If checks is given, only those checks run and every other
+    check reuses its entry from previous (results of an earlier run on the
+    same slice).
+    With a project ImportGraph, imports are also checked transitively.
+    With profile, results["profile"] records wall time, CPU time and peak
+    allocated memory (tracemalloc) per check and for the slice.
+    """
+    # One context per slice: the directory is listed, files are read and the
+    # contract/ASTs are parsed once and shared by every linter below
+    ctx = SliceContext.of(slice_path)
+    slice_path = ctx.path
+
+    results: Dict[str, Any] = {
+        "slice_path": str(slice_path),
+        "checks": {},
+        "overall_status": "PASSED",
+        "has_warnings": False
+    }
+
+    started_tracing = profile and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    check_profiles = {}
+
+    def run_profiled(check: Check, ctx: SliceContext, graph: Optional[ImportGraph]) -> Dict:
+        result, check_profiles[check.name] = measure(run_check, check, ctx, graph)
+        return result
+
+    try:
+        # tracemalloc peaks are process-wide, so profiled checks run one at a time
+        results["checks"] = run_checks(
+            ctx,
+            graph,
+            selected=checks,
+            previous=previous,
+            run=run_profiled if profile else None,
+            concurrent=not profile
+        )
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    if profile:
+        results["profile"] = summarize_profile(check_profiles)
+
+    statuses = {check_data["status"] for check_data in results["checks"].values()}
+    if "FAILED" in statuses:
         results["overall_status"] = "FAILED"
+    if "WARNING" in statuses:
+        results["has_warnings"] = True
+
+    return results
 
+def run_asa_checks_cached(
+    slice_path: Union[Path, SliceContext],
+    cache_dir: Path = CACHE_DIR,
+    graph: Optional[ImportGraph] = None
+) -> Dict:
+    """
+    Run all ASA linters on a slice, replaying cached results when none of
+    the slice files (nor the linter code) changed since the last run.
+    With a graph, changes to any module the slice depends on also count.
+
+    The returned results carry a "cached" flag.
+    """
+    ctx = SliceContext.of(slice_path)
+    cache = LintCache(cache_dir)
+    extra = CHECKS.signature()
+    if graph is not None:
+        extra += "\0" + graph.slice_fingerprint(slice_module_name(ctx.path) or "")
+    # A new bench-slice run changes the performance_budget result
+    extra += "\0" + results_fingerprint(ctx.path)
+    key = slice_cache_key(ctx, extra)
+
+    results = cache.get(key)
+    if results is not None:
+        results["cached"] = True
+        return results
+
+    results = run_asa_checks(ctx, graph=graph)
+    cache.put(key, results)
+    results["cached"] = False
     return results
 
+# Import graph of the current lint-all run inside a worker process (sent
+# once per worker by the pool initializer instead of once per slice)
+_worker_graph: Optional[ImportGraph] = None
+
+def _init_worker(graph: Optional[ImportGraph]) -> None:
+    global _worker_graph
+    _worker_graph = graph
+
+def _run_one(
+    slice_path: Path,
+    cache_dir: Optional[Path],
+    graph: Optional[ImportGraph] = None,
+    profile: bool = False
+) -> Dict:
+    """Lint one slice, through the cache unless cache_dir is None (or profiling)."""
+    if graph is None:
+        graph = _worker_graph
+    if cache_dir is None or profile:
+        return run_asa_checks(slice_path, graph=graph, profile=profile)
+    return run_asa_checks_cached(slice_path, cache_dir, graph)
+
+def run_asa_checks_many(
+    slice_paths: List[Path],
+    jobs: int = 1,
+    cache_dir: Optional[Path] = None,
+    graph: Optional[ImportGraph] = None,
+    profile: bool = False
+) -> Generator[Dict, None, None]:
+    """
+    Run all ASA linters on many slices.
+
+    With jobs > 1 the slices are spread across worker processes. Results are
+    always yielded in the order of slice_paths. Closing the iterator early
+    (e.g. on --fail-fast) cancels every slice that has not started yet.
+    With cache_dir set, unchanged slices replay their cached results.
+    The import graph (if any) is shared by all slices. Profiling always
+    re-runs every slice (cached results carry no timings).
+    """
+    if jobs <= 1 or len(slice_paths) <= 1:
+        for slice_path in slice_paths:
+            yield _run_one(slice_path, cache_dir, graph, profile)
+        return
+
+    executor = ProcessPoolExecutor(
+        max_workers=min(jobs, len(slice_paths)),
+        initializer=_init_worker,
+        initargs=(graph,)
+    )
+    try:
+        futures = [
+            executor.submit(_run_one, slice_path, cache_dir, None, profile)
+            for slice_path in slice_paths
+        ]
+        for future in futures:
+            yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def run_asa_checks_in_memory(
+    slices: Dict[Path, Dict[str, bytes]],
+    root: Path = Path("."),
+    cache_dir: Optional[Path] = CACHE_DIR
+) -> List[Dict]:
+    """
+    Run all ASA linters on slices held in memory instead of on disk (e.g.
+    rendered by the generator but not written yet).
+
+    slices maps each slice path to its complete contents (slice-relative
+    POSIX path -> bytes). The import graph is the working tree under root
+    overlaid with those files, so the slices are linted exactly as they
+    would be once written. Results are returned in the order of slices.
+    """
+    root = Path(root)
+    overlay = {}
+    for slice_path, files in slices.items():
+        try:
+            prefix = Path(slice_path).absolute().relative_to(root.absolute()).as_posix()
+        except ValueError:
+            # Outside the project: linted without being part of the graph
+            continue
+        overlay.update({f"{prefix}/{name}": data for name, data in files.items()})
+    graph = ImportGraph.build(root, cache_dir, overlay=overlay)
+    return [
+        run_asa_checks(SliceContext.from_files(Path(slice_path), files), graph=graph)
+        for slice_path, files in slices.items()
+    ]
+
 def format_results(results: Dict) -> str:
     """Format linter results for CLI output."""
     output = []
@@ -61,13 +291,19 @@ def format_results(results: Dict) -> str:
     # Print each check
     for check_name, check_data in results["checks"].items():
         status = check_data["status"]
-        icon = "✅" if status == "OK" else ("⚠️" if status == "WARNING" else "❌")
-        output.append(f"{icon} {check_name.replace('_', ' ').title()}: {status}")
+        icon = {"OK": "✅", "WARNING": "⚠️", "SKIPPED": "⏭️"}.get(status, "❌")
+        line = f"{icon} {check_name.replace('_', ' ').title()}: {status}"
+        if "reason" in check_data:
+            line += f" ({check_data['reason']})"
+        output.append(line)
 
         if check_data["errors"]:
             for error in check_data["errors"]:
                 output.append(f"  {error}")
 
+        for warning in check_data.get("warnings", []):
+            output.append(f"  {warning}")
+
     # Overall result
     output.append(f"\nResult: {results['overall_status']}")
     if results["has_warnings"]:
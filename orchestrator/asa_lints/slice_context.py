@@ -0,0 +1,314 @@
+"""ASA Linter: Shared Slice Context"""
+import ast
+import json
+import os
+import stat
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Union
+
+from ..paths import CONTRACT_FILE, SKIPPED_DIRS
+
+# (mtime_ns, size) of a file, used to detect changes without reading it
+Signature = Tuple[int, int]
+
+_UNSET = object()
+
+
+class CachedFile:
+    """Bytes of one file plus whatever was parsed from them."""
+
+    __slots__ = ("signature", "data", "tree", "json", "json_error")
+
+    def __init__(self, signature: Signature, data: bytes):
+        self.signature = signature
+        self.data = data
+        self.tree: Any = _UNSET
+        self.json: Any = _UNSET
+        self.json_error: Optional[str] = None
+
+
+class FileCache:
+    """
+    In-memory cache of file bytes, ASTs and parsed JSON shared by many
+    SliceContexts (used by long-running processes such as watch mode).
+
+    Entries are keyed by absolute path and only reused while the file's
+    (mtime_ns, size) signature is unchanged.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, CachedFile] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, path: str, signature: Signature) -> Optional[CachedFile]:
+        """Return the cached entry for path if it is still current."""
+        entry = self._entries.get(path)
+        if entry is not None and entry.signature == signature:
+            return entry
+        return None
+
+    def store(self, path: str, signature: Signature, data: bytes) -> CachedFile:
+        """Cache the bytes of path, replacing any stale entry."""
+        entry = CachedFile(signature, data)
+        self._entries[path] = entry
+        return entry
+
+    def discard(self, path: str) -> None:
+        """Forget a file (e.g. after it was deleted)."""
+        self._entries.pop(path, None)
+
+
+class SliceContext:
+    """
+    Everything the linters need to know about one slice, loaded once.
+
+    The slice directory is listed once with os.scandir, each file is read at
+    most once, and the contract and Python ASTs are parsed at most once.
+    All linters accept either a slice path or a SliceContext, so
+    run_asa_checks can share one context between them.
+
+    With a FileCache, unchanged files are served from memory across
+    contexts, so a long-running process only re-reads and re-parses files
+    whose stat signature changed.
+    """
+
+    def __init__(self, slice_path: Path, file_cache: Optional[FileCache] = None):
+        self.path = Path(slice_path)
+        self.file_cache = file_cache
+        self._exists: Optional[bool] = None
+        self._is_dir = False
+        self._files: Optional[Set[str]] = None
+        self._signatures: Dict[str, Signature] = {}
+        self._entries: Dict[str, CachedFile] = {}
+        self._bytes: Dict[str, Optional[bytes]] = {}
+        self._trees: Dict[str, Optional[ast.Module]] = {}
+        self._contract_loaded = False
+        self._contract: Any = None
+        self._contract_error: Optional[str] = None
+        self._memo: Dict[Any, Any] = {}
+        # Checks may run concurrently; each file is still listed, read and parsed once
+        self._lock = threading.RLock()
+
+    @classmethod
+    def of(cls, source: Union[Path, str, "SliceContext"]) -> "SliceContext":
+        """Return source itself if it is a context, otherwise load one."""
+        if isinstance(source, SliceContext):
+            return source
+        return cls(Path(source))
+
+    @classmethod
+    def from_files(cls, slice_path: Path, files: Dict[str, bytes]) -> "SliceContext":
+        """
+        Context over in-memory files (relative POSIX path -> bytes) instead
+        of the directory on disk, e.g. blobs staged in the git index.
+        """
+        ctx = cls(slice_path)
+        ctx._exists = True
+        ctx._is_dir = True
+        ctx._files = set(files)
+        ctx._bytes = dict(files)
+        return ctx
+
+    # ------------------------------------------------------------------
+    # Directory listing
+    # ------------------------------------------------------------------
+
+    @property
+    def exists(self) -> bool:
+        """Whether the slice path exists."""
+        if self._exists is None:
+            self._scan()
+        return bool(self._exists)
+
+    @property
+    def is_dir(self) -> bool:
+        """Whether the slice path is a directory."""
+        if self._exists is None:
+            self._scan()
+        return self._is_dir
+
+    @property
+    def files(self) -> Set[str]:
+        """Relative POSIX paths of all files in the slice (e.g. 'tests/test_slice.py')."""
+        files = self._files
+        return files if files is not None else self._scan()
+
+    @property
+    def signatures(self) -> Dict[str, Signature]:
+        """(mtime_ns, size) per file; only collected when a FileCache is used."""
+        if self._files is None:
+            self._scan()
+        return self._signatures
+
+    def has_file(self, name: str) -> bool:
+        """Check if the slice contains a file (relative POSIX path)."""
+        return name in self.files
+
+    def _scan(self) -> Set[str]:
+        """List the slice directory tree once (returns the files)."""
+        with self._lock:
+            if self._files is not None:
+                return self._files
+
+            files: Set[str] = set()
+            try:
+                st = os.stat(self.path)
+            except OSError:
+                exists, is_dir = False, False
+            else:
+                exists, is_dir = True, stat.S_ISDIR(st.st_mode)
+
+            if is_dir:
+                self._list_tree(files)
+            self._is_dir = is_dir
+            self._exists = exists
+            self._files = files
+            return files
+
+    def _list_tree(self, files: Set[str]) -> None:
+        pending = [("", str(self.path))]
+        while pending:
+            prefix, directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in SKIPPED_DIRS and not entry.name.startswith("."):
+                                pending.append((f"{prefix}{entry.name}/", entry.path))
+                        elif entry.is_file():
+                            name = f"{prefix}{entry.name}"
+                            files.add(name)
+                            if self.file_cache is not None:
+                                st = entry.stat()
+                                self._signatures[name] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                continue
+
+    # ------------------------------------------------------------------
+    # File contents
+    # ------------------------------------------------------------------
+
+    def read_bytes(self, name: str) -> Optional[bytes]:
+        """Read a slice file once and return its bytes (None if missing)."""
+        if name not in self._bytes:
+            with self._lock:
+                if name not in self._bytes:
+                    data = None
+                    if self.has_file(name):
+                        data = self._read_cached(name)
+                    self._bytes[name] = data
+        return self._bytes[name]
+
+    def _read_cached(self, name: str) -> Optional[bytes]:
+        """Read a file, going through the FileCache when there is one."""
+        file_path = self.path / name
+        signature = self._signatures.get(name)
+
+        if self.file_cache is not None and signature is not None:
+            key = str(file_path.absolute())
+            entry = self.file_cache.lookup(key, signature)
+            if entry is None:
+                try:
+                    data = file_path.read_bytes()
+                except OSError:
+                    self.file_cache.discard(key)
+                    return None
+                entry = self.file_cache.store(key, signature, data)
+            self._entries[name] = entry
+            return entry.data
+
+        try:
+            return file_path.read_bytes()
+        except OSError:
+            return None
+
+    def read_text(self, name: str) -> Optional[str]:
+        """Read a slice file once and return it decoded as UTF-8 (None if missing)."""
+        data = self.read_bytes(name)
+        if data is None:
+            return None
+        return data.decode("utf-8", errors="replace")
+
+    def tree(self, name: str) -> Optional[ast.Module]:
+        """Parse a Python file once (None if missing or not valid Python)."""
+        if name not in self._trees:
+            with self._lock:
+                if name not in self._trees:
+                    self._trees[name] = self._parse(name)
+        return self._trees[name]
+
+    def _parse(self, name: str) -> Optional[ast.Module]:
+        data = self.read_bytes(name)
+        entry = self._entries.get(name)
+        if entry is not None and entry.tree is not _UNSET:
+            cached: Optional[ast.Module] = entry.tree
+            return cached
+
+        tree = None
+        if data is not None:
+            try:
+                tree = ast.parse(data, filename=str(self.path / name))
+            except (SyntaxError, ValueError):
+                tree = None
+        if entry is not None:
+            entry.tree = tree
+        return tree
+
+    def memo(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """
+        Compute a derived value (e.g. rule engine results for a file) once
+        per context and share it between checks.
+        """
+        if key not in self._memo:
+            with self._lock:
+                if key not in self._memo:
+                    self._memo[key] = compute()
+        return self._memo[key]
+
+    # ------------------------------------------------------------------
+    # Contract
+    # ------------------------------------------------------------------
+
+    @property
+    def contract(self) -> Any:
+        """Parsed slice.contract.json (None if missing or invalid)."""
+        self._load_contract()
+        return self._contract
+
+    @property
+    def contract_error(self) -> Optional[str]:
+        """Why the contract could not be loaded (None if it loaded)."""
+        self._load_contract()
+        return self._contract_error
+
+    def _load_contract(self) -> None:
+        if self._contract_loaded:
+            return
+        with self._lock:
+            if not self._contract_loaded:
+                self._parse_contract()
+                self._contract_loaded = True
+
+    def _parse_contract(self) -> None:
+        data = self.read_bytes(CONTRACT_FILE)
+        if data is None:
+            self._contract_error = f"{CONTRACT_FILE} not found"
+            return
+
+        entry = self._entries.get(CONTRACT_FILE)
+        if entry is not None and entry.json is not _UNSET:
+            self._contract = entry.json
+            self._contract_error = entry.json_error
+            return
+
+        try:
+            self._contract = json.loads(data)
+        except ValueError as e:
+            self._contract_error = f"Invalid JSON: {str(e)}"
+
+        if entry is not None:
+            entry.json = self._contract
+            entry.json_error = self._contract_error
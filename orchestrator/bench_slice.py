@@ -0,0 +1,265 @@
+"""
+ASA Slice Benchmarks
+
+Drives the endpoints budgeted in a slice contract's "performance" block
+in-process: the slice's router is mounted on a bare FastAPI app and called
+through httpx's ASGI transport, so no server, port or network is involved.
+The contract's public_api endpoint is driven too when it has no budget
+(without limits or a sample request), as a first measurement.
+Results are stored under .asa_cache/bench/ for the performance_budget
+check, together with a hash of the slice sources that marks them stale
+once the slice changes.
+
+Each endpoint is measured in two passes: a timed pass (latency
+percentiles and throughput of sequential requests) and a separate pass
+under tracemalloc for memory growth, whose tracing overhead would
+otherwise distort the timings.
+"""
+import asyncio
+import gc
+import importlib
+import json
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .asa_lints.import_graph import slice_module_name
+from .asa_lints.lint_cache import CACHE_DIR
+from .asa_lints.lint_performance import (
+    bench_results_path,
+    budget_violations,
+    get_budgets,
+    source_hash,
+)
+from .asa_lints.slice_context import SliceContext
+
+DEFAULT_REQUESTS = 200
+DEFAULT_WARMUP = 20
+
+BASE_URL = "http://asa-bench"
+
+
+class BenchError(Exception):
+    """The slice cannot be benchmarked (no router, unknown endpoint, ...)."""
+
+
+def load_router(slice_path: Path, root: Path = Path(".")) -> Any:
+    """Import the slice's handler module (with root on sys.path) and return its router."""
+    module_name = slice_module_name(slice_path)
+    if module_name is None:
+        raise BenchError(f"Not inside a domains/ directory: {slice_path}")
+    root_dir = str(Path(root).absolute())
+    if root_dir not in sys.path:
+        sys.path.insert(0, root_dir)
+    try:
+        handler = importlib.import_module(f"{module_name}.handler")
+    except ImportError as e:
+        raise BenchError(f"Cannot import {module_name}.handler: {e}") from e
+    router = getattr(handler, "router", None)
+    if router is None:
+        raise BenchError(f"{module_name}.handler defines no router")
+    return router
+
+
+def build_app(router: Any) -> Any:
+    """A bare FastAPI app serving only the slice's router."""
+    from fastapi import FastAPI
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+def route_endpoints(router: Any) -> List[str]:
+    """'METHOD /path' of every route on the slice router."""
+    endpoints = []
+    for route in router.routes:
+        for method in sorted(getattr(route, "methods", None) or ()):
+            endpoints.append(f"{method} {route.path}")
+    return endpoints
+
+
+def public_api_endpoint(ctx: SliceContext) -> Optional[str]:
+    """The contract's public_api endpoint ("METHOD /path"), if it declares one."""
+    contract = ctx.contract
+    public_api = contract.get("public_api") if isinstance(contract, dict) else None
+    endpoint = public_api.get("endpoint") if isinstance(public_api, dict) else None
+    if not isinstance(endpoint, str) or not re.match(r"^[A-Z]+ /", endpoint):
+        return None
+    return endpoint
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..100) of a non-empty sample."""
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * q // 100))  # ceil(n * q / 100)
+    return ordered[int(rank) - 1]
+
+
+async def _send(client: Any, method: str, path: str, request: Dict[str, Any]) -> Any:
+    return await client.request(
+        method,
+        path,
+        json=request.get("json"),
+        headers=request.get("headers"),
+        params=request.get("params"),
+    )
+
+
+async def _bench_endpoint(
+    client: Any,
+    endpoint: str,
+    budget: Dict[str, Any],
+    requests: int,
+    warmup: int
+) -> Dict[str, Any]:
+    method, path = endpoint.split(" ", 1)
+    request = budget.get("request", {})
+
+    for _ in range(warmup):
+        await _send(client, method, path, request)
+
+    # Timed pass
+    latencies = []
+    status_codes: Dict[str, int] = {}
+    started = time.perf_counter()
+    for _ in range(requests):
+        t0 = time.perf_counter()
+        response = await _send(client, method, path, request)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        status = str(response.status_code)
+        status_codes[status] = status_codes.get(status, 0) + 1
+    elapsed = time.perf_counter() - started
+
+    # Memory pass: traced allocations still alive after the same workload
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(requests):
+            await _send(client, method, path, request)
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    return {
+        "requests": requests,
+        "status_codes": status_codes,
+        "p50_ms": percentile(latencies, 50),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": max(latencies),
+        "rps": requests / elapsed if elapsed else float("inf"),
+        "memory_growth_kb": max(0, after - before) / 1024,
+    }
+
+
+async def _bench_app(
+    app: Any,
+    budgets: Dict[str, Dict[str, Any]],
+    requests: int,
+    warmup: int
+) -> Dict[str, Dict[str, Any]]:
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url=BASE_URL) as client:
+        return {
+            endpoint: await _bench_endpoint(client, endpoint, budget, requests, warmup)
+            for endpoint, budget in budgets.items()
+        }
+
+
+def bench_slice(
+    slice_path: Path,
+    root: Path = Path("."),
+    requests: int = DEFAULT_REQUESTS,
+    warmup: int = DEFAULT_WARMUP,
+    cache_dir: Optional[Path] = CACHE_DIR
+) -> Dict[str, Any]:
+    """
+    Benchmark every endpoint budgeted in the slice contract (and the
+    public_api endpoint if it has no budget) and return
+    {"slice_path", "source_hash", "endpoints": {endpoint: measurements},
+    "violations": [...]}. With cache_dir, the results are also stored for
+    the performance_budget check.
+    """
+    if requests < 1:
+        raise BenchError("requests must be at least 1")
+    ctx = SliceContext.of(Path(slice_path))
+    if ctx.contract_error:
+        raise BenchError(f"Invalid contract: {ctx.contract_error}")
+    budgets = get_budgets(ctx)
+    targets = dict(budgets)
+    endpoint = public_api_endpoint(ctx)
+    if endpoint is not None and endpoint not in targets:
+        targets[endpoint] = {}
+    if not targets:
+        raise BenchError(
+            f"No performance budgets or public_api endpoint in {ctx.path}/slice.contract.json"
+        )
+
+    router = load_router(ctx.path, root)
+    served = set(route_endpoints(router))
+    unknown = sorted(endpoint for endpoint in targets if endpoint not in served)
+    if unknown:
+        raise BenchError(
+            f"Contract endpoint(s) not served by the slice router: {', '.join(unknown)}"
+        )
+
+    endpoints = asyncio.run(_bench_app(build_app(router), targets, requests, warmup))
+    results = {
+        "slice_path": str(ctx.path),
+        "source_hash": source_hash(ctx),
+        "endpoints": endpoints,
+    }
+
+    if cache_dir is not None:
+        path = bench_results_path(ctx.path, cache_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(results, indent=2))
+        tmp.replace(path)
+
+    results["violations"] = [
+        violation
+        for endpoint, budget in budgets.items()
+        for violation in budget_violations(endpoint, budget, endpoints[endpoint])
+    ]
+    return results
+
+
+def format_bench(results: Dict[str, Any], budgets: Dict[str, Dict[str, Any]]) -> str:
+    """Table of measurements against budgets for CLI output."""
+    output = [f"\nBenchmarking: {results['slice_path']}\n"]
+    for endpoint, measured in results["endpoints"].items():
+        budget = budgets.get(endpoint, {})
+        statuses = ", ".join(f"{code}×{count}" for code, count in sorted(measured["status_codes"].items()))
+        output.append(f"{endpoint}  ({measured['requests']} requests: {statuses})")
+        if endpoint not in budgets:
+            output.append("  no budget (add one, with a sample request, to the contract's performance block)")
+        rows = [
+            ("p50", f"{measured['p50_ms']:.2f} ms", None, "", ""),
+            ("p99", f"{measured['p99_ms']:.2f} ms", budget.get("p99_ms"), "≤", "ms"),
+            ("throughput", f"{measured['rps']:.0f} req/s", budget.get("min_rps"), "≥", "req/s"),
+            ("memory growth", f"{measured['memory_growth_kb']:.1f} KiB",
+             budget.get("max_memory_growth_kb"), "≤", "KiB"),
+        ]
+        for label, value, limit, relation, unit in rows:
+            line = f"  {label:<14} {value:>14}"
+            if limit is not None:
+                line += f"   budget {relation} {limit} {unit}"
+            output.append(line)
+    output.append("")
+    if results["violations"]:
+        output.extend(f"❌ {violation}" for violation in results["violations"])
+        output.append("\nResult: FAILED")
+    else:
+        output.append("Result: PASSED")
+    return "\n".join(output)
@@ -0,0 +1,15 @@
+"""
+ASA CLI subcommands.
+
+Each module defines one command (or command group) and imports only what
+that command needs; orchestrator.cli loads them on first use.
+"""
+from typing import Optional
+
+import click
+
+
+def emit(text: Optional[str]) -> None:
+    """Print a reporter chunk (reporters return None when there is nothing to say)."""
+    if text is not None:
+        click.echo(text)
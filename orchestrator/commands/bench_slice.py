@@ -0,0 +1,51 @@
+"""asa bench-slice"""
+import click
+from pathlib import Path
+
+from ..asa_lints.lint_cache import CACHE_DIR
+
+
+@click.command("bench-slice")
+@click.argument("slice_path", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--requests",
+    "-n",
+    type=click.IntRange(min=1),
+    default=200,
+    help="Timed requests per endpoint (default: 200)"
+)
+@click.option(
+    "--warmup",
+    type=click.IntRange(min=0),
+    default=20,
+    help="Untimed requests per endpoint before measuring (default: 20)"
+)
+@click.pass_context
+def bench_slice(ctx: click.Context, slice_path: str, requests: int, warmup: int) -> None:
+    """
+    Benchmark a slice against its performance budgets.
+
+    Drives every endpoint listed in the "performance" block of
+    slice.contract.json in-process (ASGI, no server) and compares p99
+    latency, throughput and memory growth with the budgets. The
+    public_api endpoint is measured too if it has no budget. Results are
+    stored in .asa_cache/bench/, where the performance_budget lint check
+    picks them up.
+
+    Example:
+        asa bench-slice domains/auth/slices/login_demo
+        asa bench-slice domains/auth/slices/login_demo --requests 1000
+    """
+    from ..asa_lints.lint_performance import get_budgets
+    from ..bench_slice import BenchError, bench_slice as run_bench, format_bench
+
+    path = Path(slice_path)
+    try:
+        results = run_bench(path, Path("."), requests, warmup, CACHE_DIR)
+    except BenchError as e:
+        click.echo(f"❌ {e}", err=True)
+        ctx.exit(1)
+
+    click.echo(format_bench(results, get_budgets(path)))
+    if results["violations"]:
+        ctx.exit(1)
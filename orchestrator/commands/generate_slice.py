@@ -0,0 +1,450 @@
+"""asa generate-slice"""
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+import click
+from pathlib import Path
+
+from ..asa_lints import (
+    run_asa_checks,
+    run_asa_checks_many,
+    run_asa_checks_in_memory,
+    format_results,
+    ImportGraph,
+)
+from ..asa_lints.lint_cache import CACHE_DIR
+from ..asa_lints.reporters import LintSummary, make_reporter
+from mcp_server.slice_io import FORMATS
+from . import emit
+
+MCP_SERVER_URL = "http://localhost:8001"
+
+# Per-request timeout; batches get extra time per slice
+TIMEOUT = 30.0
+BATCH_TIMEOUT_PER_SLICE = 2.0
+
+
+def default_output(domain: str, slice_name: str) -> str:
+    return f"domains/{domain}/slices/{slice_name}"
+
+
+def load_manifest(manifest_path: Path) -> List[Dict[str, str]]:
+    """
+    Slices listed in a manifest file: a JSON list (or {"slices": [...]}) of
+    {"func_spec", "domain", "slice_name"[, "output"]} objects. Returns
+    generate-batch request items. Raises ValueError if the file is invalid.
+    """
+    try:
+        manifest = json.loads(Path(manifest_path).read_text())
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON in {manifest_path}: {e}") from e
+    if isinstance(manifest, dict):
+        manifest = manifest.get("slices")
+    if not isinstance(manifest, list) or not manifest:
+        raise ValueError(f"{manifest_path} must list at least one slice")
+
+    items = []
+    for index, entry in enumerate(manifest):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Slice #{index} must be an object")
+        missing = [
+            key for key in ("func_spec", "domain", "slice_name")
+            if not isinstance(entry.get(key), str) or not entry[key]
+        ]
+        if missing:
+            raise ValueError(f"Slice #{index} is missing: {', '.join(missing)}")
+        items.append({
+            "func_spec": entry["func_spec"],
+            "domain": entry["domain"],
+            "slice_name": entry["slice_name"],
+            "output_path": entry.get("output") or default_output(entry["domain"], entry["slice_name"]),
+        })
+    return items
+
+
+@click.command()
+@click.option(
+    "--func-spec",
+    "-f",
+    default=None,
+    help="Functional specification (plain text)"
+)
+@click.option(
+    "--domain",
+    "-d",
+    default=None,
+    help="Domain name (e.g., auth, users)"
+)
+@click.option(
+    "--slice-name",
+    "-s",
+    default=None,
+    help="Slice name (e.g., login, register)"
+)
+@click.option(
+    "--output",
+    "-o",
+    help="Output directory (default: domains/<domain>/slices/<slice-name>)",
+    default=None
+)
+@click.option(
+    "--manifest",
+    "-m",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="JSON file listing many slices to generate in one batch request"
+)
+@click.option(
+    "--stream",
+    type=click.Choice(FORMATS),
+    is_flag=False,
+    flag_value="ndjson",
+    default=None,
+    help="Have the server render in memory and stream the files back as an "
+         "archive (ndjson with progress, tar or zip; default: ndjson), then "
+         "write them locally"
+)
+@click.option(
+    "--keep-invalid",
+    is_flag=True,
+    help="Write generated slices even if they fail the ASA checks "
+         "(they are linted after writing instead of before)"
+)
+def generate_slice(
+    func_spec: Optional[str],
+    domain: Optional[str],
+    slice_name: Optional[str],
+    output: Optional[str],
+    manifest: Optional[str],
+    stream: Optional[str],
+    keep_invalid: bool
+) -> int:
+    """
+    Generate a new slice from functional specification.
+
+    This command calls the MCP server to generate:
+    - slice.spec.md
+    - slice.contract.json
+    - Skeleton files (handler, service, repository, schemas, tests)
+
+    With --manifest, every slice listed in the file is generated by one
+    batch request and all of them are linted in a single pass. The
+    manifest is a JSON list of {"func_spec", "domain", "slice_name"} objects
+    (with an optional "output").
+
+    With --stream, nothing is written on the server: the rendered files are
+    streamed back and written here, so the MCP server may run on another
+    machine.
+
+    Generated slices are linted in memory before anything is written, and
+    a slice that fails the checks is not written at all (an existing slice
+    is left as it was). --keep-invalid writes them anyway.
+
+    Example:
+        asa generate-slice \\
+          --func-spec "User registration with email verification" \\
+          --domain auth \\
+          --slice-name register
+        asa generate-slice --manifest slices.json
+        asa generate-slice --manifest slices.json --stream
+    """
+    if manifest is not None:
+        if func_spec or domain or slice_name or output:
+            raise click.UsageError("--manifest cannot be combined with single-slice options.")
+        try:
+            items = load_manifest(Path(manifest))
+        except (OSError, ValueError) as e:
+            click.echo(f"❌ {e}", err=True)
+            return 1
+        if stream:
+            return _generate_streamed(items, stream, keep_invalid)
+        return _generate_batch(items, Path(manifest), keep_invalid)
+
+    if not (func_spec and domain and slice_name):
+        raise click.UsageError(
+            "Missing option '--func-spec', '--domain' or '--slice-name' (or use --manifest)."
+        )
+
+    if stream:
+        return _generate_streamed([{
+            "func_spec": func_spec,
+            "domain": domain,
+            "slice_name": slice_name,
+            "output_path": output or default_output(domain, slice_name),
+        }], stream, keep_invalid)
+
+    import httpx
+
+    # Default output path
+    if output is None:
+        output = default_output(domain, slice_name)
+
+    output_path = Path(output)
+
+    # Check if slice already exists
+    if output_path.exists():
+        if not click.confirm(f"⚠️ Slice already exists at {output}. Overwrite?"):
+            click.echo("Cancelled")
+            return 0
+
+    click.echo(f"\n🔨 Generating slice: {domain}/{slice_name}\n")
+
+    # Call MCP server
+    try:
+        # Note: MCP server must be running (Task 6)
+        response = httpx.post(
+            f"{MCP_SERVER_URL}/mcp/generate-skeleton",
+            json={
+                "func_spec": func_spec,
+                "domain": domain,
+                "slice_name": slice_name,
+                "output_path": str(output_path),
+                "check": not keep_invalid
+            },
+            timeout=TIMEOUT
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            if not data["success"]:
+                # Linted in memory on the server and not written
+                click.echo(format_results(data["lint_results"]))
+                click.echo(f"\n❌ {data['error']}", err=True)
+                click.echo("Use --keep-invalid to write it anyway.", err=True)
+                return 1
+
+            click.echo("✅ Slice generated successfully!\n")
+            created_files = data.get("created_files", [])
+            if created_files:
+                click.echo("Created files:")
+                for file in created_files:
+                    click.echo(f"  • {file}")
+            else:
+                click.echo("No files changed (existing slice is up to date)")
+
+            results = data.get("lint_results")
+            if results is None:
+                # Run linter
+                click.echo("\n🔍 Running linter...\n")
+                results = run_asa_checks(output_path)
+            else:
+                click.echo("\n🔍 Linted before writing:\n")
+            output_text = format_results(results)
+            click.echo(output_text)
+
+            if results["overall_status"] == "PASSED":
+                click.echo("\n✅ Slice is ready to use!")
+                click.echo("\nNext steps:")
+                click.echo(f"  1. Review generated files in {output}")
+                click.echo("  2. Implement business logic in service.py")
+                click.echo(f"  3. Run tests: pytest {output}/tests/")
+                click.echo("  4. Register router in main.py")
+            else:
+                click.echo("\n⚠️ Linter found issues. Please fix before using.")
+        else:
+            click.echo(f"❌ MCP server error: {response.status_code}", err=True)
+            click.echo(response.text, err=True)
+            return 1
+
+    except httpx.ConnectError:
+        click.echo("❌ Cannot connect to MCP server", err=True)
+        click.echo("Make sure MCP server is running: asa mcp-server start", err=True)
+        return 1
+    except Exception as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        return 1
+    return 0
+
+
+def _confirm_overwrite(items: List[Dict[str, str]]) -> bool:
+    """Ask before overwriting slices that already exist."""
+    existing = [item["output_path"] for item in items if Path(item["output_path"]).exists()]
+    if not existing:
+        return True
+    click.echo("⚠️ These slices already exist:")
+    for output in existing:
+        click.echo(f"  • {output}")
+    if not click.confirm("Overwrite?"):
+        click.echo("Cancelled")
+        return False
+    return True
+
+
+def _report(all_results: Iterable[Dict], count: int) -> LintSummary:
+    """Print lint results of generated slices; returns the summary."""
+    reporter = make_reporter("text")
+    summary = LintSummary()
+    emit(reporter.start(count))
+    for results in all_results:
+        summary.add(results)
+        emit(reporter.slice(results))
+    emit(reporter.finish(summary))
+    return summary
+
+
+def _lint_generated(generated: List[Path], expected: int) -> int:
+    """Lint generated slices in one pass with one import graph; exit code."""
+    if not generated:
+        return 1
+
+    click.echo("\n🔍 Running linter...")
+    graph = ImportGraph.build(Path("."), CACHE_DIR)
+    summary = _report(run_asa_checks_many(generated, graph=graph), len(generated))
+
+    return 1 if summary.failed or len(generated) < expected else 0
+
+
+def _generate_batch(
+    items: List[Dict[str, str]],
+    manifest_path: Path,
+    keep_invalid: bool = False
+) -> int:
+    """
+    Generate all slices of a manifest with one request. The server lints
+    them in one in-memory pass and writes only the ones that pass (with
+    keep_invalid, all are written and then linted here).
+    """
+    import httpx
+
+    if not _confirm_overwrite(items):
+        return 0
+
+    click.echo(f"\n🔨 Generating {len(items)} slice(s) from {manifest_path}\n")
+
+    try:
+        response = httpx.post(
+            f"{MCP_SERVER_URL}/mcp/generate-batch",
+            json={"slices": items, "check": not keep_invalid},
+            timeout=TIMEOUT + BATCH_TIMEOUT_PER_SLICE * len(items)
+        )
+    except httpx.ConnectError:
+        click.echo("❌ Cannot connect to MCP server", err=True)
+        click.echo("Make sure MCP server is running: asa mcp-server start", err=True)
+        return 1
+    except Exception as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        return 1
+
+    if response.status_code != 200:
+        click.echo(f"❌ MCP server error: {response.status_code}", err=True)
+        click.echo(response.text, err=True)
+        return 1
+
+    generated = []
+    linted = []
+    for result in response.json()["results"]:
+        name = f"{result['domain']}/{result['slice_name']}"
+        if result["success"]:
+            click.echo(f"✅ {name}: {len(result['created_files'])} file(s) in {result['output_path']}")
+            generated.append(Path(result["output_path"]))
+        else:
+            click.echo(f"❌ {name}: {result['error']}", err=True)
+        if "lint_results" in result:
+            linted.append(result["lint_results"])
+
+    if keep_invalid:
+        return _lint_generated(generated, len(items))
+    if not linted:
+        return 1
+    click.echo("\n🔍 Linted before writing:")
+    summary = _report(linted, len(linted))
+    return 1 if summary.failed or len(generated) < len(items) else 0
+
+
+def _generate_streamed(
+    items: List[Dict[str, str]],
+    fmt: str,
+    keep_invalid: bool = False
+) -> int:
+    """
+    Have the server render the slices in memory and stream them back, lint
+    them here in one in-memory pass, then write (atomically) each slice that
+    passes. With keep_invalid, every slice is written and then linted.
+    """
+    import httpx
+    from mcp_server.slice_io import PACKAGE_INIT_FILES, preview_slice, read_archive, write_slice
+
+    if not _confirm_overwrite(items):
+        return 0
+
+    # Slices travel under their canonical path and are mapped back to the
+    # requested output directories here. Entries sharing a domain/slice_name
+    # (but not an output) get a numbered archive path so they stay distinct.
+    outputs = {}
+    slice_requests = []
+    for index, item in enumerate(items):
+        slice_request = {key: item[key] for key in ("func_spec", "domain", "slice_name")}
+        slice_path = default_output(item["domain"], item["slice_name"])
+        if slice_path in outputs:
+            slice_path = f"{slice_path}-{index + 1}"
+            slice_request["path"] = slice_path
+        outputs[slice_path] = Path(item["output_path"])
+        slice_requests.append(slice_request)
+    total = len(items)
+    click.echo(f"\n🔨 Generating {total} slice(s) (streamed as {fmt})\n")
+
+    def progress(event: str, record: Dict[str, Any]) -> None:
+        if event == "slice":
+            click.echo(f"[{record['index'] + 1}/{total}] ✅ {record['path']} ({record['files']} files)")
+        elif event == "error":
+            click.echo(f"[{record['index'] + 1}/{total}] ❌ {record['path']}: {record['error']}", err=True)
+
+    request = {"slices": slice_requests, "format": fmt}
+    try:
+        with httpx.stream(
+            "POST",
+            f"{MCP_SERVER_URL}/mcp/generate-archive",
+            json=request,
+            timeout=TIMEOUT + BATCH_TIMEOUT_PER_SLICE * total
+        ) as response:
+            if response.status_code != 200:
+                click.echo(f"❌ MCP server error: {response.status_code}", err=True)
+                click.echo(response.read().decode(errors="replace"), err=True)
+                return 1
+            slices, _ = read_archive(fmt, response.iter_bytes(), progress)
+    except httpx.ConnectError:
+        click.echo("❌ Cannot connect to MCP server", err=True)
+        click.echo("Make sure MCP server is running: asa mcp-server start", err=True)
+        return 1
+    except Exception as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        return 1
+
+    unexpected = sorted(set(slices) - set(outputs))
+    if unexpected:
+        click.echo(f"❌ MCP server returned unrequested slice(s): {', '.join(unexpected)}", err=True)
+        return 1
+
+    if keep_invalid:
+        generated = []
+        for slice_path, files in slices.items():
+            output_path = outputs[slice_path]
+            write_slice(output_path, files, keep_existing=PACKAGE_INIT_FILES)
+            generated.append(output_path)
+        click.echo(f"\n📦 Wrote {len(generated)} slice(s)")
+        return _lint_generated(generated, total)
+
+    if not slices:
+        return 1
+    click.echo("\n🔍 Running linter (in memory, before writing)...")
+    previews = {
+        outputs[slice_path]: preview_slice(outputs[slice_path], files, keep_existing=PACKAGE_INIT_FILES)
+        for slice_path, files in slices.items()
+    }
+    all_results = run_asa_checks_in_memory(previews)
+    _report(all_results, len(all_results))
+
+    generated = []
+    rejected = []
+    for (slice_path, files), results in zip(slices.items(), all_results):
+        output_path = outputs[slice_path]
+        if results["overall_status"] == "FAILED":
+            rejected.append(output_path)
+            continue
+        write_slice(output_path, files, keep_existing=PACKAGE_INIT_FILES)
+        generated.append(output_path)
+    click.echo(f"\n📦 Wrote {len(generated)} slice(s)")
+    for output_path in rejected:
+        click.echo(f"❌ Not written (failed the ASA checks): {output_path}", err=True)
+
+    return 1 if rejected or len(generated) < total else 0
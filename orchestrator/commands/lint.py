@@ -0,0 +1,157 @@
+"""asa lint"""
+import click
+from pathlib import Path
+from typing import Optional
+
+from ..asa_lints import (
+    run_asa_checks,
+    run_asa_checks_cached,
+    format_results,
+    ImportGraph,
+)
+from ..asa_lints.lint_cache import CACHE_DIR
+from ..asa_lints.reporters import FORMATS, LintSummary, make_reporter
+from . import emit
+
+
+@click.command()
+@click.argument("slice_path", type=click.Path(exists=True), required=False)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help=f"Ignore cached results in {CACHE_DIR}/ and re-lint from scratch"
+)
+@click.option(
+    "--watch",
+    "-w",
+    is_flag=True,
+    help="Keep running and re-lint slices whenever their files change"
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.05),
+    default=0.5,
+    help="Polling interval in seconds for --watch (default: 0.5)"
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(FORMATS),
+    default="text",
+    help="Output format (default: text)"
+)
+@click.option(
+    "--no-server",
+    is_flag=True,
+    help="Lint in this process even if an asa lint-server is running"
+)
+@click.pass_context
+def lint(
+    ctx: click.Context,
+    slice_path: Optional[str],
+    no_cache: bool,
+    watch: bool,
+    interval: float,
+    output_format: str,
+    no_server: bool
+) -> None:
+    """
+    Lint a specific slice.
+
+    Runs all ASA linters on the specified slice:
+    - Structure check (required files)
+    - Contract validation (slice.contract.json)
+    - LOC limits check
+    - Import validation
+
+    SLICE_PATH may also be a file inside a slice. When an asa lint-server
+    is running, the request is forwarded to it and answered from its warm
+    in-memory state.
+
+    With --watch, SLICE_PATH may also be a domain or the domains/ directory
+    (the default), and only the checks affected by each edit are re-run.
+
+    Example:
+        asa lint domains/auth/slices/login_demo
+        asa lint domains/auth/slices/login_demo/service.py
+        asa lint --watch
+    """
+    if watch:
+        ctx.exit(_watch(Path(slice_path or "domains"), interval))
+
+    if slice_path is None:
+        raise click.UsageError("Missing argument 'SLICE_PATH'.")
+
+    from ..lint_server import DEFAULT_SOCKET, find_slice, request
+
+    path = Path(slice_path)
+    if path.is_file():
+        path = find_slice(path) or path
+
+    if not path.is_dir():
+        click.echo(f"❌ Not a directory: {path}", err=True)
+        ctx.exit(1)
+
+    # Forward to a running lint server (thin client mode)
+    response = None
+    if not no_server and not no_cache:
+        response = request(DEFAULT_SOCKET, {"op": "lint", "path": str(path)})
+        if response is not None and not response.get("ok"):
+            click.echo(f"⚠️ Lint server: {response.get('error')} (linting locally)", err=True)
+            response = None
+
+    if response is not None:
+        results = response["results"]
+    else:
+        # Run linters (replaying cached results if the slice is unchanged)
+        graph = ImportGraph.build(Path("."), cache_dir=None if no_cache else CACHE_DIR)
+        if no_cache:
+            results = run_asa_checks(path, graph=graph)
+        else:
+            results = run_asa_checks_cached(path, graph=graph)
+
+    # Format and print results
+    if output_format == "text":
+        output = format_results(results)
+        click.echo(output)
+        if response is not None:
+            click.echo(f"(lint server, {response['elapsed_ms']:.1f} ms)")
+        elif results.get("cached"):
+            click.echo("(cached)")
+    else:
+        reporter = make_reporter(output_format)
+        summary = LintSummary(use_cache=not no_cache)
+        summary.add(results)
+        for chunk in (reporter.start(1), reporter.slice(results), reporter.finish(summary)):
+            emit(chunk)
+
+    # Exit with appropriate code
+    if results["overall_status"] == "FAILED":
+        ctx.exit(1)
+
+
+def _watch(root: Path, interval: float) -> int:
+    """Run lint --watch until interrupted."""
+    from ..watch import LintWatcher
+
+    if not root.is_dir():
+        click.echo(f"❌ Not a directory: {root}", err=True)
+        return 1
+
+    click.echo(f"👀 Watching {root} (Ctrl+C to stop)")
+    # The project graph, as in a plain 'asa lint': transitive imports,
+    # cycles and other slices' exports are checked too
+    graph = ImportGraph.build(Path("."), CACHE_DIR)
+    watcher = LintWatcher(root, graph=graph, cache_dir=CACHE_DIR)
+
+    try:
+        for reports in watcher.watch(interval):
+            for slice_path, results, checks, elapsed_ms in reports:
+                click.echo(format_results(results))
+                click.echo(
+                    f"⏱️ {elapsed_ms:.1f} ms "
+                    f"(re-ran: {', '.join(name for name in results['checks'] if name in checks)})\n"
+                )
+    except KeyboardInterrupt:
+        click.echo("\n👋 Stopped watching")
+    return 0
@@ -0,0 +1,133 @@
+"""asa lint-all"""
+import os
+import tracemalloc
+from contextlib import closing
+
+import click
+from pathlib import Path
+from typing import Optional
+
+from ..asa_lints import run_asa_checks_many, ImportGraph
+from ..asa_lints.lint_cache import CACHE_DIR
+from ..asa_lints.reporters import FORMATS, LintSummary, make_reporter
+from ..asa_lints.profiling import ProfileReport, format_profile, measure
+from ..discovery import SliceIndex
+from . import emit
+
+
+@click.command()
+@click.option(
+    "--domain",
+    "-d",
+    help="Filter by domain",
+    default=None
+)
+@click.option(
+    "--fail-fast",
+    "-f",
+    is_flag=True,
+    help="Stop on first failure"
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Number of worker processes (0 = one per CPU, default: 1)"
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help=f"Ignore cached results in {CACHE_DIR}/ and re-lint every slice"
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(FORMATS),
+    default="text",
+    help="Output format; jsonl and sarif stream one record per slice (default: text)"
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Record time and memory per check and slice, and print the slowest ones"
+)
+@click.pass_context
+def lint_all(
+    ctx: click.Context,
+    domain: Optional[str],
+    fail_fast: bool,
+    jobs: int,
+    no_cache: bool,
+    output_format: str,
+    profile: bool
+) -> None:
+    """
+    Lint all slices in the project.
+
+    Example:
+        asa lint-all
+        asa lint-all --domain auth
+        asa lint-all --fail-fast
+        asa lint-all --jobs 8
+        asa lint-all --no-cache
+        asa lint-all --format sarif > asa.sarif
+        asa lint-all --profile
+    """
+    domains_path = Path("domains")
+
+    if not domains_path.exists():
+        click.echo("❌ No domains/ directory found", err=True)
+        ctx.exit(1)
+
+    # Find all slices (sorted by path)
+    slices = SliceIndex().paths(domain=domain)
+
+    if not slices and output_format == "text":
+        click.echo("No slices found")
+        return
+
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    cache_dir = None if no_cache else CACHE_DIR
+    reporter = make_reporter(output_format)
+    summary = LintSummary(use_cache=not no_cache)
+    emit(reporter.start(len(slices)))
+
+    profile_report = ProfileReport() if profile else None
+    if profile:
+        tracemalloc.start()
+
+    try:
+        # Import graph of the whole project, built once and shared by all slices
+        if profile_report is not None:
+            graph, stats = measure(ImportGraph.build, Path("."), cache_dir)
+            profile_report.add_stage("import_graph", stats)
+        else:
+            graph = ImportGraph.build(Path("."), cache_dir)
+
+        # Each slice is reported as soon as it finishes; only the summary
+        # counters are kept in memory
+        all_results = run_asa_checks_many(
+            slices, jobs=jobs, cache_dir=cache_dir, graph=graph, profile=profile
+        )
+        with closing(all_results):
+            for results in all_results:
+                summary.add(results)
+                if profile_report is not None:
+                    profile_report.add(results)
+                emit(reporter.slice(results))
+
+                if results["overall_status"] == "FAILED" and fail_fast:
+                    summary.stopped = True
+                    break
+    finally:
+        if profile:
+            tracemalloc.stop()
+
+    emit(reporter.finish(summary))
+    if profile_report is not None and output_format == "text":
+        click.echo(format_profile(profile_report))
+    if summary.failed:
+        ctx.exit(1)
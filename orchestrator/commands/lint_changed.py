@@ -0,0 +1,75 @@
+"""asa lint-changed"""
+import click
+from pathlib import Path
+
+from ..asa_lints import run_asa_checks
+from ..asa_lints.reporters import FORMATS, LintSummary, make_reporter
+from . import emit
+
+
+@click.command()
+@click.option(
+    "--since",
+    default="HEAD",
+    metavar="REF",
+    help="Lint slices changed in the working tree since REF (default: HEAD)"
+)
+@click.option(
+    "--staged",
+    is_flag=True,
+    help="Lint slices with staged changes, reading files from the git index"
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(FORMATS),
+    default="text",
+    help="Output format (default: text)"
+)
+@click.pass_context
+def lint_changed(ctx: click.Context, since: str, staged: bool, output_format: str) -> None:
+    """
+    Lint only the slices touched by a change.
+
+    A slice is linted when one of its files changed, or when its contract
+    allows importing a shared module that changed. With --staged, files
+    are read from the git index instead of the working tree (for
+    pre-commit hooks).
+
+    Example:
+        asa lint-changed
+        asa lint-changed --since origin/main
+        asa lint-changed --staged
+    """
+    from ..git_changes import ChangedSlices, GitError
+
+    try:
+        changes = ChangedSlices(Path("."), since=since, staged=staged)
+        contexts = changes.contexts()
+        graph = changes.graph() if contexts else None
+    except GitError as e:
+        click.echo(f"❌ git: {e}", err=True)
+        ctx.exit(1)
+
+    if output_format == "text":
+        source = "staged" if staged else f"since {since}"
+        click.echo(f"\n{len(changes.files)} file(s) changed ({source})")
+        if changes.via_shared:
+            click.echo(
+                f"{len(changes.via_shared)} slice(s) allow a changed shared module: "
+                f"{', '.join(changes.via_shared)}"
+            )
+        if not contexts:
+            click.echo("No slices to lint")
+            return
+
+    reporter = make_reporter(output_format)
+    summary = LintSummary()
+    emit(reporter.start(len(contexts)))
+    for slice_ctx in contexts:
+        results = run_asa_checks(slice_ctx, graph=graph)
+        summary.add(results)
+        emit(reporter.slice(results))
+    emit(reporter.finish(summary))
+    if summary.failed:
+        ctx.exit(1)
@@ -0,0 +1,83 @@
+"""asa lint-server"""
+import click
+from pathlib import Path
+from typing import Optional
+
+
+@click.group()
+def lint_server() -> None:
+    """Resident lint daemon for editor integrations."""
+    pass
+
+
+@lint_server.command("start")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(),
+    default=None,
+    help="Unix socket to listen on (default: .asa_cache/lint.sock)"
+)
+def lint_server_start(socket_path: Optional[str]) -> int:
+    """
+    Start the lint server in the foreground.
+
+    While it runs, 'asa lint' forwards to it and only re-runs the checks
+    affected by changes since the previous request.
+
+    Example:
+        asa lint-server start
+    """
+    from ..lint_server import DEFAULT_SOCKET, serve
+
+    path = Path(socket_path) if socket_path else DEFAULT_SOCKET
+    click.echo(f"🚀 Lint server listening on {path} (Ctrl+C to stop)")
+    try:
+        serve(Path("."), path)
+    except KeyboardInterrupt:
+        pass
+    except (OSError, RuntimeError) as e:
+        click.echo(f"❌ {e}", err=True)
+        return 1
+    click.echo("\n👋 Lint server stopped")
+    return 0
+
+
+@lint_server.command("stop")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(),
+    default=None,
+    help="Unix socket of the server (default: .asa_cache/lint.sock)"
+)
+def lint_server_stop(socket_path: Optional[str]) -> int:
+    """Stop a running lint server."""
+    from ..lint_server import DEFAULT_SOCKET, request
+
+    if request(Path(socket_path) if socket_path else DEFAULT_SOCKET, {"op": "shutdown"}) is None:
+        click.echo("No lint server running")
+        return 1
+    click.echo("👋 Lint server stopped")
+    return 0
+
+
+@lint_server.command("status")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(),
+    default=None,
+    help="Unix socket of the server (default: .asa_cache/lint.sock)"
+)
+def lint_server_status(socket_path: Optional[str]) -> int:
+    """Show whether a lint server is running."""
+    from ..lint_server import DEFAULT_SOCKET, request
+
+    path = Path(socket_path) if socket_path else DEFAULT_SOCKET
+    response = request(path, {"op": "ping"}, timeout=2.0)
+    if response is None:
+        click.echo("No lint server running")
+        return 1
+    click.echo(f"✅ Lint server running on {path} (pid {response['pid']})")
+    return 0
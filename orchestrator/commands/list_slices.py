@@ -0,0 +1,55 @@
+"""asa list-slices"""
+import json
+
+import click
+from pathlib import Path
+from typing import Optional
+
+from ..discovery import SliceIndex
+
+
+@click.command()
+@click.option(
+    "--domain",
+    "-d",
+    help="Filter by domain (e.g., auth, users)",
+    default=None
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="Print the slice manifest (domain, path, contract version, file hashes) as JSON"
+)
+def list_slices(domain: Optional[str], as_json: bool) -> None:
+    """
+    List all slices in the project.
+
+    Slices are read from the discovery index in .asa_cache/manifest.json,
+    which is only rebuilt when the domains/ tree changes.
+
+    Example:
+        asa list-slices
+        asa list-slices --domain auth
+        asa list-slices --json
+    """
+    domains_path = Path("domains")
+
+    if not domains_path.exists():
+        click.echo("❌ No domains/ directory found", err=True)
+        return
+
+    slices = SliceIndex().slices(domain=domain, hashes=as_json)
+
+    if as_json:
+        click.echo(json.dumps(slices, indent=2))
+        return
+
+    if not slices:
+        click.echo("No slices found")
+        return
+
+    click.echo(f"\nFound {len(slices)} slice(s):\n")
+    for info in slices:
+        click.echo(f"  • {info['domain']}/{info['name']}")
+    click.echo()
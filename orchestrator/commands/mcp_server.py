@@ -0,0 +1,40 @@
+"""asa mcp-server"""
+import click
+
+
+@click.group()
+def mcp_server() -> None:
+    """MCP server management commands."""
+    pass
+
+
+@mcp_server.command()
+@click.option(
+    "--port",
+    "-p",
+    default=8001,
+    help="Port to run MCP server on (default: 8001)"
+)
+def start(port: int) -> int:
+    """
+    Start the MCP server.
+
+    Example:
+        asa mcp-server start
+        asa mcp-server start --port 8002
+    """
+    import subprocess
+
+    click.echo(f"🚀 Starting MCP server on port {port}...")
+
+    try:
+        subprocess.run(
+            ["python", "-m", "mcp_server.main", "--port", str(port)],
+            check=True
+        )
+    except KeyboardInterrupt:
+        click.echo("\n👋 MCP server stopped")
+    except Exception as e:
+        click.echo(f"❌ Error starting MCP server: {str(e)}", err=True)
+        return 1
+    return 0
@@ -0,0 +1,45 @@
+"""asa who-imports"""
+import click
+from pathlib import Path
+
+from ..asa_lints import ImportGraph
+from ..asa_lints.lint_cache import CACHE_DIR
+
+
+@click.command()
+@click.argument("module")
+@click.option(
+    "--transitive",
+    "-t",
+    is_flag=True,
+    help="Also list modules that import MODULE indirectly"
+)
+def who_imports(module: str, transitive: bool) -> int:
+    """
+    List modules that import a module (reverse dependencies).
+
+    Example:
+        asa who-imports shared.utils.jwt_service
+        asa who-imports shared.utils --transitive
+    """
+    from ..asa_lints.import_graph import slice_display_name, slice_of
+
+    graph = ImportGraph.build(Path("."), CACHE_DIR)
+
+    if module not in graph.modules:
+        click.echo(f"⚠️ Unknown module: {module} (reporting imports by name only)", err=True)
+
+    importers = graph.importers(module, transitive=transitive)
+    if not importers:
+        click.echo(f"No modules import {module}")
+        return 0
+
+    click.echo(f"\n{len(importers)} module(s) import {module}:\n")
+    for importer in sorted(importers):
+        click.echo(f"  • {importer}")
+
+    slices = sorted({owner for owner in map(slice_of, importers) if owner is not None})
+    if slices:
+        click.echo(f"\nSlices: {', '.join(slice_display_name(s) for s in slices)}")
+    click.echo()
+    return 0
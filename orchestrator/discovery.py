@@ -0,0 +1,285 @@
+"""
+ASA Slice Discovery
+
+One index of the slices under domains/*/slices/*, shared by list-slices,
+lint-all and the app's /health endpoint instead of each walking the tree.
+
+The index is persisted in .asa_cache/manifest.json and revalidated with
+directory mtimes: adding or removing a domain or slice changes the mtime of
+its parent directory, so while domains/, domains/<domain>/ and
+domains/<domain>/slices/ keep their mtimes the walk is skipped entirely.
+File hashes are only refreshed for files whose (mtime_ns, size) changed.
+"""
+import hashlib
+import json
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .paths import CACHE_DIR, CONTRACT_FILE, SKIPPED_DIRS
+
+MANIFEST_FILE = "manifest.json"
+
+# Bump when the manifest layout changes (older manifests are rebuilt)
+MANIFEST_VERSION = 1
+
+
+def _dir_mtime(path: Path) -> Optional[int]:
+    """mtime_ns of a directory (None if it does not exist or is not a directory)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns if stat.S_ISDIR(st.st_mode) else None
+
+
+def _signature(path: Path) -> Optional[List[int]]:
+    """[mtime_ns, size] of a file (a list, so it compares equal after a JSON round-trip)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _is_slice_dir(entry: os.DirEntry) -> bool:
+    return (
+        entry.is_dir()
+        and not entry.name.startswith(".")
+        and not entry.name.startswith("__")
+    )
+
+
+def _contract_version(contract_path: Path) -> Optional[str]:
+    """The contract's "version" field (None if missing or unreadable)."""
+    try:
+        with open(contract_path, "r", encoding="utf-8") as f:
+            contract = json.load(f)
+    except (OSError, ValueError):
+        return None
+    version = contract.get("version") if isinstance(contract, dict) else None
+    return version if isinstance(version, str) else None
+
+
+def _walk_slice(slice_dir: Path) -> Tuple[Dict[str, int], List[str]]:
+    """
+    List a slice's files (relative POSIX paths) and the mtimes of its
+    directories, skipping the same directories as SliceContext.
+    """
+    dirs: Dict[str, int] = {}
+    files: List[str] = []
+    pending = [("", str(slice_dir))]
+    while pending:
+        prefix, directory = pending.pop()
+        mtime = _dir_mtime(Path(directory))
+        if mtime is None:
+            continue
+        dirs[prefix.rstrip("/")] = mtime
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIPPED_DIRS and not entry.name.startswith("."):
+                            pending.append((f"{prefix}{entry.name}/", entry.path))
+                    elif entry.is_file():
+                        files.append(f"{prefix}{entry.name}")
+        except OSError:
+            continue
+    return dirs, sorted(files)
+
+
+def _hash_file(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class SliceIndex:
+    """
+    Persistent manifest of the slices in a project.
+
+    Each slice is described as
+        {"domain", "name", "path", "contract_version", "files"}
+    where path is relative to the project root and files maps relative
+    file paths to SHA-256 hashes (only included when hashes are requested).
+
+    With persist=False the manifest is read but never written, and is only
+    kept up to date in memory (for read-only filesystems).
+    """
+
+    def __init__(self, root: Path = Path("."), cache_dir: Optional[Path] = None, persist: bool = True):
+        self.root = Path(root)
+        cache_dir = self.root / CACHE_DIR if cache_dir is None else Path(cache_dir)
+        self.manifest_path = cache_dir / MANIFEST_FILE
+        self.persist = persist
+        self._manifest: Optional[Dict] = None
+        self._dirty = False
+
+    def slices(self, domain: Optional[str] = None, hashes: bool = False) -> List[Dict]:
+        """
+        Slices in the project, sorted by path (optionally of one domain).
+
+        With hashes, every file of the returned slices is stat'ed and only
+        changed files are re-hashed; without, only the contracts are stat'ed.
+        """
+        manifest = self._load()
+        if not self._layout_current(manifest):
+            self._rescan_layout(manifest)
+
+        slices = []
+        for path in sorted(manifest["slices"]):
+            entry = manifest["slices"][path]
+            if domain and entry["domain"] != domain:
+                continue
+            self._refresh_slice(entry, hashes)
+            info = {
+                "domain": entry["domain"],
+                "name": entry["name"],
+                "path": entry["path"],
+                "contract_version": entry["contract_version"],
+            }
+            if hashes:
+                info["files"] = {name: known[2] for name, known in entry["files"].items()}
+            slices.append(info)
+
+        self._save()
+        return slices
+
+    def paths(self, domain: Optional[str] = None) -> List[Path]:
+        """Slice directories (relative to the current directory when root is '.')."""
+        return [self.root / info["path"] for info in self.slices(domain)]
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+
+    def _layout_current(self, manifest: Dict) -> bool:
+        """Whether no domain or slice was added or removed since the last walk."""
+        dirs = manifest["dirs"]
+        if not dirs:
+            return False
+        return all(_dir_mtime(self.root / rel) == mtime for rel, mtime in dirs.items())
+
+    def _rescan_layout(self, manifest: Dict) -> None:
+        """Walk domains/*/slices/*, keeping known entries for slices that still exist."""
+        known = manifest["slices"]
+        dirs: Dict[str, int] = {}
+        slices: Dict[str, Dict] = {}
+
+        domains_dir = self.root / "domains"
+        mtime = _dir_mtime(domains_dir)
+        if mtime is not None:
+            dirs["domains"] = mtime
+            with os.scandir(domains_dir) as domain_entries:
+                for domain_entry in domain_entries:
+                    if not domain_entry.is_dir():
+                        continue
+                    domain_rel = f"domains/{domain_entry.name}"
+                    dirs[domain_rel] = domain_entry.stat().st_mtime_ns
+
+                    slices_dir = Path(domain_entry.path) / "slices"
+                    mtime = _dir_mtime(slices_dir)
+                    if mtime is None:
+                        continue
+                    dirs[f"{domain_rel}/slices"] = mtime
+
+                    with os.scandir(slices_dir) as slice_entries:
+                        for slice_entry in slice_entries:
+                            if not _is_slice_dir(slice_entry):
+                                continue
+                            path = f"{domain_rel}/slices/{slice_entry.name}"
+                            slices[path] = known.get(path) or {
+                                "domain": domain_entry.name,
+                                "name": slice_entry.name,
+                                "path": path,
+                                "contract_version": None,
+                                "contract_signature": None,
+                                "dirs": None,
+                                "files": {},
+                            }
+
+        manifest["dirs"] = dirs
+        manifest["slices"] = slices
+        self._dirty = True
+
+    def _refresh_slice(self, entry: Dict, hashes: bool) -> None:
+        """Bring one slice's contract version (and file hashes) up to date."""
+        slice_dir = self.root / entry["path"]
+
+        contract_path = slice_dir / CONTRACT_FILE
+        signature = _signature(contract_path)
+        if signature != entry["contract_signature"]:
+            entry["contract_signature"] = signature
+            entry["contract_version"] = _contract_version(contract_path) if signature else None
+            self._dirty = True
+
+        if not hashes:
+            return
+
+        dirs = entry["dirs"]
+        files = entry["files"]
+        if dirs is None or any(_dir_mtime(slice_dir / rel) != mtime for rel, mtime in dirs.items()):
+            # Files were added, removed or renamed somewhere in the slice
+            entry["dirs"], names = _walk_slice(slice_dir)
+            files = {name: files.get(name) for name in names}
+            self._dirty = True
+
+        refreshed = {}
+        for name, known in files.items():
+            signature = _signature(slice_dir / name)
+            if signature is None:
+                self._dirty = True
+                continue
+            if known is None or known[:2] != signature:
+                known = signature + [_hash_file(slice_dir / name)]
+                self._dirty = True
+            refreshed[name] = known
+        entry["files"] = refreshed
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> Dict:
+        if self._manifest is None:
+            manifest = None
+            try:
+                with open(self.manifest_path, "r") as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                pass
+            if (
+                not isinstance(manifest, dict)
+                or manifest.get("version") != MANIFEST_VERSION
+                or manifest.get("root") != str(self.root.resolve())
+            ):
+                manifest = {
+                    "version": MANIFEST_VERSION,
+                    "root": str(self.root.resolve()),
+                    "dirs": {},
+                    "slices": {},
+                }
+            self._manifest = manifest
+        return self._manifest
+
+    def _save(self) -> None:
+        """Write the manifest if it changed; write failures are never fatal."""
+        if not self._dirty or not self.persist:
+            return
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.manifest_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(self._manifest, f)
+                os.replace(tmp_path, self.manifest_path)
+            finally:
+                # Only left behind if the write failed
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+        except OSError:
+            return
+        self._dirty = False
@@ -0,0 +1,206 @@
+"""
+ASA Changed-Slice Detection
+
+Maps files changed since a git ref (or staged in the index) to the slices
+that own them, plus the slices whose contracts allow importing a changed
+shared module. Only local git plumbing is used (diff, ls-files, cat-file),
+and with --staged every file is read from the index, so a pre-commit hook
+lints exactly what is about to be committed.
+"""
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from .asa_lints.import_graph import INTERNAL_PACKAGES, ImportGraph, module_for_file
+from .asa_lints.lint_cache import CACHE_DIR
+from .asa_lints.lint_contract_imports import compile_allowed_imports
+from .asa_lints.slice_context import CONTRACT_FILE, SliceContext
+from .discovery import SliceIndex
+
+
+class GitError(Exception):
+    """A git command failed (not a repository, unknown ref, ...)."""
+
+
+def _git(args: List[str], root: Path, stdin: Optional[bytes] = None) -> bytes:
+    try:
+        completed = subprocess.run(
+            ["git", *args],
+            cwd=root,
+            input=stdin,
+            capture_output=True,
+            check=False,
+        )
+    except OSError as e:
+        raise GitError(f"Cannot run git: {e}") from e
+    if completed.returncode != 0:
+        message = completed.stderr.decode("utf-8", errors="replace").strip()
+        raise GitError(message or f"git {args[0]} failed")
+    return completed.stdout
+
+
+def _split_z(output: bytes) -> List[str]:
+    return [item.decode("utf-8", errors="surrogateescape") for item in output.split(b"\0") if item]
+
+
+def changed_files(root: Path = Path("."), since: str = "HEAD", staged: bool = False) -> Set[str]:
+    """
+    Paths (relative to root, POSIX) changed since a ref, or staged in the index.
+
+    since compares the working tree (including untracked files) against
+    the ref; staged compares the index against HEAD.
+    """
+    if staged:
+        return set(_split_z(_git(
+            ["diff", "--cached", "--name-only", "--no-renames", "--relative", "-z"], root
+        )))
+
+    changed = set(_split_z(_git(
+        ["diff", "--name-only", "--no-renames", "--relative", "-z", since, "--"], root
+    )))
+    changed.update(_split_z(_git(["ls-files", "--others", "--exclude-standard", "-z"], root)))
+    return changed
+
+
+def index_files(root: Path, pathspecs: Iterable[str]) -> Dict[str, bytes]:
+    """
+    Contents of the files staged in the index under pathspecs.
+
+    Blobs are read with one 'git cat-file --batch' process; conflicted
+    entries and submodules are skipped.
+    """
+    pathspecs = list(pathspecs)
+    if not pathspecs:
+        return {}
+
+    paths = []
+    object_ids = []
+    for line in _split_z(_git(["ls-files", "--stage", "-z", "--", *pathspecs], root)):
+        info, _, path = line.partition("\t")
+        mode, object_id, stage = info.split()
+        if stage != "0" or mode == "160000":
+            continue
+        paths.append(path)
+        object_ids.append(object_id)
+
+    if not object_ids:
+        return {}
+
+    batch = "".join(f"{object_id}\n" for object_id in object_ids).encode()
+    output = _git(["cat-file", "--batch"], root, stdin=batch)
+
+    files = {}
+    offset = 0
+    for path in paths:
+        header_end = output.index(b"\n", offset)
+        _, _, size = output[offset:header_end].split(b" ")
+        start = header_end + 1
+        end = start + int(size)
+        files[path] = output[start:end]
+        offset = end + 1
+    return files
+
+
+def owning_slice(path: str) -> Optional[str]:
+    """'domains/auth/slices/login/handler.py' -> 'domains/auth/slices/login'."""
+    parts = path.split("/")
+    if len(parts) < 5 or parts[0] != "domains" or parts[2] != "slices":
+        return None
+    name = parts[3]
+    if name.startswith(".") or name.startswith("__"):
+        return None
+    return "/".join(parts[:4])
+
+
+def shared_module(path: str) -> Optional[str]:
+    """'shared/utils/jwt_service.py' -> 'shared.utils.jwt_service'."""
+    if not path.startswith("shared/") or not path.endswith(".py"):
+        return None
+    directory, _, filename = path.rpartition("/")
+    return module_for_file(directory.replace("/", "."), filename)[0]
+
+
+def slices_allowing(modules: Set[str], contracts: Dict[str, object]) -> Set[str]:
+    """Slices whose contract's allowed_imports match any of modules."""
+    if not modules:
+        return set()
+    matching = set()
+    for slice_path, contract in contracts.items():
+        if not isinstance(contract, dict):
+            continue
+        patterns = contract.get("allowed_imports")
+        if not isinstance(patterns, list) or not all(isinstance(p, str) for p in patterns):
+            continue
+        is_allowed = compile_allowed_imports(tuple(patterns))
+        if any(is_allowed(module) for module in modules):
+            matching.add(slice_path)
+    return matching
+
+
+class ChangedSlices:
+    """
+    Slices affected by a change set, and how to load them.
+
+    direct are slices containing a changed file; via_shared are other
+    slices whose contracts allow importing a changed shared module.
+    """
+
+    def __init__(self, root: Path = Path("."), since: str = "HEAD", staged: bool = False):
+        self.root = Path(root)
+        self.staged = staged
+        self.files = changed_files(self.root, since=since, staged=staged)
+
+        shared = {module for module in map(shared_module, self.files) if module}
+        existing = self._existing_slices()
+
+        self.direct = sorted({
+            owner for owner in map(owning_slice, self.files) if owner
+        } & existing.keys())
+        self.via_shared = sorted(slices_allowing(shared, existing) - set(self.direct))
+
+    @property
+    def slices(self) -> List[str]:
+        return sorted(self.direct + self.via_shared)
+
+    def _existing_slices(self) -> Dict[str, object]:
+        """Slices that still exist (in the index or working tree) with their contracts."""
+        if self.staged:
+            contracts: Dict[str, object] = {}
+            blobs = index_files(self.root, [f"domains/*/slices/*/{CONTRACT_FILE}"])
+            for path in _split_z(_git(["ls-files", "-z", "--", "domains"], self.root)):
+                owner = owning_slice(path)
+                if owner is not None and owner not in contracts:
+                    contracts[owner] = None
+            for path, data in blobs.items():
+                owner = owning_slice(path)
+                if owner is not None and owner in contracts and path == f"{owner}/{CONTRACT_FILE}":
+                    contracts[owner] = SliceContext.from_files(
+                        self.root / owner, {CONTRACT_FILE: data}
+                    ).contract
+            return contracts
+
+        return {
+            info["path"]: SliceContext(self.root / info["path"]).contract
+            for info in SliceIndex(self.root).slices()
+        }
+
+    def contexts(self) -> List[SliceContext]:
+        """A SliceContext per affected slice (index blobs when staged)."""
+        if not self.staged:
+            return [SliceContext(self.root / path) for path in self.slices]
+
+        blobs = index_files(self.root, self.slices)
+        files: Dict[str, Dict[str, bytes]] = {path: {} for path in self.slices}
+        for path, data in blobs.items():
+            owner = owning_slice(path)
+            if owner in files:
+                files[owner][path[len(owner) + 1:]] = data
+        return [SliceContext.from_files(self.root / path, files[path]) for path in self.slices]
+
+    def graph(self) -> ImportGraph:
+        """Import graph of the index (staged) or of the working tree."""
+        if not self.staged:
+            return ImportGraph.build(self.root, self.root / CACHE_DIR)
+        pathspecs = [f"{package}/*.py" for package in INTERNAL_PACKAGES]
+        pathspecs.append(f"domains/*/slices/*/{CONTRACT_FILE}")
+        return ImportGraph.from_sources(index_files(self.root, pathspecs), self.root)
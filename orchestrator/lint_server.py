@@ -0,0 +1,166 @@
+"""
+ASA Lint Server
+
+A resident lint daemon listening on a local Unix socket. It keeps file
+bytes, parsed contracts, ASTs, the project import graph and the last
+results of every slice in memory, so an editor save is answered by
+re-running only the affected checks.
+
+Protocol: one JSON object per line in each direction.
+    {"op": "ping"}                     -> {"ok": true, "pid": 1234}
+    {"op": "lint", "path": "<slice or file>"}
+                                       -> {"ok": true, "results": {...},
+                                           "rechecked": [...], "elapsed_ms": 1.2}
+    {"op": "reload"}                   -> {"ok": true}  (rebuild the import graph)
+    {"op": "shutdown"}                 -> {"ok": true}
+Errors are returned as {"ok": false, "error": "..."}.
+"""
+import json
+import os
+import socket
+import socketserver
+from pathlib import Path
+from typing import Dict, Optional, cast
+
+from .asa_lints.import_graph import ImportGraph
+from .asa_lints.lint_cache import CACHE_DIR
+from .watch import LintWatcher
+
+SOCKET_FILE = "lint.sock"
+DEFAULT_SOCKET = CACHE_DIR / SOCKET_FILE
+
+# Client-side timeout; a lint of one slice normally takes milliseconds
+CLIENT_TIMEOUT = 30.0
+
+
+def find_slice(path: Path) -> Optional[Path]:
+    """The slice directory containing path (a slice directory or any file in it)."""
+    path = Path(path)
+    for candidate in (path, *path.parents):
+        if candidate.parent.name == "slices":
+            return candidate
+    return None
+
+
+class LintService:
+    """Answers protocol requests; independent of the socket transport."""
+
+    def __init__(self, root: Path = Path(".")):
+        self.root = Path(root)
+        cache_dir = self.root / CACHE_DIR
+        self.watcher = LintWatcher(
+            self.root, graph=ImportGraph.build(self.root, cache_dir), cache_dir=cache_dir
+        )
+
+    def handle(self, request: Dict) -> Dict:
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if op == "lint":
+            return self._lint(request.get("path"))
+        if op == "reload":
+            self.watcher.graph = ImportGraph.build(self.root, self.root / CACHE_DIR)
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown op: {op!r}"}
+
+    def _lint(self, path: Optional[str]) -> Dict:
+        if not path:
+            return {"ok": False, "error": "Missing 'path'"}
+        slice_path = find_slice(Path(path))
+        if slice_path is None or not (self.root / slice_path).is_dir():
+            return {"ok": False, "error": f"Not a slice: {path}"}
+
+        # The watcher also re-runs the graph checks when a dependency changed
+        _, results, checks, elapsed_ms = self.watcher.lint(self.root / slice_path)
+        return {
+            "ok": True,
+            "results": results,
+            "rechecked": [name for name in results["checks"] if name in checks],
+            "elapsed_ms": round(elapsed_ms, 3),
+        }
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        server = cast("LintServer", self.server)
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as e:
+                response = {"ok": False, "error": f"Bad request: {e}"}
+            else:
+                if request.get("op") == "shutdown":
+                    self._send({"ok": True})
+                    server.shutdown_requested = True
+                    return
+                try:
+                    response = server.service.handle(request)
+                except Exception as e:
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self._send(response)
+
+    def _send(self, response: Dict) -> None:
+        self.wfile.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+        self.wfile.flush()
+
+
+class LintServer(socketserver.UnixStreamServer):
+    """
+    Serves one connection at a time, so requests never race on the shared
+    caches. Connections may send many requests.
+    """
+
+    def __init__(self, socket_path: Path, service: LintService):
+        self.service = service
+        self.shutdown_requested = False
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def serve(self) -> None:
+        while not self.shutdown_requested:
+            self.handle_request()
+
+
+def serve(root: Path = Path("."), socket_path: Path = DEFAULT_SOCKET) -> None:
+    """Run the lint server in the foreground until a shutdown request."""
+    socket_path = Path(socket_path)
+    if request(socket_path, {"op": "ping"}) is not None:
+        raise RuntimeError(f"A lint server is already listening on {socket_path}")
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)
+
+    server = LintServer(socket_path, LintService(root))
+    try:
+        server.serve()
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+
+
+def request(
+    socket_path: Path = DEFAULT_SOCKET,
+    payload: Optional[Dict] = None,
+    timeout: float = CLIENT_TIMEOUT
+) -> Optional[Dict]:
+    """
+    Send one request to a running server and return its response, or
+    None if no server is listening.
+    """
+    if not Path(socket_path).exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(str(socket_path))
+            client.sendall(json.dumps(payload or {"op": "ping"}).encode() + b"\n")
+            with client.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+    if not line:
+        return None
+    response: Dict = json.loads(line)
+    return response
@@ -0,0 +1,15 @@
+"""
+ASA project layout constants.
+
+Kept free of imports from the linters so that light consumers (slice
+discovery in the app's /health endpoint) do not load them.
+"""
+from pathlib import Path
+
+# Lint results, the import graph and the slice manifest (relative to the project root)
+CACHE_DIR = Path(".asa_cache")
+
+CONTRACT_FILE = "slice.contract.json"
+
+# Directories never needed by the linters
+SKIPPED_DIRS = {"__pycache__"}
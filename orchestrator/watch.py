@@ -0,0 +1,218 @@
+"""
+ASA Watch Mode
+
+Polls slices for changes and re-runs only the checks affected by each
+change. File bytes, parsed contracts and ASTs stay in memory between runs,
+so a single edited file is re-linted without re-reading the whole slice.
+"""
+import os
+import time
+from pathlib import Path
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .asa_lints.import_graph import ImportGraph, module_for_file, slice_module_name
+from .asa_lints.run_asa_checks import CHECKS, GRAPH_CHECKS, affected_checks, run_asa_checks
+from .asa_lints.slice_context import FileCache, Signature, SliceContext
+
+# (slice_path, results, names of the checks that ran, elapsed milliseconds)
+WatchReport = Tuple[Path, Dict, Set[str], float]
+
+
+def _signature(file_path: Path) -> Optional[Signature]:
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def find_slices(root: Path) -> List[Path]:
+    """
+    Slices to watch under root.
+
+    root may be a single slice, a domain (domains/auth) or the domains/
+    directory itself.
+    """
+    root = Path(root)
+    if (root / "slices").is_dir():
+        candidates = (root / "slices").iterdir()
+    elif root.parent.name == "slices" or (root / "slice.contract.json").exists():
+        return [root]
+    else:
+        candidates = root.glob("*/slices/*")
+
+    return sorted(
+        path for path in candidates
+        if path.is_dir()
+        and not path.name.startswith(".")
+        and not path.name.startswith("__")
+    )
+
+
+class LintWatcher:
+    """
+    Keeps the last results and file signatures of every watched slice and
+    re-lints only what changed on each poll.
+
+    With a project ImportGraph, edited slice modules are patched into the
+    graph before the checks run, and so are changed modules outside the
+    slice that it depends on (which re-runs the GRAPH_CHECKS), so
+    transitive import, cycle and public_api checks stay current. Rebuilds
+    of the graph use cache_dir as its parse cache.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        graph: Optional[ImportGraph] = None,
+        cache_dir: Optional[Path] = None
+    ):
+        self.root = Path(root)
+        self.graph = graph
+        self.cache_dir = cache_dir
+        self.file_cache = FileCache()
+        self._signatures: Dict[Path, Dict[str, Signature]] = {}
+        self._results: Dict[Path, Dict] = {}
+        # Graph whose module files were last recorded, and their signatures
+        self._graph: Optional[ImportGraph] = None
+        self._module_signatures: Dict[str, Optional[Signature]] = {}
+
+    def poll(self) -> List[WatchReport]:
+        """
+        Check every slice once and re-run the affected checks.
+
+        The first poll lints every slice in full. Returns one report per
+        slice that was (re-)linted.
+        """
+        reports = []
+        slices = find_slices(self.root)
+
+        for slice_path in slices:
+            report = self._poll_slice(slice_path)
+            if report is not None:
+                reports.append(report)
+
+        # Forget slices that disappeared
+        for slice_path in set(self._results) - set(slices):
+            self._forget(slice_path, self._signatures.get(slice_path, {}))
+            del self._results[slice_path]
+            del self._signatures[slice_path]
+
+        return reports
+
+    def lint(self, slice_path: Path, force: Iterable[str] = ()) -> WatchReport:
+        """
+        Lint one slice now, re-running only the checks affected since its
+        last run (plus the checks in force). Unchanged slices return their
+        previous results with no checks re-run.
+        """
+        slice_path = Path(slice_path)
+        report = self._poll_slice(slice_path, set(force))
+        if report is None:
+            return slice_path, self._results[slice_path], set(), 0.0
+        return report
+
+    def _poll_slice(self, slice_path: Path, force: AbstractSet[str] = frozenset()) -> Optional[WatchReport]:
+        start = time.perf_counter()
+        if self.graph is not None and self._refresh_dependencies(slice_path):
+            force = force | GRAPH_CHECKS
+        ctx = SliceContext(slice_path, file_cache=self.file_cache)
+        signatures = dict(ctx.signatures)
+        previous_signatures = self._signatures.get(slice_path)
+        previous = self._results.get(slice_path)
+
+        if previous_signatures is None or previous is None:
+            checks = set(CHECKS)
+            changed = set(signatures)
+        elif signatures == previous_signatures and not force:
+            return None
+        else:
+            removed = previous_signatures.keys() - signatures.keys()
+            changed = {
+                name for name, signature in signatures.items()
+                if previous_signatures.get(name) != signature
+            } | removed
+            listing_changed = signatures.keys() != previous_signatures.keys()
+            checks = affected_checks(changed, listing_changed) | force
+            self._forget(slice_path, removed)
+
+        self._signatures[slice_path] = signatures
+        if not checks:
+            # e.g. only slice.spec.md changed
+            return None
+
+        if self.graph is not None:
+            self._update_graph(ctx, changed)
+        results = run_asa_checks(ctx, checks=checks, previous=previous, graph=self.graph)
+        self._results[slice_path] = results
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        return slice_path, results, checks, elapsed_ms
+
+    def _update_graph(self, ctx: SliceContext, changed: Set[str]) -> None:
+        """Patch changed slice modules into the graph (rebuilding it if that fails)."""
+        graph = self.graph
+        slice_module = slice_module_name(ctx.path)
+        if graph is None or slice_module is None:
+            return
+        for name in sorted(changed):
+            if not name.endswith(".py"):
+                continue
+            module, _ = module_for_file(slice_module, name)
+            data = ctx.read_bytes(name)
+            if data is None or not graph.update_module(module, data):
+                self._rebuild_graph(graph)
+                return
+
+    def _refresh_dependencies(self, slice_path: Path) -> bool:
+        """
+        Patch modules outside the slice that it depends on and that changed
+        on disk since they were parsed. Returns True if any did, so the
+        checks reading the graph re-run even though the slice itself is
+        unchanged.
+        """
+        graph = self.graph
+        if graph is None:
+            return False
+        if graph is not self._graph:
+            # New or rebuilt graph: remember the files as they were parsed
+            self._graph = graph
+            self._module_signatures = {
+                module: _signature(file_path) for module, file_path in graph.modules.items()
+            }
+
+        slice_module = slice_module_name(slice_path)
+        if slice_module is None:
+            return False
+
+        own = set(graph.slice_modules(slice_module))
+        changed = False
+        for module in sorted(graph.closure(slice_module) - own):
+            file_path = graph.modules.get(module)
+            if file_path is None:
+                continue
+            signature = _signature(file_path)
+            if signature is None:
+                self._rebuild_graph(graph)
+                return True
+            if self._module_signatures.get(module) == signature:
+                continue
+            self._module_signatures[module] = signature
+            changed = True
+            if not graph.update_module(module, file_path.read_bytes()):
+                self._rebuild_graph(graph)
+                return True
+        return changed
+
+    def _rebuild_graph(self, graph: ImportGraph) -> None:
+        self.graph = ImportGraph.build(graph.root, self.cache_dir)
+
+    def _forget(self, slice_path: Path, names: Iterable[str]) -> None:
+        """Drop cached bytes/ASTs of files that no longer exist."""
+        for name in names:
+            self.file_cache.discard(str((slice_path / name).absolute()))
+
+    def watch(self, interval: float = 0.5) -> Iterator[List[WatchReport]]:
+        """Poll forever, yielding each batch of reports (may be empty)."""
+        while True:
+            yield self.poll()
+            time.sleep(interval)
@@ -0,0 +1,31 @@
+"""Shared pytest configuration."""
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the wall-clock benchmark guards (marked 'benchmark')",
+    )
+
+
+def _under_coverage(config) -> bool:
+    # pytest-cov's --cov options (set by the default addopts) trace every line
+    return bool(getattr(config.option, "cov_source", None))
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmark tests unless --run-benchmarks is given without coverage."""
+    if config.getoption("--run-benchmarks") and not _under_coverage(config):
+        return
+    reason = (
+        "timings are distorted under coverage (run with --no-cov)"
+        if config.getoption("--run-benchmarks")
+        else "wall-clock benchmark (run with --run-benchmarks)"
+    )
+    skip = pytest.mark.skip(reason=reason)
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
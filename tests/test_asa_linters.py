@@ -1,7 +1,15 @@
 """Tests for ASA Linters"""
+import json
 import pytest
 from pathlib import Path
-from orchestrator.asa_lints import run_asa_checks, format_results
+from orchestrator.asa_lints import (
+    run_asa_checks,
+    run_asa_checks_many,
+    format_results,
+    SliceContext,
+    run_asa_checks_cached,
+    ImportGraph,
+)
 from orchestrator.asa_lints.lint_slice_structure import lint_slice_structure
 from orchestrator.asa_lints.lint_contract_json import lint_contract_json
 from orchestrator.asa_lints.lint_loc_limits import lint_loc_limits
@@ -45,6 +53,25 @@ def test_lint_loc_limits_success():
     assert success is True or len(errors) == 0
 
 
+def test_loc_limits_override_is_a_warning(tmp_path):
+    """Test files over an overridden LOC limit make the check a WARNING."""
+    import shutil
+
+    slice_path = tmp_path / "login_demo"
+    shutil.copytree(Path("domains/auth/slices/login_demo"), slice_path)
+    contract_path = slice_path / "slice.contract.json"
+    contract = json.loads(contract_path.read_text())
+    contract["loc_limits"] = {"per_file": 1, "total": 10000, "justification": "test"}
+    contract_path.write_text(json.dumps(contract))
+
+    results = run_asa_checks(slice_path)
+    loc_limits = results["checks"]["loc_limits"]
+    assert loc_limits["status"] == "WARNING"
+    assert loc_limits["errors"] == []
+    assert "Override specified: test" in loc_limits["warnings"][0]
+    assert results["overall_status"] == "PASSED" and results["has_warnings"]
+
+
 def test_lint_contract_imports_success():
     """Test imports linter with valid slice."""
     slice_path = Path("domains/auth/slices/login_demo")
@@ -113,5 +140,642 @@ def test_lint_slice_structure_invalid_name():
         assert any("lowercase" in error for error in errors)
 
 
+def test_run_asa_checks_many_preserves_order():
+    """Test parallel checks yield results in input order."""
+    slice_paths = [
+        Path("domains/auth/slices/login_demo"),
+        Path("domains/nonexistent/slice"),
+        Path("domains/auth/slices/login_demo"),
+    ]
+    serial = list(run_asa_checks_many(slice_paths, jobs=1))
+    parallel = list(run_asa_checks_many(slice_paths, jobs=2))
+
+    assert [r["slice_path"] for r in parallel] == [str(p) for p in slice_paths]
+    assert parallel == serial
+
+
+def test_slice_context_reads_each_file_once(monkeypatch):
+    """Test all linters share one context and read each file at most once."""
+    reads = []
+    original_read_bytes = Path.read_bytes
+
+    def counting_read_bytes(self):
+        reads.append(str(self))
+        return original_read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+
+    results = run_asa_checks(SliceContext(Path("domains/auth/slices/login_demo")))
+
+    assert results["overall_status"] == "PASSED"
+    assert any(read.endswith("slice.contract.json") for read in reads)
+    assert len(reads) == len(set(reads))
+
+
+def test_slice_context_invalid_contract(tmp_path):
+    """Test an invalid contract is reported by every contract consumer."""
+    (tmp_path / "slice.contract.json").write_text("{not json")
+    ctx = SliceContext(tmp_path)
+
+    success, errors = lint_contract_json(ctx)
+    assert success is False
+    assert errors[0].startswith("Invalid JSON")
+
+    success, errors = lint_contract_imports(ctx)
+    assert success is False
+    assert errors == ["Failed to load contract.json"]
+
+
+def test_lint_contract_json_schema_pointers(tmp_path):
+    """Test nested contract errors are reported with JSON pointers."""
+    contract = json.loads(Path("domains/auth/slices/login_demo/slice.contract.json").read_text())
+    del contract["domain"]
+    contract["public_api"]["exports"].append(42)
+    contract["dependencies"]["shared"] = "utils"
+    contract["loc_limits"] = {"per_file": 0}
+    (tmp_path / "slice.contract.json").write_text(json.dumps(contract))
+
+    success, errors = lint_contract_json(tmp_path)
+    assert success is False
+    assert errors == [
+        "#: missing required field: domain",
+        "#/public_api/exports/3: must be a string, not integer",
+        "#/dependencies/shared: must be an array, not string",
+        "#/loc_limits/per_file: must be >= 1",
+    ]
+
+
+def test_lint_contract_json_keeps_baseline_semantics(tmp_path):
+    """Test values the pre-schema linter accepted are still valid."""
+    contract = json.loads(Path("domains/auth/slices/login_demo/slice.contract.json").read_text())
+    contract.update(slice_name="login_demo", domain="Auth-Team", version="v1")
+    contract["public_api"]["exports"].append("not a module path")
+    contract["loc_limits"] = {"per_file": 200, "note": "no justification given"}
+    (tmp_path / "slice.contract.json").write_text(json.dumps(contract))
+
+    assert lint_contract_json(tmp_path) == (True, [])
+
+
+@pytest.mark.benchmark
+def test_contract_schema_batch_benchmark():
+    """Guard batch validation throughput of the compiled contract schema."""
+    from benchmarks.bench_contract_schema import run
+
+    result = run(n_contracts=2000, invalid=0.2)
+    assert 0 < result["invalid"] < 2000
+    # 10k contracts must validate well under a second
+    assert result["validate_s"] * 5 < 0.5
+
+
+def test_run_asa_checks_cached_invalidation(tmp_path):
+    """Test cached results are replayed until a slice file changes."""
+    import shutil
+
+    slice_path = tmp_path / "login_demo"
+    shutil.copytree(Path("domains/auth/slices/login_demo"), slice_path)
+    cache_dir = tmp_path / "cache"
+
+    first = run_asa_checks_cached(slice_path, cache_dir)
+    second = run_asa_checks_cached(slice_path, cache_dir)
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert {**second, "cached": False} == first
+
+    (slice_path / "service.py").unlink()
+    third = run_asa_checks_cached(slice_path, cache_dir)
+    assert third["cached"] is False
+    assert third["overall_status"] == "FAILED"
+
+
+def test_lint_cache_put_removes_temp_file_on_failure(tmp_path):
+    """Test a failed cache write leaves no temp file behind."""
+    from orchestrator.asa_lints.lint_cache import LintCache
+
+    cache = LintCache(tmp_path)
+    with pytest.raises(TypeError):
+        cache.put("key", {"results": object()})
+    assert list(cache.cache_dir.iterdir()) == []
+
+
+def _write_module(root, module, source=""):
+    """Create a module (and its packages) under root."""
+    parts = module.split(".")
+    for i in range(1, len(parts)):
+        package = root.joinpath(*parts[:i])
+        package.mkdir(exist_ok=True)
+        (package / "__init__.py").touch()
+    root.joinpath(*parts[:-1], parts[-1] + ".py").write_text(source)
+
+
+def _write_contract(slice_dir, allowed_imports):
+    import json
+
+    slice_dir.mkdir(parents=True, exist_ok=True)
+    (slice_dir / "slice.contract.json").write_text(json.dumps({
+        "slice_name": slice_dir.name,
+        "version": "1.0.0",
+        "domain": "x",
+        "allowed_imports": allowed_imports,
+        "public_api": {},
+        "dependencies": {},
+    }))
+
+
+def test_import_graph_transitive_violation(tmp_path):
+    """Test imports reached through shared modules are checked too."""
+    _write_module(tmp_path, "shared.helpers", "from .secret import KEY\n")
+    _write_module(tmp_path, "shared.secret", "KEY = 1\n")
+    _write_module(tmp_path, "domains.x.slices.a.handler", "from shared.helpers import KEY\n")
+    _write_module(tmp_path, "domains.x.slices.a.tests.test_slice", "from ..handler import KEY\n")
+    slice_a = tmp_path / "domains/x/slices/a"
+    _write_contract(slice_a, ["domains.x.slices.a.*", "shared.helpers"])
+
+    graph = ImportGraph.build(tmp_path)
+    assert graph.imports["domains.x.slices.a.tests.test_slice"] == {"domains.x.slices.a.handler"}
+    assert "shared.secret" in graph.closure("domains.x.slices.a")
+
+    success, errors = lint_contract_imports(slice_a)
+    assert success is True
+
+    success, errors = lint_contract_imports(slice_a, graph)
+    assert success is False
+    assert errors == [
+        "Unauthorized transitive import 'shared.secret' (not in allowed_imports, "
+        "via domains.x.slices.a.handler -> shared.helpers -> shared.secret)"
+    ]
+
+
+def test_run_asa_checks_in_memory_matches_disk(tmp_path):
+    """Test a slice linted from in-memory files gets the results it gets on disk."""
+    import shutil
+    from orchestrator.asa_lints import run_asa_checks_in_memory
+
+    _write_module(tmp_path, "shared.helpers", "from .secret import KEY\n")
+    _write_module(tmp_path, "shared.secret", "KEY = 1\n")
+    slice_a = tmp_path / "domains/x/slices/a"
+    shutil.copytree(Path("domains/auth/slices/login_demo"), slice_a)
+    contract_path = slice_a / "slice.contract.json"
+    contract = json.loads(contract_path.read_text().replace("auth.slices.login_demo", "x.slices.a"))
+    contract["allowed_imports"].append("shared.helpers")
+    contract_path.write_text(json.dumps(contract))
+    handler = slice_a / "handler.py"
+    handler.write_text("from shared.helpers import KEY\n" + handler.read_text())
+
+    files = {
+        path.relative_to(slice_a).as_posix(): path.read_bytes()
+        for path in slice_a.rglob("*")
+        if path.is_file() and "__pycache__" not in path.parts
+    }
+    on_disk = run_asa_checks(slice_a, graph=ImportGraph.build(tmp_path))
+    assert on_disk["checks"]["imports"]["status"] == "FAILED"
+
+    # The slice now exists only in memory
+    shutil.rmtree(slice_a)
+    [in_memory] = run_asa_checks_in_memory({slice_a: files}, root=tmp_path, cache_dir=None)
+    assert in_memory["checks"] == on_disk["checks"]
+    assert "via domains.x.slices.a.handler -> shared.helpers -> shared.secret" in (
+        in_memory["checks"]["imports"]["errors"][0]
+    )
+    assert not slice_a.exists()
+
+
+def test_public_api_exports_and_cross_slice_imports(tmp_path):
+    """Test exports must exist and other slices may only import exports."""
+    from orchestrator.asa_lints.lint_public_api import lint_public_api
+
+    _write_module(tmp_path, "domains.x.slices.a.handler", "router = object()\n\ndef _helper():\n    pass\n")
+    _write_module(tmp_path, "domains.x.slices.b.service", (
+        "from domains.x.slices.a.handler import router, _helper\n"
+        "from domains.x.slices.a import handler\n"
+    ))
+    slice_a = tmp_path / "domains/x/slices/a"
+    slice_b = tmp_path / "domains/x/slices/b"
+    _write_contract(slice_a, ["domains.x.slices.a.*"])
+    _write_contract(slice_b, ["domains.x.slices.*"])
+    contract = json.loads((slice_a / "slice.contract.json").read_text())
+    contract["public_api"]["exports"] = [
+        "domains.x.slices.a.handler.router",
+        "domains.x.slices.a.handler.missing",
+        "shared.elsewhere",
+    ]
+    (slice_a / "slice.contract.json").write_text(json.dumps(contract))
+
+    graph = ImportGraph.build(tmp_path)
+    assert graph.has_symbol("domains.x.slices.a.handler._helper")
+    assert graph.is_exported("domains.x.slices.a.handler._helper") is False
+    assert graph.is_exported("domains.x.slices.a.handler") is True
+
+    success, errors = lint_public_api(slice_a, graph)
+    assert errors == [
+        "Export 'domains.x.slices.a.handler.missing' does not exist",
+        "Export 'shared.elsewhere' is outside the slice (domains.x.slices.a)",
+    ]
+
+    success, errors = lint_public_api(slice_b, graph)
+    assert success is False
+    assert errors == [
+        "service.py: Imports 'domains.x.slices.a.handler._helper', which is not "
+        "exported by x/a (public_api.exports)"
+    ]
+    # Without the project graph, other slices' exports are unknown
+    assert lint_public_api(slice_b) == (True, [])
+
+
+def test_public_api_reexports_through_package_init(tmp_path):
+    """Test names re-exported by a slice's __init__.py count as exported."""
+    from orchestrator.asa_lints.lint_public_api import lint_public_api
+
+    _write_module(tmp_path, "domains.x.slices.a.handler", "router = object()\n\ndef _helper():\n    pass\n")
+    (tmp_path / "domains/x/slices/a/__init__.py").write_text("from .handler import router, _helper\n")
+    _write_module(tmp_path, "domains.x.slices.b.service", "from domains.x.slices.a import router, _helper\n")
+    slice_a = tmp_path / "domains/x/slices/a"
+    _write_contract(slice_a, ["domains.x.slices.a.*"])
+    _write_contract(tmp_path / "domains/x/slices/b", ["domains.x.slices.*"])
+    contract = json.loads((slice_a / "slice.contract.json").read_text())
+    contract["public_api"]["exports"] = ["domains.x.slices.a.handler.router"]
+    (slice_a / "slice.contract.json").write_text(json.dumps(contract))
+
+    graph = ImportGraph.build(tmp_path)
+    assert graph.is_exported("domains.x.slices.a.router") is True
+    assert graph.is_exported("domains.x.slices.a._helper") is False
+
+    success, errors = lint_public_api(tmp_path / "domains/x/slices/b", graph)
+    assert errors == [
+        "service.py: Imports 'domains.x.slices.a._helper', which is not "
+        "exported by x/a (public_api.exports)"
+    ]
+
+
+def test_import_graph_parse_cache(tmp_path):
+    """Test a warm graph build reuses parse results of unchanged files."""
+    _write_module(tmp_path, "shared.helpers", "VALUE = 1\n")
+    _write_module(tmp_path, "domains.x.slices.a.handler", "from shared.helpers import VALUE\n")
+    _write_contract(tmp_path / "domains/x/slices/a", ["shared.*"])
+    cache_dir = tmp_path / ".asa_cache"
+
+    cold = ImportGraph.build(tmp_path, cache_dir)
+    assert cold.parse_cache.hits == 0
+    warm = ImportGraph.build(tmp_path, cache_dir)
+    assert warm.parse_cache.hits == len(warm.modules) + 1
+    for attribute in ("modules", "hashes", "imports", "direct_imports", "symbols", "imported", "contract_hashes"):
+        assert getattr(warm, attribute) == getattr(cold, attribute)
+
+    helpers = tmp_path / "shared/helpers.py"
+    helpers.write_text("VALUE = 1\nOTHER = 2\n")
+    edited = ImportGraph.build(tmp_path, cache_dir)
+    assert edited.parse_cache.hits == len(edited.modules)
+    assert "OTHER" in edited.symbols["shared.helpers"]
+
+
+def test_parse_cache_save_removes_temp_file_on_failure(tmp_path):
+    """Test a failed parse cache write leaves no temp file behind."""
+    from orchestrator.asa_lints.import_graph import ParseCache
+
+    cache = ParseCache(tmp_path, tmp_path)
+    cache.get("a.py", (1, 1))
+    cache.put("a.py", (1, 1), {"hash": None, "unwritable": object()})
+    with pytest.raises(TypeError):
+        cache.save()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_import_graph_slice_cycles_and_importers(tmp_path):
+    """Test cross-slice cycles and reverse-dependency queries."""
+    _write_module(tmp_path, "domains.x.slices.a.service", "from domains.x.slices.b import service\n")
+    _write_module(tmp_path, "domains.x.slices.b.service", "import domains.x.slices.a.service\n")
+    _write_module(tmp_path, "domains.x.slices.c.service", "from ..a import service\n")
+    for name in ["a", "b"]:
+        _write_contract(tmp_path / "domains/x/slices" / name, ["domains.x.slices.*"])
+
+    graph = ImportGraph.build(tmp_path)
+    cycles = graph.slice_cycles()
+    assert set(cycles) == {"domains.x.slices.a", "domains.x.slices.b"}
+    assert cycles["domains.x.slices.a"] == [
+        "domains.x.slices.a", "domains.x.slices.b", "domains.x.slices.a"
+    ]
+
+    success, errors = lint_contract_imports(tmp_path / "domains/x/slices/a", graph)
+    assert success is False
+    assert errors == ["Import cycle across slices: x/a -> x/b -> x/a"]
+
+    assert graph.importers("domains.x.slices.a.service") == {
+        "domains.x.slices.b.service",
+        "domains.x.slices.c.service",
+    }
+    assert "domains.x.slices.a.service" in graph.importers(
+        "domains.x.slices.b.service", transitive=True
+    )
+
+
+def test_import_matcher_matches_reference_loop():
+    """Test the compiled matcher agrees with the per-pattern fnmatch loop."""
+    from benchmarks.bench_import_matcher import naive_is_allowed
+    from orchestrator.asa_lints.lint_contract_imports import ImportMatcher
+
+    patterns = ["shared.*", "domains.*.slices.x.schemas", "a?c", "lit.eral", ""]
+    names = ["shared", "sharedx.y", "domains.q.slices.x.schemas", "abc", "lit.eral.sub", "zzz"]
+    for subset in [patterns, patterns[:-1], patterns[1:2], []]:
+        matcher = ImportMatcher(subset)
+        for name in names:
+            assert matcher(name) == naive_is_allowed(name, subset), (name, subset)
+
+
+def test_rule_engine_single_pass(tmp_path):
+    """Test import, function LOC, naming and async rules share one traversal."""
+    import ast
+    from orchestrator.asa_lints.import_graph import import_targets
+    from orchestrator.asa_lints.rule_engine import (
+        FunctionLocRule, ImportRule, NamingRule, AsyncBlockingRule, RuleEngine
+    )
+
+    source = (
+        "import time\n"
+        "from .schemas import Item\n"
+        "\n"
+        "class itemService:\n"
+        "    async def Fetch(self):\n"
+        "        time.sleep(1)\n"
+        "\n"
+        "        def helper():\n"
+        "            time.sleep(1)\n"
+        "        return helper\n"
+    )
+    tree = ast.parse(source)
+    engine = RuleEngine([ImportRule(), FunctionLocRule(max_loc=3), NamingRule(), AsyncBlockingRule()])
+    analysis = engine.run(tree, "service.py", "domains.x.slices.a", source)
+
+    assert analysis.results["imports"] == import_targets(tree, "domains.x.slices.a")
+    assert analysis.results["function_loc"] == {"itemService.Fetch": 5, "itemService.Fetch.helper": 2}
+    # The sleep in the nested sync helper is not inside an async def
+    assert [str(finding) for finding in analysis.findings] == [
+        "service.py:4: Class name 'itemService' should be CapWords [naming]",
+        "service.py:5: Function 'itemService.Fetch' has 5 LOC (max 3) [function_loc]",
+        "service.py:5: Function name 'Fetch' should be snake_case [naming]",
+        "service.py:6: Blocking call 'time.sleep()' in async function 'Fetch' "
+        "(await an async API or use asyncio.to_thread) [async_blocking]",
+    ]
+
+
+def test_analyze_files_runs_the_rules_named_per_file():
+    """Test analyze_files reports only the rules selected for each file."""
+    from orchestrator.asa_lints.rule_engine import analyze_files
+    from orchestrator.asa_lints.slice_context import SliceContext
+
+    ctx = SliceContext(Path("domains/auth/slices/login_demo"))
+    assert analyze_files(ctx, {"repository.py": ["async_blocking"], "service.py": ["linear_scan"]}) == []
+    findings = analyze_files(ctx, {"repository.py": ["linear_scan"], "service.py": ["async_blocking"]})
+    assert [(f.filename, f.rule) for f in findings] == [
+        ("repository.py", "linear_scan"), ("service.py", "async_blocking")
+    ]
+
+
+def test_performance_check_and_overrides(tmp_path):
+    """Test blocking calls in async defs and repository scans are flagged unless allow-listed."""
+    import shutil
+
+    slice_path = tmp_path / "login_demo"
+    shutil.copytree(Path("domains/auth/slices/login_demo"), slice_path)
+    contract_path = slice_path / "slice.contract.json"
+    contract = json.loads(contract_path.read_text())
+
+    # The demo slice allow-lists both of its findings
+    results = run_asa_checks(slice_path)
+    performance = results["checks"]["performance"]
+    assert performance["status"] == "WARNING"
+    assert performance["errors"] == []
+    assert len(performance["warnings"]) == 2
+    assert results["overall_status"] == "PASSED" and results["has_warnings"]
+
+    del contract["performance_overrides"]
+    contract_path.write_text(json.dumps(contract))
+    with open(slice_path / "handler.py", "a") as f:
+        f.write(
+            "\n\nfrom time import sleep as nap\n"
+            "import asyncio\n\n"
+            "async def _wait(service):\n"
+            "    await service.authenticate(None)\n"
+            "    await asyncio.to_thread(nap, 1)\n"
+            "    nap(1)\n"
+        )
+
+    performance = run_asa_checks(slice_path)["checks"]["performance"]
+    assert performance["status"] == "WARNING"
+    assert [error.split(": ", 1)[0] for error in performance["errors"]] == [
+        "❌ handler.py:63",
+        "❌ repository.py:64",
+        "❌ service.py:48",
+    ]
+    assert "'time.sleep()' in async function '_wait'" in performance["errors"][0]
+    assert "'shared.utils.verify_password()'" in performance["errors"][2]
+
+
+def test_performance_budget_check(tmp_path, monkeypatch):
+    """Test bench-slice results are compared with the contract budgets."""
+    import shutil
+    from orchestrator.asa_lints.lint_performance import bench_results_path, check_budgets, source_hash
+    from orchestrator.bench_slice import bench_slice
+
+    demo = Path("domains/auth/slices/login_demo")
+    cache_dir = tmp_path / "cache"
+    endpoint = "POST /api/v1/auth/login-demo"
+    results = bench_slice(demo, requests=10, warmup=1, cache_dir=cache_dir)
+    assert results["endpoints"][endpoint]["status_codes"] == {"200": 10}
+    errors, warnings = check_budgets(demo, cache_dir)
+    assert errors == [f"❌ {violation}" for violation in results["violations"]]
+    assert warnings == []
+
+    slice_path = tmp_path / "login_demo"
+    shutil.copytree(demo, slice_path)
+    # Never benchmarked (fresh clone, CI): nothing to compare, no noise
+    assert check_budgets(slice_path, cache_dir) == ([], [])
+    assert run_asa_checks(slice_path)["checks"]["performance_budget"] == {
+        "status": "OK", "errors": [], "warnings": []
+    }
+
+    # Slow, failing results for the current sources are failures
+    measured = {"status_codes": {"200": 9, "401": 1}, "p99_ms": 80.0, "rps": 500.0, "memory_growth_kb": 1.0}
+    results_path = bench_results_path(slice_path, cache_dir)
+    results_path.write_text(json.dumps({
+        "source_hash": source_hash(slice_path), "endpoints": {endpoint: measured}
+    }))
+    errors, warnings = check_budgets(slice_path, cache_dir)
+    assert errors == [
+        f"❌ {endpoint}: unexpected responses {{'401': 1}} (expected 200); "
+        "check performance.request in the contract",
+        f"❌ {endpoint}: p99_ms 80.0 ms exceeds budget of 50 ms",
+    ]
+
+    # Editing the slice makes the results stale
+    with open(slice_path / "service.py", "a") as f:
+        f.write("\nEXTRA = 1\n")
+    errors, warnings = check_budgets(slice_path, cache_dir)
+    assert errors == [] and "stale" in warnings[0]
+
+    # The check reads the default cache directory
+    shutil.copytree(cache_dir, tmp_path / ".asa_cache")
+    monkeypatch.chdir(tmp_path)
+    results = run_asa_checks(slice_path)
+    assert results["checks"]["performance_budget"]["status"] == "WARNING"
+    assert results["has_warnings"]
+
+
+def test_bench_slice_drives_unbudgeted_public_api_endpoint(tmp_path, monkeypatch):
+    """Test bench-slice measures the public_api endpoint of a slice without budgets."""
+    import shutil
+    from orchestrator.bench_slice import bench_slice, format_bench
+
+    slice_path = tmp_path / "domains/auth/slices/login_demo"
+    shutil.copytree(Path("domains/auth/slices/login_demo"), slice_path)
+    contract_path = slice_path / "slice.contract.json"
+    contract = json.loads(contract_path.read_text())
+    del contract["performance"]
+    contract_path.write_text(json.dumps(contract))
+    monkeypatch.chdir(tmp_path)
+
+    endpoint = "POST /api/v1/auth/login-demo"
+    results = bench_slice(Path("domains/auth/slices/login_demo"), requests=5, warmup=0, cache_dir=None)
+    # No sample request: the endpoint rejects the empty body, but nothing is budgeted
+    assert results["endpoints"][endpoint]["status_codes"] == {"422": 5}
+    assert results["violations"] == []
+    assert "no budget" in format_bench(results, {})
+
+
+@pytest.mark.benchmark
+def test_rule_engine_benchmark_speedup():
+    """Guard the single-traversal speedup over one traversal per rule."""
+    from benchmarks.bench_rule_engine import run
+
+    result = run(functions=300, repeat=3)
+    assert result["findings"] > 0
+    assert result["speedup"] >= 2
+
+
+@pytest.mark.benchmark
+def test_import_matcher_benchmark_speedup():
+    """Guard the compiled matcher speedup on a large imports x patterns workload."""
+    from benchmarks.bench_import_matcher import run
+
+    result = run(n_imports=2000, n_patterns=200)
+    assert result["speedup"] >= 5
+
+
+def test_monorepo_benchmark_project_and_baseline(tmp_path):
+    """Test the synthetic monorepo lints cleanly and regressions are detected."""
+    from benchmarks.bench_monorepo import compare, generate_project
+
+    assert generate_project(tmp_path, domains=2, slices=2, shared_modules=5, fanout=3) == 4
+    slice_path = tmp_path / "domains/domain_1/slices/slice_1"
+    graph = ImportGraph.build(tmp_path)
+    results = run_asa_checks(slice_path, graph=graph)
+    assert results["overall_status"] == "PASSED"
+    assert any(m.startswith("shared.bench.") for m in graph.closure("domains.domain_1.slices.slice_1"))
+
+    baseline = {
+        "config": {"domains": 2},
+        "results": {"lint_all_cold": {"wall_s": 1.0, "peak_rss_kb": 1000}},
+    }
+    current = {
+        "config": {"domains": 2},
+        "results": {"lint_all_cold": {"wall_s": 1.1, "peak_rss_kb": 1500}},
+    }
+    assert compare(current, baseline, threshold=0.2) == [
+        "lint_all_cold.peak_rss_kb: 1000 -> 1500 (+50%, limit +20%)"
+    ]
+    assert compare({**current, "config": {"domains": 3}}, baseline)[0].startswith("config differs")
+
+
+def test_run_asa_checks_profile():
+    """Test profiling records time and memory per check and per slice."""
+    results = run_asa_checks(Path("domains/auth/slices/login_demo"), profile=True)
+
+    profile = results["profile"]
+    assert set(profile["checks"]) == set(results["checks"])
+    for stats in profile["checks"].values():
+        assert set(stats) == {"wall_ms", "cpu_ms", "peak_kb"}
+    assert profile["wall_ms"] >= max(s["wall_ms"] for s in profile["checks"].values())
+    assert profile["peak_kb"] > 0
+    assert "profile" not in run_asa_checks(Path("domains/auth/slices/login_demo"))
+
+
+def test_failed_prerequisite_skips_dependent_checks(tmp_path):
+    """Test checks requiring a failed check are SKIPPED, not run."""
+    import shutil
+
+    slice_path = tmp_path / "login_demo"
+    shutil.copytree(Path("domains/auth/slices/login_demo"), slice_path)
+    (slice_path / "service.py").unlink()
+
+    results = run_asa_checks(slice_path)
+    assert results["checks"]["structure"]["status"] == "FAILED"
+    for name in ["contract", "loc_limits", "imports"]:
+        assert results["checks"][name]["status"] == "SKIPPED"
+    assert results["checks"]["imports"]["reason"] == "requires contract"
+    assert "⏭️ Contract: SKIPPED (requires structure)" in format_results(results)
+
+
+def test_check_registry_schedules_by_prerequisites():
+    """Test custom checks, concurrent waves and crash handling."""
+    import threading
+    from orchestrator.asa_lints.registry import CheckRegistry, run_checks
+
+    registry = CheckRegistry(entry_point_group=None)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def ok(ctx, graph):
+        return {"status": "OK", "errors": []}
+
+    def together(ctx, graph):
+        # Only passes if both checks of the wave run at the same time
+        barrier.wait()
+        return {"status": "OK", "errors": []}
+
+    def crash(ctx, graph):
+        raise RuntimeError("boom")
+
+    registry.register("base", ok)
+    registry.register("left", together, requires=["base"])
+    registry.register("right", together, requires=["base"])
+    registry.register("crashing", crash, requires=["left"])
+    registry.register("after_crash", ok, requires=["crashing", "right"])
+
+    with pytest.raises(ValueError):
+        registry.register("orphan", ok, requires=["missing"])
+    with pytest.raises(ValueError):
+        registry.unregister("base")
+
+    results = run_checks(SliceContext(Path("domains/auth/slices/login_demo")), registry=registry)
+    assert list(results) == ["base", "left", "right", "crashing", "after_crash"]
+    assert results["left"]["status"] == results["right"]["status"] == "OK"
+    assert results["crashing"] == {
+        "status": "FAILED", "errors": ["Check crashed: RuntimeError: boom"]
+    }
+    assert results["after_crash"]["status"] == "SKIPPED"
+
+
+def test_register_check_runs_with_builtin_checks(tmp_path):
+    """Test a check registered with @register_check runs and busts the cache."""
+    import shutil
+    from orchestrator.asa_lints import register_check
+    from orchestrator.asa_lints.registry import REGISTRY
+
+    slice_path = tmp_path / "login_demo"
+    shutil.copytree(Path("domains/auth/slices/login_demo"), slice_path)
+    cache_dir = tmp_path / "cache"
+    assert run_asa_checks_cached(slice_path, cache_dir)["cached"] is False
+
+    @register_check("todo_comments", inputs={"service.py"}, requires=("structure",))
+    def check_todo_comments(ctx, graph):
+        todos = ctx.read_text("service.py").count("TODO")
+        return {"status": "OK", "errors": [], "todos": todos}
+
+    try:
+        results = run_asa_checks_cached(slice_path, cache_dir)
+        assert results["cached"] is False
+        assert list(results["checks"])[-1] == "todo_comments"
+        assert results["checks"]["todo_comments"]["status"] == "OK"
+    finally:
+        REGISTRY.unregister("todo_comments")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
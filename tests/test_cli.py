@@ -1,9 +1,21 @@
 """Tests for ASA CLI"""
+import json
+import os
 import pytest
+import shutil
+import subprocess
+import sys
+import click
 from click.testing import CliRunner
 from orchestrator.cli import main
 from pathlib import Path
 
+DEMO_SLICE = Path("domains/auth/slices/login_demo").resolve()
+
+# Import time of orchestrator.cli itself, excluding click (was ~90 ms when
+# every command and the linters were imported eagerly)
+CLI_IMPORT_BUDGET_US = 40_000
+
 
 @pytest.fixture
 def cli_runner():
@@ -11,6 +23,21 @@ def cli_runner():
     return CliRunner()
 
 
+@pytest.fixture
+def multi_slice_project(tmp_path, monkeypatch):
+    """Create a project with several slices (one broken) and chdir into it."""
+    for domain, name in [("auth", "login_demo"), ("auth", "login_copy"), ("users", "profile")]:
+        slice_path = tmp_path / "domains" / domain / "slices" / name
+        shutil.copytree(DEMO_SLICE, slice_path)
+        contract = slice_path / "slice.contract.json"
+        contract.write_text(
+            contract.read_text().replace("auth.slices.login_demo", f"{domain}.slices.{name}")
+        )
+    (tmp_path / "domains" / "users" / "slices" / "profile" / "service.py").unlink()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
 def test_cli_help(cli_runner):
     """Test asa --help."""
     result = cli_runner.invoke(main, ["--help"])
@@ -86,6 +113,471 @@ def test_lint_all_with_domain_filter(cli_runner):
     assert "Linting" in result.output
 
 
+def test_lint_all_parallel_matches_serial(cli_runner, multi_slice_project):
+    """Test asa lint-all --jobs produces the same output as a serial run."""
+    serial = cli_runner.invoke(main, ["lint-all", "--no-cache"])
+    parallel = cli_runner.invoke(main, ["lint-all", "--no-cache", "--jobs", "2"])
+    assert serial.exit_code == parallel.exit_code == 1
+    assert parallel.output == serial.output
+    assert "Failed: 1" in parallel.output
+
+
+def test_lint_all_parallel_fail_fast(cli_runner, multi_slice_project):
+    """Test asa lint-all --jobs --fail-fast stops at the first failed slice."""
+    result = cli_runner.invoke(main, ["lint-all", "--jobs", "2", "--fail-fast"])
+    assert "Stopping due to --fail-fast" in result.output
+    assert "Summary:" not in result.output
+    assert result.exit_code == 1
+
+
+def test_lint_all_cache_hits(cli_runner, multi_slice_project):
+    """Test asa lint-all replays unchanged slices from the cache."""
+    first = cli_runner.invoke(main, ["lint-all"])
+    assert "Cache hits: 0/3" in first.output
+
+    handler = multi_slice_project / "domains/auth/slices/login_copy/handler.py"
+    handler.write_text(handler.read_text() + "\n# edited\n")
+
+    second = cli_runner.invoke(main, ["lint-all"])
+    assert "Cache hits: 2/3" in second.output
+    assert second.output.replace("2/3", "0/3") == first.output
+
+    uncached = cli_runner.invoke(main, ["lint-all", "--no-cache"])
+    assert "Cache hits" not in uncached.output
+
+
+def test_lint_watcher_reruns_affected_checks(multi_slice_project):
+    """Test lint --watch re-lints only edited slices and affected checks."""
+    from orchestrator.watch import LintWatcher
+
+    watcher = LintWatcher(Path("domains"))
+    first = watcher.poll()
+    assert len(first) == 3
+    assert watcher.poll() == []
+
+    slice_path = Path("domains/auth/slices/login_copy")
+    service = slice_path / "service.py"
+    service.write_text(service.read_text() + "\n\nEXTRA = 1\n")
+
+    reports = watcher.poll()
+    assert len(reports) == 1
+    reported_path, results, checks, elapsed_ms = reports[0]
+    assert reported_path == slice_path
+    assert checks == {
+        "loc_limits", "imports", "public_api", "performance", "performance_budget"
+    }
+    assert results["overall_status"] == "PASSED"
+
+    (slice_path / "tests" / "test_slice.py").unlink()
+    reports = watcher.poll()
+    # The imports checks read every Python file, tests included
+    assert reports[0][2] == {"structure", "imports", "public_api"}
+    assert reports[0][1]["overall_status"] == "FAILED"
+
+
+def test_lint_watcher_relints_tests_and_init(multi_slice_project):
+    """Test lint --watch re-runs the imports check when tests/ or __init__.py change."""
+    from orchestrator.asa_lints import run_asa_checks
+    from orchestrator.watch import LintWatcher
+
+    watcher = LintWatcher(Path("domains"))
+    watcher.poll()
+    slice_path = Path("domains/auth/slices/login_copy")
+
+    for name in ["tests/test_slice.py", "__init__.py"]:
+        module = slice_path / name
+        original = module.read_text()
+        module.write_text("from domains.users.slices.profile import handler\n" + original)
+
+        reports = watcher.poll()
+        assert len(reports) == 1
+        _, results, checks, _ = reports[0]
+        assert {"imports", "public_api"} <= checks
+        assert results["checks"]["imports"]["status"] == "FAILED"
+        assert results["checks"] == run_asa_checks(slice_path)["checks"]
+
+        module.write_text(original)
+        assert watcher.poll()[0][1]["checks"]["imports"]["status"] == "OK"
+
+
+def test_lint_watch_checks_the_import_graph(cli_runner, multi_slice_project, monkeypatch):
+    """Test lint --watch runs the graph checks and tracks shared dependencies like lint."""
+    from orchestrator.watch import LintWatcher
+
+    (multi_slice_project / "shared").mkdir()
+    (multi_slice_project / "shared" / "__init__.py").write_text("")
+    helpers = multi_slice_project / "shared" / "helpers.py"
+    helpers.write_text("VALUE = 1\n")
+    slice_path = Path("domains/auth/slices/login_copy")
+    service = slice_path / "service.py"
+    service.write_text("from shared.helpers import VALUE\n" + service.read_text())
+
+    def watch_once(self, interval):
+        yield self.poll()
+        # A shared module the slice imports gains a forbidden transitive import
+        helpers.write_text("from domains.users.slices.profile import schemas\nVALUE = 2\n")
+        yield self.poll()
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(LintWatcher, "watch", watch_once)
+    result = cli_runner.invoke(main, ["lint", "--watch", str(slice_path)])
+    assert result.exception is None
+    second = result.output.split("Linting:")[-1]
+    assert "re-ran: imports, public_api" in second
+    assert "Unauthorized transitive import 'domains.users.slices.profile.schemas'" in second
+
+    cold = cli_runner.invoke(main, ["lint", str(slice_path), "--no-cache", "--no-server"])
+    assert "Unauthorized transitive import 'domains.users.slices.profile.schemas'" in cold.output
+
+
+def test_lint_watch_requires_a_directory(cli_runner):
+    """Test asa lint --watch exits 1 when given a file."""
+    result = cli_runner.invoke(main, ["lint", "--watch", str(DEMO_SLICE / "handler.py")])
+    assert "Not a directory" in result.output
+    assert result.exit_code == 1
+
+
+def test_lint_without_path_requires_watch(cli_runner):
+    """Test asa lint without SLICE_PATH is a usage error."""
+    result = cli_runner.invoke(main, ["lint"])
+    assert result.exit_code == 2
+    assert "SLICE_PATH" in result.output
+
+
+def test_who_imports(cli_runner):
+    """Test asa who-imports reports direct and transitive importers."""
+    result = cli_runner.invoke(main, ["who-imports", "shared.utils.jwt_service"])
+    assert result.exit_code == 0
+    assert "shared.utils" in result.output
+
+    result = cli_runner.invoke(main, ["who-imports", "shared.utils.jwt_service", "-t"])
+    assert "domains.auth.slices.login_demo.service" in result.output
+    assert "Slices: auth/login_demo" in result.output
+
+
+def test_lint_all_jsonl_format(cli_runner, multi_slice_project):
+    """Test asa lint-all --format jsonl streams one record per slice."""
+    import json
+
+    result = cli_runner.invoke(main, ["lint-all", "--format", "jsonl", "--no-cache"])
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert [r["type"] for r in records] == ["start", "slice", "slice", "slice", "summary"]
+    assert records[-1]["failed"] == 1
+    assert records[-1]["failed_slices"] == ["domains/users/slices/profile"]
+
+
+def test_lint_all_sarif_format(cli_runner, multi_slice_project):
+    """Test asa lint-all --format sarif emits one valid SARIF document."""
+    import json
+
+    for args in [[], ["--fail-fast"]]:
+        result = cli_runner.invoke(main, ["lint-all", "--format", "sarif", "--no-cache", *args])
+        sarif = json.loads(result.output)
+        run = sarif["runs"][0]
+        assert sarif["version"] == "2.1.0"
+        assert run["invocations"][0]["executionSuccessful"] is False
+        errors = [r for r in run["results"] if r["level"] == "error"]
+        assert {r["ruleId"] for r in errors} == {"asa/structure"}
+        assert errors[0]["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] \
+            == "domains/users/slices/profile"
+
+    # Warnings of passing checks (e.g. allow-listed performance findings) are results too
+    [blocking] = [
+        r for r in run["results"]
+        if r["ruleId"] == "asa/performance" and "login_copy" in str(r["locations"])
+        and "async_blocking" in r["message"]["text"]
+    ]
+    assert blocking["level"] == "warning"
+    assert blocking["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] \
+        == "domains/auth/slices/login_copy/service.py"
+
+
+def test_lint_all_profile(cli_runner, multi_slice_project):
+    """Test asa lint-all --profile prints per-check and per-slice timings."""
+    result = cli_runner.invoke(main, ["lint-all", "--profile"])
+    assert "Profile:" in result.output
+    assert "import_graph" in result.output
+    assert "Slowest slices" in result.output
+    for check in ["structure", "contract", "loc_limits", "imports"]:
+        assert check in result.output.split("Profile:")[1]
+
+    # Columns line up even for the longest check name
+    table = result.output.split("Profile:\n\n")[1].split("\n\n")[0].splitlines()
+    assert any(row.startswith("  performance_budget ") for row in table)
+    assert len({len(row) for row in table}) == 1
+
+
+def test_list_slices_json(cli_runner, multi_slice_project):
+    """Test asa list-slices --json prints the slice manifest."""
+    result = cli_runner.invoke(main, ["list-slices", "--json"])
+    assert result.exit_code == 0
+    slices = json.loads(result.output)
+    assert [info["path"] for info in slices] == [
+        "domains/auth/slices/login_copy",
+        "domains/auth/slices/login_demo",
+        "domains/users/slices/profile",
+    ]
+    assert slices[0]["domain"] == "auth"
+    assert slices[0]["contract_version"] == "1.0.0"
+    assert len(slices[0]["files"]["handler.py"]) == 64
+    assert "service.py" not in slices[2]["files"]
+    assert (multi_slice_project / ".asa_cache" / "manifest.json").exists()
+
+
+def test_slice_index_invalidation(multi_slice_project):
+    """Test the discovery index picks up new slices, contracts and edits."""
+    from orchestrator.discovery import SliceIndex
+
+    before = SliceIndex().slices(hashes=True)
+
+    # Unchanged tree: a fresh index answers from the persisted manifest
+    assert SliceIndex().slices(hashes=True) == before
+
+    shutil.copytree(DEMO_SLICE, multi_slice_project / "domains/billing/slices/invoice")
+    contract = multi_slice_project / "domains/auth/slices/login_demo/slice.contract.json"
+    contract.write_text(contract.read_text().replace('"1.0.0"', '"1.1.0"'))
+    handler = multi_slice_project / "domains/auth/slices/login_copy/handler.py"
+    handler.write_text(handler.read_text() + "\n# edited\n")
+
+    after = {info["path"]: info for info in SliceIndex().slices(hashes=True)}
+    assert "domains/billing/slices/invoice" in after
+    assert after["domains/auth/slices/login_demo"]["contract_version"] == "1.1.0"
+    assert after["domains/auth/slices/login_copy"]["files"]["handler.py"] != (
+        before[0]["files"]["handler.py"]
+    )
+    assert [p.name for p in SliceIndex().paths(domain="billing")] == ["invoice"]
+
+
+def test_slice_index_save_removes_temp_file_on_failure(multi_slice_project, monkeypatch):
+    """Test a failed manifest write leaves no temp file behind."""
+    from orchestrator import discovery
+
+    def fail(*args, **kwargs):
+        raise ValueError("unserializable")
+
+    monkeypatch.setattr(discovery.json, "dump", fail)
+    with pytest.raises(ValueError):
+        discovery.SliceIndex().slices()
+    assert list((multi_slice_project / ".asa_cache").iterdir()) == []
+
+
+def test_slice_index_without_persisting(multi_slice_project):
+    """Test persist=False keeps the manifest in memory only."""
+    from orchestrator.discovery import SliceIndex
+
+    index = SliceIndex(persist=False)
+    assert len(index.slices(hashes=True)) == 3
+    assert [p.name for p in index.paths(domain="users")] == ["profile"]
+    assert not (multi_slice_project / ".asa_cache").exists()
+    assert index.slices() == SliceIndex().slices()
+
+
+def test_app_slice_discovery_loads_no_linters(tmp_path):
+    """The app's /health discovery imports no linters and can skip the manifest."""
+    root = Path(__file__).resolve().parent.parent
+    code = (
+        "import sys\n"
+        "import main\n"
+        "main.health()\n"
+        "print(main.slice_index.persist)\n"
+        "print(sorted(m for m in sys.modules if m.startswith('orchestrator.asa_lints')))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=root,
+        env={**os.environ, "ASA_PERSIST_SLICE_INDEX": "0"},
+    )
+    assert result.stdout.strip().splitlines()[-2:] == ["False", "[]"]
+
+
+def _git(project, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=asa", "-c", "user.email=asa@example.com", *args],
+        cwd=project, check=True, capture_output=True
+    )
+
+
+@pytest.fixture
+def git_project(multi_slice_project):
+    """multi_slice_project committed to a fresh git repository."""
+    (multi_slice_project / "shared" / "utils").mkdir(parents=True)
+    (multi_slice_project / "shared" / "utils" / "__init__.py").write_text("")
+    _git(multi_slice_project, "init", "-q")
+    _git(multi_slice_project, "add", "domains", "shared")
+    _git(multi_slice_project, "commit", "-q", "-m", "initial")
+    return multi_slice_project
+
+
+def test_lint_changed_since(cli_runner, git_project):
+    """Test asa lint-changed lints only slices owning changed files."""
+    result = cli_runner.invoke(main, ["lint-changed"])
+    assert "No slices to lint" in result.output
+
+    handler = git_project / "domains/auth/slices/login_copy/handler.py"
+    handler.write_text(handler.read_text() + "\n# edited\n")
+    result = cli_runner.invoke(main, ["lint-changed", "--since", "HEAD"])
+    assert "Linting 1 slice(s)" in result.output
+    assert "login_copy" in result.output
+    assert "login_demo" not in result.output
+
+    # A changed shared module re-lints every slice whose contract allows it
+    (git_project / "shared/utils/helpers.py").write_text("VALUE = 1\n")
+    result = cli_runner.invoke(main, ["lint-changed"])
+    assert "Linting 3 slice(s)" in result.output
+    assert "2 slice(s) allow a changed shared module" in result.output
+
+
+def test_lint_changed_staged_reads_index(cli_runner, git_project):
+    """Test asa lint-changed --staged lints the index, not the working tree."""
+    slice_path = git_project / "domains/auth/slices/login_demo"
+    (slice_path / "schemas.py").write_text((slice_path / "schemas.py").read_text() + "\n")
+    _git(git_project, "add", "domains")
+
+    # Unstaged deletion: the working tree is broken, the index is not
+    (slice_path / "service.py").unlink()
+
+    result = cli_runner.invoke(main, ["lint-changed", "--staged"])
+    assert "1 file(s) changed (staged)" in result.output
+    assert "All slices passed" in result.output
+    assert result.exit_code == 0
+
+    result = cli_runner.invoke(main, ["lint-changed"])
+    assert "login_demo" in result.output
+    assert "Failed: 1" in result.output
+    assert result.exit_code == 1
+
+
+def test_lint_changed_outside_git(cli_runner, multi_slice_project):
+    """Test asa lint-changed reports git errors."""
+    result = cli_runner.invoke(main, ["lint-changed"])
+    assert result.exit_code == 1
+    assert "❌ git:" in result.output
+
+
+def test_lint_changed_exit_code(cli_runner, git_project):
+    """Test asa lint-changed exits 1 when a changed slice fails."""
+    result = cli_runner.invoke(main, ["lint-changed", "--staged"])
+    assert result.exit_code == 0
+
+    (git_project / "domains/auth/slices/login_demo/service.py").unlink()
+    _git(git_project, "add", "-A", "domains")
+    result = cli_runner.invoke(main, ["lint-changed", "--staged"])
+    assert "Failed: 1" in result.output
+    assert result.exit_code == 1
+
+
+@pytest.fixture
+def lint_server(multi_slice_project):
+    """A lint server for multi_slice_project, served from a background thread."""
+    import threading
+    from orchestrator.lint_server import DEFAULT_SOCKET, LintServer, LintService, request
+
+    (multi_slice_project / "shared" / "utils").mkdir(parents=True)
+    (multi_slice_project / "shared" / "__init__.py").write_text("")
+    (multi_slice_project / "shared" / "utils" / "__init__.py").write_text("")
+    (multi_slice_project / "shared" / "utils" / "helpers.py").write_text("VALUE = 1\n")
+    service = multi_slice_project / "domains/auth/slices/login_demo/service.py"
+    service.write_text("from shared.utils.helpers import VALUE\n" + service.read_text())
+
+    DEFAULT_SOCKET.parent.mkdir(parents=True, exist_ok=True)
+    server = LintServer(DEFAULT_SOCKET, LintService(Path(".")))
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    yield lambda payload: request(DEFAULT_SOCKET, payload)
+    request(DEFAULT_SOCKET, {"op": "shutdown"})
+    thread.join(timeout=5)
+    server.server_close()
+
+
+def test_lint_server_rechecks_only_affected(lint_server, multi_slice_project):
+    """Test the lint server answers from warm state and re-runs affected checks."""
+    slice_dir = "domains/auth/slices/login_demo"
+    assert lint_server({"op": "ping"})["ok"] is True
+
+    first = lint_server({"op": "lint", "path": slice_dir})
+    assert first["ok"] is True
+    assert first["rechecked"] == [
+        "structure", "contract", "loc_limits", "imports", "public_api", "performance",
+        "performance_budget",
+    ]
+    assert first["results"]["overall_status"] == "PASSED"
+
+    # A file path is mapped to its slice; nothing changed, nothing re-runs
+    second = lint_server({"op": "lint", "path": f"{slice_dir}/handler.py"})
+    assert second["rechecked"] == []
+    assert second["results"] == first["results"]
+
+    # A shared module the slice imports gains a forbidden transitive import
+    helpers = multi_slice_project / "shared/utils/helpers.py"
+    helpers.write_text("from domains.users.slices.profile import schemas\nVALUE = 2\n")
+    third = lint_server({"op": "lint", "path": slice_dir})
+    assert third["rechecked"] == ["imports", "public_api"]
+    assert "Unauthorized transitive import 'domains.users.slices.profile.schemas'" in (
+        "\n".join(third["results"]["checks"]["imports"]["errors"])
+    )
+
+    assert lint_server({"op": "lint", "path": "domains"})["ok"] is False
+    assert lint_server({"op": "bogus"})["ok"] is False
+
+
+def test_lint_service_resolves_paths_against_root(multi_slice_project, tmp_path, monkeypatch):
+    """Test the lint service lints slices under its root, whatever the cwd."""
+    from orchestrator.lint_server import LintService
+
+    service = LintService(multi_slice_project)
+    monkeypatch.chdir(tmp_path.parent)
+    response = service.handle({"op": "lint", "path": "domains/auth/slices/login_demo"})
+    assert response["ok"] is True
+    assert response["results"]["overall_status"] == "PASSED"
+    assert response["results"]["checks"]["structure"]["status"] == "OK"
+
+
+def test_lint_forwards_to_lint_server(cli_runner, lint_server):
+    """Test asa lint uses a running lint server unless --no-server is given."""
+    result = cli_runner.invoke(main, ["lint", "domains/auth/slices/login_demo/service.py"])
+    assert "Linting: domains/auth/slices/login_demo" in result.output
+    assert "(lint server," in result.output
+
+    result = cli_runner.invoke(main, ["lint", "domains/auth/slices/login_demo", "--no-server"])
+    assert "(lint server," not in result.output
+    assert "Result: PASSED" in result.output
+
+
+def test_lint_exit_code(cli_runner, lint_server):
+    """Test asa lint exits 1 on a failing slice, forwarded or not."""
+    result = cli_runner.invoke(main, ["lint", "domains/users/slices/profile"])
+    assert "(lint server," in result.output
+    assert result.exit_code == 1
+
+    result = cli_runner.invoke(main, ["lint", "domains/users/slices/profile", "--no-server"])
+    assert "Result: FAILED" in result.output
+    assert result.exit_code == 1
+
+
+def test_bench_slice(cli_runner, tmp_path, monkeypatch):
+    """Test asa bench-slice drives the budgeted endpoints and stores the results."""
+    monkeypatch.chdir(tmp_path)
+    result = cli_runner.invoke(main, ["bench-slice", str(DEMO_SLICE), "--requests", "10", "--warmup", "1"])
+    assert result.exit_code == 0
+    assert "POST /api/v1/auth/login-demo  (10 requests: 200×10)" in result.output
+    assert "budget ≤ 50 ms" in result.output
+
+    stored = json.loads((tmp_path / ".asa_cache/bench/domains.auth.slices.login_demo.json").read_text())
+    assert stored["endpoints"]["POST /api/v1/auth/login-demo"]["requests"] == 10
+
+
+def test_bench_slice_exit_code(cli_runner, multi_slice_project):
+    """Test asa bench-slice exits 1 on a budget violation."""
+    slice_path = multi_slice_project / "domains/auth/slices/login_demo"
+    contract_file = slice_path / "slice.contract.json"
+    contract = json.loads(contract_file.read_text())
+    contract["performance"]["POST /api/v1/auth/login-demo"]["min_rps"] = 10**9
+    contract_file.write_text(json.dumps(contract))
+
+    result = cli_runner.invoke(main, ["bench-slice", str(slice_path), "--requests", "10", "--warmup", "1"])
+    assert "❌" in result.output
+    assert result.exit_code == 1
+
+
 def test_lint_help(cli_runner):
     """Test asa lint --help."""
     result = cli_runner.invoke(main, ["lint", "--help"])
@@ -105,6 +597,148 @@ def test_generate_slice_help(cli_runner):
     assert "--slice-name" in result.output
 
 
+def test_generate_slice_manifest(cli_runner, multi_slice_project, monkeypatch):
+    """Test generate-slice --manifest sends one batch request and lints every slice once."""
+    import httpx
+    from fastapi.testclient import TestClient
+    from mcp_server.main import app
+
+    mcp_client = TestClient(app)
+    posted = []
+
+    def post(url, json, timeout):
+        posted.append(url)
+        return mcp_client.post(url.replace("http://localhost:8001", ""), json=json)
+
+    monkeypatch.setattr(httpx, "post", post)
+    manifest = multi_slice_project / "slices.json"
+    manifest.write_text(json.dumps([
+        {"func_spec": "Create an order", "domain": "orders", "slice_name": "create_order"},
+        {"func_spec": "Cancel an order", "domain": "orders", "slice_name": "cancel_order"},
+    ]))
+
+    result = cli_runner.invoke(main, ["generate-slice", "--manifest", str(manifest)])
+    assert result.exception is None
+    assert posted == ["http://localhost:8001/mcp/generate-batch"]
+    assert "✅ orders/create_order:" in result.output
+    assert "Linting 2 slice(s)" in result.output
+    assert "Total: 2" in result.output
+    assert Path("domains/orders/slices/cancel_order/handler.py").exists()
+
+    result = cli_runner.invoke(main, ["generate-slice", "--manifest", str(manifest), "-d", "orders"])
+    assert result.exit_code != 0
+    assert "cannot be combined" in result.output
+
+
+def test_generate_slice_stream(cli_runner, multi_slice_project, monkeypatch):
+    """Test generate-slice --stream writes the streamed slices locally and lints them."""
+    import httpx
+    from fastapi.testclient import TestClient
+    from mcp_server.main import app
+
+    mcp_client = TestClient(app)
+    requests = []
+
+    def stream(method, url, json, timeout):
+        requests.append(json)
+        return mcp_client.stream(method, url.replace("http://localhost:8001", ""), json=json)
+
+    monkeypatch.setattr(httpx, "stream", stream)
+    result = cli_runner.invoke(main, [
+        "generate-slice", "-f", "Ship an order", "-d", "orders", "-s", "ship_order",
+        "-o", "generated/ship_order", "--stream",
+    ])
+    assert result.exception is None
+    assert requests[0]["format"] == "ndjson"
+    assert "[1/1] ✅ domains/orders/slices/ship_order (9 files)" in result.output
+    assert Path("generated/ship_order/handler.py").exists()
+    assert not Path("domains/orders").exists()
+    assert "Total: 1" in result.output
+
+    manifest = multi_slice_project / "slices.json"
+    manifest.write_text(json.dumps([
+        {"func_spec": "Pay an order", "domain": "orders", "slice_name": "pay_order"},
+    ]))
+    result = cli_runner.invoke(main, ["generate-slice", "--manifest", str(manifest), "--stream=tar"])
+    assert result.exception is None
+    assert requests[1]["format"] == "tar"
+    assert Path("domains/orders/slices/pay_order/tests/test_slice.py").exists()
+
+    # Same domain/slice_name with different outputs must not collapse
+    manifest.write_text(json.dumps([
+        {"func_spec": "Pay an order", "domain": "orders", "slice_name": "pay_order", "output": "a/pay_order"},
+        {"func_spec": "Pay an order", "domain": "orders", "slice_name": "pay_order", "output": "b/pay_order"},
+    ]))
+    result = cli_runner.invoke(main, ["generate-slice", "--manifest", str(manifest), "--stream"])
+    assert result.exception is None
+    assert requests[2]["slices"][1]["path"] == "domains/orders/slices/pay_order-2"
+    assert Path("a/pay_order/handler.py").exists()
+    assert Path("b/pay_order/handler.py").exists()
+
+    def unexpected_stream(method, url, json, timeout):
+        json = {**json, "slices": [{**json["slices"][0], "path": "elsewhere/pay_order"}]}
+        return mcp_client.stream(method, url.replace("http://localhost:8001", ""), json=json)
+
+    monkeypatch.setattr(httpx, "stream", unexpected_stream)
+    result = cli_runner.invoke(main, [
+        "generate-slice", "-f", "Bill an order", "-d", "orders", "-s", "bill_order", "--stream",
+    ])
+    assert result.exception is None
+    assert "unrequested slice(s): elsewhere/pay_order" in result.output
+
+
+def test_generate_slice_lints_before_writing(cli_runner, multi_slice_project, monkeypatch):
+    """Test generate-slice writes nothing for a slice failing the checks unless --keep-invalid."""
+    import httpx
+    from fastapi.testclient import TestClient
+    from mcp_server.handlers import generate_skeleton
+    from mcp_server.main import app
+
+    render = generate_skeleton.render
+
+    def render_without_service(func_spec, domain, slice_name):
+        files = render(func_spec, domain, slice_name)
+        if slice_name == "broken":
+            del files["service.py"]
+        return files
+
+    monkeypatch.setattr(generate_skeleton, "render", render_without_service)
+    mcp_client = TestClient(app)
+
+    def post(url, json, timeout):
+        return mcp_client.post(url.replace("http://localhost:8001", ""), json=json)
+
+    def stream(method, url, json, timeout):
+        return mcp_client.stream(method, url.replace("http://localhost:8001", ""), json=json)
+
+    monkeypatch.setattr(httpx, "post", post)
+    monkeypatch.setattr(httpx, "stream", stream)
+    broken = ["generate-slice", "-f", "Refund an order", "-d", "orders", "-s", "broken"]
+
+    result = cli_runner.invoke(main, broken)
+    assert "nothing was written" in result.output
+    assert "Result: FAILED" in result.output
+    assert not Path("domains/orders").exists()
+
+    result = cli_runner.invoke(main, broken + ["--stream"])
+    assert "Not written (failed the ASA checks): domains/orders/slices/broken" in result.output
+    assert not Path("domains/orders").exists()
+
+    manifest = multi_slice_project / "slices.json"
+    manifest.write_text(json.dumps([
+        {"func_spec": "Refund an order", "domain": "orders", "slice_name": "broken"},
+        {"func_spec": "Return an order", "domain": "orders", "slice_name": "return_order"},
+    ]))
+    result = cli_runner.invoke(main, ["generate-slice", "--manifest", str(manifest)])
+    assert "❌ orders/broken:" in result.output
+    assert "Linted before writing" in result.output
+    assert sorted(p.name for p in Path("domains/orders/slices").iterdir()) == ["return_order"]
+
+    result = cli_runner.invoke(main, broken + ["--keep-invalid"])
+    assert "Linter found issues" in result.output
+    assert Path("domains/orders/slices/broken/handler.py").exists()
+
+
 def test_mcp_server_help(cli_runner):
     """Test asa mcp-server --help."""
     result = cli_runner.invoke(main, ["mcp-server", "--help"])
@@ -120,5 +754,49 @@ def test_mcp_server_start_help(cli_runner):
     assert "--port" in result.output
 
 
+def test_help_does_not_import_commands():
+    """asa --help and mcp-server --help load no linters."""
+    code = (
+        "import sys\n"
+        "from orchestrator.cli import main\n"
+        "for args in (['--help'], ['mcp-server', '--help']):\n"
+        "    try:\n"
+        "        main(args)\n"
+        "    except SystemExit:\n"
+        "        pass\n"
+        "print(sorted(m for m in sys.modules if m.startswith('orchestrator.asa_lints')))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        cwd=Path(__file__).resolve().parent.parent,
+    )
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_cli_import_time_budget():
+    """Importing orchestrator.cli stays within its import-time budget."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import orchestrator.cli"],
+        capture_output=True, text=True, check=True,
+        cwd=Path(__file__).resolve().parent.parent,
+    )
+    # Lines look like "import time: self [us] | cumulative | imported package"
+    cumulative_us = {}
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split(":", 1)[1].split("|")
+        cumulative_us[name.strip()] = int(cumulative)
+    own_us = cumulative_us["orchestrator.cli"] - cumulative_us.get("click", 0)
+    assert own_us < CLI_IMPORT_BUDGET_US
+
+
+def test_lazy_command_help_matches_command():
+    """The static short help shown by asa --help matches each command."""
+    from orchestrator.cli import LAZY_COMMANDS
+
+    ctx = click.Context(main)
+    for name, (_, short_help) in LAZY_COMMANDS.items():
+        assert main.get_command(ctx, name).get_short_help_str() == short_help
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,4 +1,6 @@
 """Tests for MCP Server"""
+import json
+import os
 import pytest
 from fastapi.testclient import TestClient
 from mcp_server.main import app
@@ -103,5 +105,267 @@ def test_generate_skeleton():
             shutil.rmtree(output_path)
 
 
+def test_generate_skeleton_atomic_write(tmp_path, monkeypatch):
+    """Test regeneration replaces a slice atomically and failures leave it untouched"""
+    from mcp_server.handlers import generate_skeleton
+
+    output_path = tmp_path / "slices" / "demo"
+    generate_skeleton.generate("Feature", "test", "demo", output_path)
+    (output_path / "notes.md").write_text("kept")
+    (output_path / "__init__.py").write_text('"""Custom"""')
+
+    # Only the spec mentions the feature; other files are unchanged and kept
+    created = generate_skeleton.generate("Changed feature", "test", "demo", output_path)
+    assert created == [str(output_path / "slice.spec.md")]
+    assert (output_path / "notes.md").read_text() == "kept"
+    assert (output_path / "__init__.py").read_text() == '"""Custom"""'
+    assert "Changed feature" in (output_path / "slice.spec.md").read_text()
+    assert [p.name for p in output_path.parent.iterdir()] == ["demo"]
+
+    # A failure half-way leaves the previous slice and no temp directory behind
+    writes = []
+    original_write = Path.write_text
+
+    def failing_write(self, data, *args, **kwargs):
+        writes.append(self)
+        if len(writes) == 3:
+            raise OSError("disk full")
+        return original_write(self, data, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "write_text", failing_write)
+    with pytest.raises(OSError):
+        generate_skeleton.generate("Broken feature", "other", "demo", output_path)
+    assert "Changed feature" in (output_path / "slice.spec.md").read_text()
+    assert [p.name for p in output_path.parent.iterdir()] == ["demo"]
+
+
+def test_regeneration_swaps_slice_in_one_exchange(tmp_path, monkeypatch):
+    """Test an existing slice is replaced by one atomic exchange where supported"""
+    from mcp_server import slice_io
+
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    (first / "name").write_text("first")
+    (second / "name").write_text("second")
+    if not slice_io.exchange_paths(first, second):
+        pytest.skip("no atomic rename exchange on this platform")
+    assert (first / "name").read_text() == "second"
+    assert (second / "name").read_text() == "first"
+
+    # The slice path never goes missing: it is not moved aside first
+    output_path = tmp_path / "demo"
+    slice_io.write_slice(output_path, {"a.py": "A = 1\n"})
+    replaced = []
+    original_replace = os.replace
+
+    def recording_replace(src, dst):
+        replaced.append(Path(src))
+        return original_replace(src, dst)
+
+    monkeypatch.setattr(slice_io.os, "replace", recording_replace)
+    assert slice_io.write_slice(output_path, {"a.py": "A = 2\n"}) == [str(output_path / "a.py")]
+    assert replaced == []
+    assert (output_path / "a.py").read_text() == "A = 2\n"
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".")] == []
+
+
+def test_regenerate_skips_unchanged_and_reuses_renders(tmp_path, monkeypatch):
+    """Test identical regeneration renders from the cache and rewrites nothing"""
+    import os
+    from mcp_server.handlers import generate_skeleton
+
+    cache = generate_skeleton.RenderCache(maxsize=2)
+    monkeypatch.setattr(generate_skeleton, "render_cache", cache)
+    output_path = tmp_path / "demo"
+
+    assert len(generate_skeleton.generate("Feature", "test", "demo", output_path)) == 9
+    stamp = 1_000_000_000
+    for file_path in output_path.rglob("*.py"):
+        os.utime(file_path, ns=(stamp, stamp))
+    inode = output_path.stat().st_ino
+
+    assert generate_skeleton.generate("Feature", "test", "demo", output_path) == []
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert output_path.stat().st_ino == inode
+    assert {f.stat().st_mtime_ns for f in output_path.rglob("*.py")} == {stamp}
+
+    # A template change is a new cache key; the LRU stays bounded
+    monkeypatch.setattr(generate_skeleton, "template_version", lambda name: "edited")
+    generate_skeleton.render("Feature", "test", "demo")
+    generate_skeleton.render("Other", "test", "demo")
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert len(cache) == 2
+
+
+def test_generate_skeleton_runs_off_event_loop(tmp_path, monkeypatch):
+    """Test the skeleton endpoint does not block the event loop while generating"""
+    import asyncio
+    import time
+    from mcp_server.handlers import generate_skeleton
+    from mcp_server.main import GenerateSkeletonRequest, generate_skeleton_endpoint
+
+    monkeypatch.setattr(generate_skeleton, "generate", lambda **kwargs: time.sleep(0.3) or [])
+    request = GenerateSkeletonRequest(
+        func_spec="Feature", domain="test", slice_name="demo", output_path=str(tmp_path)
+    )
+
+    async def run():
+        task = asyncio.create_task(generate_skeleton_endpoint(request))
+        await asyncio.sleep(0)
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        ticked = time.perf_counter() - started
+        await task
+        return ticked
+
+    assert asyncio.run(run()) < 0.2
+
+
+def test_generate_batch(tmp_path):
+    """Test generate-batch generates many slices and reports failures per slice"""
+    slices = [
+        {
+            "func_spec": f"Feature {index}",
+            "domain": "batch",
+            "slice_name": f"slice_{index}",
+            "output_path": str(tmp_path / f"slice_{index}")
+        }
+        for index in range(3)
+    ]
+    (tmp_path / "blocker").write_text("not a directory")
+    slices.append({**slices[0], "output_path": str(tmp_path / "blocker" / "slice")})
+
+    response = client.post("/mcp/generate-batch", json={"slices": slices})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is False
+    assert [r["success"] for r in data["results"]] == [True, True, True, False]
+    assert [r["slice_name"] for r in data["results"]] == ["slice_0", "slice_1", "slice_2", "slice_0"]
+    for index in range(3):
+        contract = json.loads((tmp_path / f"slice_{index}" / "slice.contract.json").read_text())
+        assert contract["slice_name"] == f"batch/slice_{index}"
+
+    response = client.post("/mcp/generate-batch", json={"slices": [slices[0], slices[0]]})
+    assert response.status_code == 400
+    assert client.post("/mcp/generate-batch", json={"slices": []}).status_code == 422
+
+
+def test_generate_checked_writes_only_passing_slices(tmp_path, monkeypatch):
+    """Test check lints rendered slices in memory and writes only those that pass"""
+    from mcp_server.handlers import generate_skeleton
+
+    render = generate_skeleton.render
+
+    def render_without_service(func_spec, domain, slice_name):
+        files = render(func_spec, domain, slice_name)
+        if slice_name == "broken":
+            del files["service.py"]
+        return files
+
+    monkeypatch.setattr(generate_skeleton, "render", render_without_service)
+    request = {"func_spec": "Feature", "domain": "checked", "check": True}
+
+    response = client.post("/mcp/generate-skeleton", json={
+        **request, "slice_name": "broken", "output_path": str(tmp_path / "broken")
+    })
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is False
+    assert data["created_files"] == []
+    assert data["lint_results"]["checks"]["structure"]["status"] == "FAILED"
+    assert not (tmp_path / "broken").exists()
+
+    response = client.post("/mcp/generate-skeleton", json={
+        **request, "slice_name": "good", "output_path": str(tmp_path / "good")
+    })
+    data = response.json()
+    assert data["success"] is True
+    assert data["lint_results"]["overall_status"] == "PASSED"
+    assert len(data["created_files"]) == 9
+
+    # Batch: checked slices are linted together; the failing one is not written
+    response = client.post("/mcp/generate-batch", json={"check": True, "slices": [
+        {**request, "slice_name": name, "output_path": str(tmp_path / "batch" / name)}
+        for name in ["good", "broken"]
+    ]})
+    results = response.json()["results"]
+    assert [r["success"] for r in results] == [True, False]
+    assert [r["lint_results"]["overall_status"] for r in results] == ["PASSED", "FAILED"]
+    assert [p.name for p in (tmp_path / "batch").iterdir()] == ["good"]
+
+
+@pytest.mark.parametrize("fmt", ["ndjson", "tar", "zip"])
+def test_generate_archive(fmt, monkeypatch):
+    """Test generate-archive streams rendered slices without writing on the server"""
+    from mcp_server.handlers import generate_skeleton
+    from mcp_server.slice_io import read_archive
+
+    render = generate_skeleton.render
+
+    def failing_render(func_spec, domain, slice_name):
+        if slice_name == "broken":
+            raise RuntimeError("render failed")
+        return render(func_spec, domain, slice_name)
+
+    monkeypatch.setattr(generate_skeleton, "render", failing_render)
+    slices = [
+        {"func_spec": "Feature", "domain": "archive", "slice_name": name}
+        for name in ("first", "broken", "second")
+    ]
+    response = client.post("/mcp/generate-archive", json={"slices": slices, "format": fmt})
+    assert response.status_code == 200
+
+    events = []
+    files, errors = read_archive(fmt, [response.content], lambda event, record: events.append(event))
+    assert list(files) == ["domains/archive/slices/first", "domains/archive/slices/second"]
+    assert files["domains/archive/slices/first"] == render("Feature", "archive", "first")
+    assert errors == [{"index": 1, "path": "domains/archive/slices/broken", "error": "render failed"}]
+    assert events.count("slice") == 2 and "error" in events
+    assert not Path("domains/archive").exists()
+
+
+def test_generate_archive_rejects_unsafe_paths():
+    """Test generate-archive refuses slice paths outside the client's tree"""
+    for path in ("../outside", "/etc/slice"):
+        response = client.post("/mcp/generate-archive", json={
+            "slices": [{"func_spec": "x", "domain": "a", "slice_name": "b", "path": path}]
+        })
+        assert response.status_code == 400
+
+
+def test_shared_template_environment(tmp_path):
+    """Test templates are compiled once, precompiled at startup and reloaded when edited."""
+    import os
+    from mcp_server import jinja_env
+
+    with TestClient(app):
+        assert jinja_env.precompile() == sorted(p.name for p in jinja_env.TEMPLATES_DIR.glob("*.j2"))
+    assert jinja_env.get_template("handler.py.j2") is jinja_env.get_template("handler.py.j2")
+
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    template = templates_dir / "greeting.j2"
+    template.write_text("Hello {{ name | to_camel_case }}")
+    env = jinja_env.create_environment(templates_dir, str(tmp_path / "bytecode"))
+    assert env.get_template("greeting.j2").render(name="login_demo") == "Hello LoginDemo"
+    assert list((tmp_path / "bytecode").iterdir())
+
+    template.write_text("Bye {{ name }}")
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert env.get_template("greeting.j2").render(name="x") == "Bye x"
+
+
+@pytest.mark.benchmark
+def test_template_benchmark_speedup():
+    """Guard the shared environment speedup over compiling templates per call."""
+    from benchmarks.bench_mcp_templates import run
+
+    result = run(requests=20)
+    assert result["speedup"] >= 5
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])